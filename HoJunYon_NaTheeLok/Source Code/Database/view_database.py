@@ -1,53 +1,120 @@
 import sqlite3
 import os
+import sys
+import atexit
+import operator
 import shutil
 from datetime import datetime
 
+_HOME = os.path.expanduser("~")
+_DB_PATH = os.path.join(_HOME, "pomodoro_data.db")
+_DESKTOP = os.path.join(_HOME, "Desktop")
+_VERBOSE = "--verbose" in sys.argv  # Also list the tables in view_all_data
+_RECENT_LIMIT = 20  # Sessions shown by view_all_data
+
+# Row formats for the view_all_data tables, bound once
+_USER_FMT = "{:<5} {:<15} {:<20} {:<10} {:<10}".format
+_LOG_FMT = "{:<5} {:<12} {:<12} {:<8} {:<8} {:<12} {:<8}".format
+_SEC_FMT = "{:<15} {:<15} {:<12} {:<10}".format
+
+# Split an ISO timestamp into (date, time) with one C-level call per row
+_SPLIT_ISO = operator.itemgetter(slice(0, 10), slice(11, 19))
+_SPLIT_ISO_HM = operator.itemgetter(slice(0, 10), slice(11, 16))
+
 def get_db_path():
     """Get the database file path"""
-    return os.path.join(os.path.expanduser("~"), "pomodoro_data.db")
+    return _DB_PATH
 
 def check_database_exists():
     """Check if database file exists"""
-    db_path = get_db_path()
-    if not os.path.exists(db_path):
+    if not os.path.exists(_DB_PATH):
         print("ERROR: Database file not found!")
-        print(f"Expected location: {db_path}")
+        print(f"Expected location: {_DB_PATH}")
         print("\nRun your main application first to create the database.")
         return False
     return True
 
-def view_all_data():
+_CONN = None  # Shared connection, reused across menu actions
+
+def _open_db():
+    """Open the database with WAL journaling and read-friendly PRAGMAs"""
+    # Autocommit mode so clear_database can issue its own BEGIN IMMEDIATE
+    conn = sqlite3.connect(_DB_PATH, isolation_level=None, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory map
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def get_conn():
+    """Return the shared connection, opening it on first use"""
+    global _CONN
+    if _CONN is None:
+        _CONN = _open_db()
+        ensure_indexes(_CONN)
+        atexit.register(_CONN.close)
+    return _CONN
+
+def ensure_indexes(conn):
+    """Create indexes for the viewer's filters and sorts, and planner stats if missing"""
+    try:
+        # idx_logs_user_start is dropped by the app; don't bring it back here
+        # The app's idx_logs_cover starts with the same columns, so this one is redundant
+        conn.execute("DROP INDEX IF EXISTS idx_logs_user_type_completed_date")
+        # The "latest sessions" listing reads the first rows of this in order;
+        # replaces a covering index that duplicated every log row
+        conn.execute("DROP INDEX IF EXISTS idx_logs_start_desc")
+        conn.execute("""CREATE INDEX IF NOT EXISTS idx_logs_start
+                        ON pomodoro_logs(start_time DESC)""")
+        # users.username is declared UNIQUE, so SQLite already keeps an index for it
+        # Gather planner statistics once; the app's close() keeps them fresh
+        if not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+            conn.execute("ANALYZE")
+        conn.commit()
+    except Exception as e:
+        print(f"Warning: could not create indexes: {e}")
+
+def view_all_data(verbose=_VERBOSE):
     """View all data in the database"""
     if not check_database_exists():
         return
         
-    db_path = get_db_path()
-    print(f"Reading database from: {db_path}")
+    print(f"Reading database from: {_DB_PATH}")
     print("=" * 80)
     
-    conn = sqlite3.connect(db_path)
+    conn = get_conn()
     cursor = conn.cursor()
     
     try:
         # Show database info
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        print(f"Tables in database: {[table[0] for table in tables]}")
-        print("=" * 80)
+        if verbose:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            tables = cursor.fetchall()
+            print(f"Tables in database: {[table[0] for table in tables]}")
+            print("=" * 80)
+        
+        # One pass over users feeds both the users table and the password check
+        cursor.execute("""SELECT id, username, created_at, total_sessions, total_minutes,
+                                 password_hash, password_salt FROM users""")
+        users = cursor.fetchall()
         
         # Show users table
         print("\nUSERS TABLE:")
         print("-" * 70)
-        cursor.execute("SELECT id, username, created_at, total_sessions, total_minutes FROM users")
-        users = cursor.fetchall()
         
         if users:
-            print(f"{'ID':<5} {'Username':<15} {'Created At':<20} {'Sessions':<10} {'Minutes':<10}")
+            print(_USER_FMT('ID', 'Username', 'Created At', 'Sessions', 'Minutes'))
             print("-" * 70)
+            lines = []
             for user in users:
-                created_date = user[2][:10] if user[2] else "Unknown"  # Show date only
-                print(f"{user[0]:<5} {user[1]:<15} {created_date:<20} {user[3]:<10} {user[4]:<10}")
+                created = user['created_at']
+                created_date = created[:10] if created else "Unknown"  # Show date only
+                lines.append(_USER_FMT(user['id'], user['username'], created_date,
+                                       user['total_sessions'], user['total_minutes']))
+            sys.stdout.write("\n".join(lines) + "\n")
                 
             print(f"\nTotal users: {len(users)}")
         else:
@@ -57,59 +124,54 @@ def view_all_data():
         print("\nPOMODORO SESSIONS TABLE:")
         print("-" * 90)
         cursor.execute("""SELECT id, username, start_time, duration_minutes, session_type, completed 
-                         FROM pomodoro_logs ORDER BY start_time DESC LIMIT 20""")
+                         FROM pomodoro_logs ORDER BY start_time DESC LIMIT ?""", (_RECENT_LIMIT,))
         logs = cursor.fetchall()
         
         if logs:
-            print(f"{'ID':<5} {'User':<12} {'Date':<12} {'Time':<8} {'Duration':<8} {'Type':<12} {'Status':<8}")
+            print(_LOG_FMT('ID', 'User', 'Date', 'Time', 'Duration', 'Type', 'Status'))
             print("-" * 90)
+            lines = []
             for log in logs:
-                # Parse datetime
-                try:
-                    dt = datetime.fromisoformat(log[2].replace('Z', '+00:00'))
-                    date_str = dt.strftime('%Y-%m-%d')
-                    time_str = dt.strftime('%H:%M:%S')
-                except:
-                    date_str = "Unknown"
-                    time_str = "Unknown"
+                # start_time is already ISO text (YYYY-MM-DD HH:MM:SS), so slice it
+                stamp = log['start_time'] or ''
+                if len(stamp) >= 19:
+                    date_str, time_str = _SPLIT_ISO(stamp)
+                else:
+                    date_str = time_str = "Unknown"
                 
-                status = "DONE" if log[5] else "SKIP"
-                print(f"{log[0]:<5} {log[1]:<12} {date_str:<12} {time_str:<8} {log[3]:<8} {log[4]:<12} {status:<8}")
+                status = "DONE" if log['completed'] else "SKIP"
+                lines.append(_LOG_FMT(log['id'], log['username'], date_str, time_str,
+                                      log['duration_minutes'], log['session_type'], status))
+            sys.stdout.write("\n".join(lines) + "\n")
                 
-            print(f"\nShowing last 20 sessions (total sessions in database)")
+            print(f"\nShowing last {_RECENT_LIMIT} sessions (total sessions in database)")
         else:
             print("No session logs found. Complete some Pomodoro sessions first.")
             
         # Show password security check
         print("\nPASSWORD SECURITY CHECK:")
         print("-" * 60)
-        cursor.execute("SELECT username, password_hash, password_salt FROM users")
-        security_data = cursor.fetchall()
-        
-        if security_data:
-            print(f"{'Username':<15} {'Hash Preview':<15} {'Salt Preview':<12} {'Status':<10}")
+        if users:
+            print(_SEC_FMT('Username', 'Hash Preview', 'Salt Preview', 'Status'))
             print("-" * 60)
-            for user_data in security_data:
-                username, hash_val, salt_val = user_data
-                hash_preview = hash_val[:10] + "..." if hash_val else "NONE"
-                salt_preview = salt_val[:8] + "..." if salt_val else "NONE"
+            for user in users:
+                username, hash_val, salt_val = user['username'], user['password_hash'], user['password_salt']
+                hash_preview = f"{hash_val[:10]}..." if hash_val else "NONE"
+                salt_preview = f"{salt_val[:8]}..." if salt_val else "NONE"
                 status = "SECURE" if hash_val and salt_val else "INSECURE"
-                print(f"{username:<15} {hash_preview:<15} {salt_preview:<12} {status:<10}")
+                print(_SEC_FMT(username, hash_preview, salt_preview, status))
         
         print("\nNOTE: Passwords are securely hashed and cannot be viewed in plain text.")
         
     except Exception as e:
         print(f"Error reading database: {e}")
-    finally:
-        conn.close()
 
 def show_user_stats():
     """Show detailed stats for a specific user"""
     if not check_database_exists():
         return
         
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_conn()
     cursor = conn.cursor()
     
     try:
@@ -141,20 +203,17 @@ def show_user_stats():
                     print(f"Total Minutes: {basic[1]}")
                     print(f"Total Hours: {basic[1]/60:.1f}")
                 
-                # Today's sessions
-                cursor.execute("""SELECT COUNT(*) FROM pomodoro_logs 
-                                 WHERE username = ? AND session_type = 'work' 
-                                 AND DATE(start_time) = DATE('now') AND completed = 1""", (username,))
-                today = cursor.fetchone()[0]
-                print(f"Today's Sessions: {today}")
-                
-                # This week's sessions
-                cursor.execute("""SELECT COUNT(*) FROM pomodoro_logs 
-                                 WHERE username = ? AND session_type = 'work' 
-                                 AND DATE(start_time) >= DATE('now', 'weekday 0', '-6 days') 
-                                 AND completed = 1""", (username,))
-                week = cursor.fetchone()[0]
-                print(f"This Week's Sessions: {week}")
+                # Today's and this week's sessions in one pass
+                cursor.execute("""SELECT
+                                     SUM(CASE WHEN start_time >= DATE('now') AND start_time < DATE('now', '+1 day')
+                                         THEN 1 ELSE 0 END),
+                                     SUM(CASE WHEN start_time >= DATE('now', 'weekday 0', '-6 days')
+                                         THEN 1 ELSE 0 END)
+                                 FROM pomodoro_logs
+                                 WHERE username = ? AND session_type = 'work' AND completed = 1""", (username,))
+                today, week = cursor.fetchone()
+                print(f"Today's Sessions: {today or 0}")
+                print(f"This Week's Sessions: {week or 0}")
                 
                 # Recent sessions
                 cursor.execute("""SELECT start_time, duration_minutes, session_type, completed 
@@ -168,13 +227,12 @@ def show_user_stats():
                     print(f"{'Date':<12} {'Time':<8} {'Duration':<8} {'Type':<12} {'Status':<8}")
                     print("-" * 50)
                     for session in recent:
-                        try:
-                            dt = datetime.fromisoformat(session[0].replace('Z', '+00:00'))
-                            date_str = dt.strftime('%Y-%m-%d')
-                            time_str = dt.strftime('%H:%M')
-                        except:
-                            date_str = "Unknown"
-                            time_str = "Unknown"
+                        # HH:MM never reaches a trailing 'Z', so one length check covers it
+                        ts = session[0] or ''
+                        if len(ts) < 16:
+                            date_str = time_str = "Unknown"
+                        else:
+                            date_str, time_str = _SPLIT_ISO_HM(ts)
                         
                         status = "DONE" if session[3] else "SKIP"
                         print(f"{date_str:<12} {time_str:<8} {session[1]:<8} {session[2]:<12} {status:<8}")
@@ -188,8 +246,6 @@ def show_user_stats():
             
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        conn.close()
 
 def clear_database():
     """Clear all data from database (be careful!)"""
@@ -201,78 +257,127 @@ def clear_database():
     confirm = input("Type 'DELETE' (all caps) to confirm: ")
     
     if confirm == "DELETE":
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
+        conn = get_conn()
         cursor = conn.cursor()
         
         try:
+            # One write transaction for both deletes. A bare DELETE with no WHERE
+            # clause (and no triggers) lets SQLite use its truncate optimization.
+            cursor.execute("BEGIN IMMEDIATE")
             cursor.execute("DELETE FROM pomodoro_logs")
             cursor.execute("DELETE FROM users")
-            conn.commit()
+            cursor.execute("COMMIT")
+            # Give the freed pages back to the filesystem
+            cursor.execute("VACUUM")
             print("SUCCESS: All data has been deleted from the database.")
         except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
             print(f"Error deleting data: {e}")
-        finally:
-            conn.close()
     else:
         print("Operation cancelled. No data was deleted.")
 
+def _export_sql_dump(conn):
+    """Write the whole database as SQL statements using SQLite's own dump"""
+    export_file = "database_export.sql"
+    with open(export_file, 'w', buffering=1 << 20) as f:
+        f.write("-- TAR UMT Student Assistant - Database Export\n")
+        f.write(f"-- Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        for stmt in conn.iterdump():
+            f.write(f"{stmt}\n")
+    return export_file
+
+def _export_backup(conn):
+    """Copy the database page by page into a standalone .db file"""
+    export_file = "database_export.db"
+    target = sqlite3.connect(export_file)
+    try:
+        conn.backup(target, pages=1024)
+    finally:
+        target.close()
+    return export_file
+
 def export_data():
-    """Export data to text file"""
+    """Export data to text file, SQL dump or database backup"""
     if not check_database_exists():
         return
+    
+    print("Export format:")
+    print("1. Readable text report (default)")
+    print("2. SQL dump")
+    print("3. Database backup copy")
+    mode = input("Choose format (1-3): ").strip() or "1"
         
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_conn()
     cursor = conn.cursor()
     
     try:
+        if mode == "2":
+            print(f"SUCCESS: Data exported to {_export_sql_dump(conn)}")
+            return
+        if mode == "3":
+            print(f"SUCCESS: Database backed up to {_export_backup(conn)}")
+            return
+        
         export_file = "database_export.txt"
-        with open(export_file, 'w') as f:
+        separator = "-" * 40 + "\n"
+        user_fmt = ("ID: {}\nUsername: {}\nCreated: {}\nTotal Sessions: {}\n"
+                    "Total Minutes: {}\n" + separator).format
+        log_fmt = ("Session ID: {}\nUser: {}\nStart Time: {}\nDuration: {} minutes\n"
+                   "Type: {}\nCompleted: {}\n" + separator).format
+        with open(export_file, 'w', buffering=1 << 20) as f:
             f.write("TAR UMT Student Assistant - Database Export\n")
             f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("=" * 60 + "\n\n")
             
-            # Export users
+            # Export users, one write per fetched batch
             f.write("USERS:\n")
-            f.write("-" * 40 + "\n")
+            f.write(separator)
             cursor.execute("SELECT id, username, created_at, total_sessions, total_minutes FROM users")
-            users = cursor.fetchall()
-            
-            for user in users:
-                f.write(f"ID: {user[0]}\n")
-                f.write(f"Username: {user[1]}\n")
-                f.write(f"Created: {user[2]}\n")
-                f.write(f"Total Sessions: {user[3]}\n")
-                f.write(f"Total Minutes: {user[4]}\n")
-                f.write("-" * 40 + "\n")
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                f.write("".join(user_fmt(*row) for row in rows))
             
             # Export sessions
             f.write("\nSESSIONS:\n")
-            f.write("-" * 40 + "\n")
+            f.write(separator)
             cursor.execute("SELECT * FROM pomodoro_logs ORDER BY start_time DESC")
-            logs = cursor.fetchall()
-            
-            for log in logs:
-                f.write(f"Session ID: {log[0]}\n")
-                f.write(f"User: {log[1]}\n")
-                f.write(f"Start Time: {log[2]}\n")
-                f.write(f"Duration: {log[3]} minutes\n")
-                f.write(f"Type: {log[4]}\n")
-                f.write(f"Completed: {'Yes' if log[5] else 'No'}\n")
-                f.write("-" * 40 + "\n")
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                f.write("".join(log_fmt(r[0], r[1], r[2], r[3], r[4], 'Yes' if r[5] else 'No')
+                                for r in rows))
         
         print(f"SUCCESS: Data exported to {export_file}")
         
     except Exception as e:
         print(f"Error exporting data: {e}")
-    finally:
-        conn.close()
+
+def _fast_copy(src, dst):
+    """Copy a file in kernel space when possible, else with a large buffer"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            size = os.path.getsize(src)
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=4 * 1024 * 1024)
+    shutil.copystat(src, dst)
 
 def copy_to_desktop():
     """Copy database and export files to desktop"""
     try:
-        desktop = os.path.join(os.path.expanduser("~"), "Desktop")
+        desktop = _DESKTOP
         
         if not os.path.exists(desktop):
             print("ERROR: Desktop folder not found!")
@@ -282,10 +387,15 @@ def copy_to_desktop():
         print("-" * 40)
         
         # Copy database file
-        db_path = get_db_path()
+        db_path = _DB_PATH
         if os.path.exists(db_path):
             dest_db = os.path.join(desktop, "pomodoro_data.db")
-            shutil.copy2(db_path, dest_db)
+            # Fold WAL pages back into the main file so the copy is self-contained
+            try:
+                get_conn().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception as e:
+                print(f"WARNING: Could not checkpoint database: {e}")
+            _fast_copy(db_path, dest_db)
             print(f"SUCCESS: Database copied to {dest_db}")
         else:
             print("WARNING: Database file not found, nothing to copy")
@@ -294,7 +404,7 @@ def copy_to_desktop():
         export_file = "database_export.txt"
         if os.path.exists(export_file):
             dest_export = os.path.join(desktop, export_file)
-            shutil.copy2(export_file, dest_export)
+            _fast_copy(export_file, dest_export)
             print(f"SUCCESS: Export file copied to {dest_export}")
         else:
             print("NOTE: No export file found. Use option 3 to create one first.")
@@ -310,7 +420,7 @@ def main():
         print("\n" + "="*60)
         print("DATABASE VIEWER - TAR UMT Student Assistant")
         print("="*60)
-        print(f"Database location: {get_db_path()}")
+        print(f"Database location: {_DB_PATH}")
         print(f"Export location: {os.getcwd()}")
         print("="*60)
         print("1. View all data")
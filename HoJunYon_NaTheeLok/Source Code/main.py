@@ -1,85 +1,135 @@
 import atexit  # For registering cleanup functions to run on exit
+from collections import namedtuple  # For the fixed main menu layout table
+from concurrent.futures import ThreadPoolExecutor  # For running database work off the Tk event thread
+import importlib.util  # For checking modules are installed without importing them
+import logging  # For debug diagnostics that cost nothing unless enabled
 import os  # For operating system interactions and file paths
 import sys  # For system-specific parameters and functions
+import threading  # For preloading the sub-apps in the background
 import tkinter as tk  # For GUI creation
+from tkinter import font as tkfont  # For shared named fonts
 from tkinter import messagebox  # For displaying message dialogs
 
 # Import shared configuration and components
 from shared.config import (APP_STATE, COLORS, FONTS, apply_theme_to_window,
-                           cleanup_application, toggle_theme)
+                           cleanup_application, screen_size, toggle_theme)
 from shared.ui_components import EnhancedButton
 
 # Import shared modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Debug output is off unless APP_DEBUG is set in the environment
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+if os.environ.get("APP_DEBUG"):
+    logging.basicConfig(level=logging.DEBUG, format="DEBUG: %(message)s")
+
+# How often the Tk thread checks whether a background database call finished
+_DB_POLL_MS = 50
+
+
+# Every main menu size, computed once per window in _compute_menu_sizes
+MenuLayout = namedtuple('MenuLayout', [
+    'page_pad_x', 'page_pad_y', 'header_pady', 'user_pady',
+    'logout_width', 'logout_height', 'welcome_size', 'title_size',
+    'title_pady', 'subtitle_size', 'subtitle_pady', 'content_pady',
+    'apps_pad_x', 'apps_pad_y', 'section_title_size', 'section_title_pady',
+    'card_pad_x', 'card_pad_y', 'grid_pad_x', 'grid_pad_y',
+    'card_header_size', 'card_header_pady', 'card_title_size', 'card_title_pady',
+    'desc_size', 'desc_wrap', 'desc_pady', 'launch_width',
+    'launch_height', 'launch_pady', 'footer_pady', 'theme_width',
+    'theme_height', 'theme_pady', 'info_pad_x', 'info_pad_y',
+    'info_pady', 'info_title_size', 'info_text_size', 'info_wrap',
+])
+
+
+def _focus_next(event):
+    """<Return> handler that moves focus along the window's tab order"""
+    event.widget.tk_focusNext().focus_set()
+    return "break"
+
+
+def _have(module_name):
+    """Return True if a module can be imported, without running its import"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
 
 def check_requirements():
-    """Check if all required dependencies are installed"""
-    requirements_met = True
+    """Check required dependencies and return the names of any that are missing
+
+    Runs on a worker thread, so it only prints; the caller shows any dialog.
+    """
     missing_packages = []
 
     print("Checking system requirements...")
 
     # Check tkinter
-    try:
-        import tkinter
+    if _have("tkinter"):
         print("✅ Tkinter GUI library available")
-    except ImportError:
+    else:
         print("❌ Tkinter not available")
-        requirements_met = False
         missing_packages.append("tkinter")
 
     # Check SQLite3
-    try:
-        import sqlite3
+    if _have("sqlite3"):
         print("✅ SQLite3 database available")
-    except ImportError:
+    else:
         print("❌ SQLite3 not available")
-        requirements_met = False
         missing_packages.append("sqlite3")
 
     # Check hashlib and secrets
-    try:
-        import hashlib
-        import secrets
+    if _have("hashlib") and _have("secrets"):
         print("✅ Security modules available (hashlib, secrets)")
-    except ImportError:
+    else:
         print("❌ Security modules not available")
-        requirements_met = False
         missing_packages.append("hashlib/secrets")
 
-    # Check optional dependencies
-    try:
-        import pygame
+    # Check optional dependencies (pygame is only probed, not initialised)
+    if _have("argon2"):
+        print("✅ argon2-cffi available (Argon2id password hashing)")
+    else:
+        print("○ argon2-cffi not available (passwords use PBKDF2-SHA256)")
+        print("  Optional: pip install argon2-cffi for stronger password hashing")
+
+    if _have("pygame"):
         print("✅ Pygame available (enhanced sound notifications)")
-    except ImportError:
+    else:
         print("○ Pygame not available (basic sound notifications only)")
         print("  Optional: pip install pygame for better sound")
 
-    # Handle missing requirements
-    if not requirements_met:
-        error_msg = f"Missing required packages: {', '.join(missing_packages)}"
-        # Create error message
-        try:
-            messagebox.showerror("Missing Dependencies",
-                                 f"Required packages are missing:\n\n" +
-                                 "\n".join([f"• {pkg}" for pkg in missing_packages]) +
-                                 "\n\nPlease install the missing packages and try again.")
-        except:
-            pass
-        return False
-
-    return True
+    return missing_packages
 
 
 class MainMenuApp:
     """Main menu application for TAR UMT Student Assistant"""
 
-    def __init__(self):
+    def __init__(self, requirements=None):
         self.root = None  # Main application window
+        self._requirements = requirements  # Future of the startup dependency check
         self.current_app = None  # Currently running sub-application
         self.current_user = None  # Currently logged in user
         self.db = None  # Database connection
+        self.main_canvas = None  # Scrolling canvas of the current page
+        self._scroll_bbox = None  # Last scrollregion applied to main_canvas
+        self._sr_after = None  # Pending debounced scrollregion update
+        self._wheel_id = None  # Tcl command name of the root <MouseWheel> binding
+        self._fonts = {}  # Named fonts shared by the widgets of the current root
+        self._apps_preloaded = False  # Sub-app modules imported in the background
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="db")  # One worker serializes DB calls
+        self._db_futures = set()  # Submitted DB calls whose result is still pending
+        self._themed_widgets = []  # (widget, {option: COLORS key}) for theme swaps
+        self._theme_buttons = []  # Dark/Light mode toggles on the built pages
+        self._window_size = (1000, 700)  # Size the root window was opened at
+        self._page_containers = {}  # Page name -> widget packed into root
+        self._page_canvases = {}  # Page name -> scrolling canvas (or None)
+        self._welcome_label = None  # Main menu greeting, updated per user
+        self._confirm_dlg = None  # Reusable Yes/No dialog, built on first use
+        self._confirm_label = None
+        self._confirm_var = None
 
         # Initialize database connection
         try:
@@ -95,16 +145,12 @@ class MainMenuApp:
         self.show_login_page()
 
     def center_window_perfectly(self, window, width, height):
-        """Center the window on the screen with better accuracy"""
-        # Force window to update so we get accurate screen dimensions
-        window.update_idletasks()
+        """Center the window on the screen with a single geometry update"""
+        # Screen dimensions don't depend on pending layout, so no idle flush
+        screen_width, screen_height = screen_size(window)
 
-        # Get ACTUAL screen dimensions
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
-
-        print(f"DEBUG: Screen size: {screen_width}x{screen_height}")
-        print(f"DEBUG: Window size: {width}x{height}")
+        _log.debug("Screen size: %sx%s", screen_width, screen_height)
+        _log.debug("Window size: %sx%s", width, height)
 
         # Calculate EXACT center position
         x = (screen_width - width) // 2
@@ -113,57 +159,166 @@ class MainMenuApp:
         # Adjust for taskbar (move slightly up)
         y = max(0, y - 30)
 
-        print(f"DEBUG: Calculated position: x={x}, y={y}")
-
-        # Set window geometry with EXACT position
         geometry_string = f"{width}x{height}+{x}+{y}"
-        print(f"DEBUG: Setting geometry: {geometry_string}")
-
+        _log.debug("Setting geometry: %s", geometry_string)
         window.geometry(geometry_string)
 
-        # Additional centering steps
-        window.update_idletasks()
-
-        # Force window to the calculated position
-        window.wm_geometry(geometry_string)
-
         # Bring window to front and focus
         window.lift()
         window.focus_force()
 
-        # Additional verification
-        window.after(100, lambda: self._verify_centering(window, x, y))
+    def _font(self, size, weight='normal', slant='roman'):
+        """Return a shared Segoe UI font so Tk measures each variant only once"""
+        key = (size, weight, slant)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(root=self.root, family="Segoe UI", size=size,
+                               weight=weight, slant=slant)
+            self._fonts[key] = font
+        return font
+
+    def _themed(self, widget, **color_keys):
+        """Remember which palette keys a widget uses so a theme flip can recolor it"""
+        self._themed_widgets.append((widget, color_keys))
+        return widget
+
+    def _apply_theme_in_place(self):
+        """Recolor the current page from COLORS without rebuilding it"""
+        apply_theme_to_window(self.root)
+        for widget, color_keys in self._themed_widgets:
+            if not widget.winfo_exists():
+                continue
+            if isinstance(widget, EnhancedButton):
+                widget.apply_theme()
+            else:
+                widget.configure(**{option: COLORS[key]
+                                    for option, key in color_keys.items()})
+        for theme_btn in self._theme_buttons:
+            if theme_btn.winfo_exists():
+                theme_btn.config(
+                    text="🌙 Dark Mode" if not APP_STATE['dark_mode'] else "☀️ Light Mode")
+
+    def _reveal_window(self, window):
+        """Run one layout pass for a fully built window, then show it"""
+        window.update_idletasks()
+        window.deiconify()
+        window.lift()
+        window.focus_force()
 
-    def _verify_centering(self, window, expected_x, expected_y):
-        """Verify and correct window position if needed"""
-        try:
-            actual_x = window.winfo_x()
-            actual_y = window.winfo_y()
-            print(f"DEBUG: Expected position: ({expected_x}, {expected_y})")
-            print(f"DEBUG: Actual position: ({actual_x}, {actual_y})")
-
-            # If position is significantly off, correct it
-            if abs(actual_x - expected_x) > 50 or abs(actual_y - expected_y) > 50:
-                print("DEBUG: Position correction needed")
-                geometry_string = f"+{expected_x}+{expected_y}"
-                window.geometry(geometry_string)
-        except:
-            pass  # Ignore errors in verification
+    def _ensure_root(self):
+        """Create the one application window if it does not exist yet"""
+        if self.root is not None:
+            return False
+
+        self.root = tk.Tk()
+        self.root.withdraw()  # Stay hidden until the first page is built
+        self._fonts = {}  # Fonts belong to one Tk interpreter
+        self._themed_widgets = []
+        self._theme_buttons = []
+        self._page_containers = {}
+        self._page_canvases = {}
+        self._welcome_label = None
+        self._confirm_dlg = None  # Belonged to the previous root
+        self.main_canvas = None
+        self._sr_after = None  # Any pending id died with the previous root
+        apply_theme_to_window(self.root)
+        self.root.resizable(True, True)
+        self.root.minsize(1000, 650)
+
+        # Get optimal size and center it properly
+        self._window_size = self.get_optimal_window_size(1000, 700)
+        self.center_window_perfectly(self.root, *self._window_size)
+
+        # Setup exit protocol
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
+
+        # Mouse wheel scrolling support (bound to this window only; every
+        # widget in it carries the toplevel in its bindtags)
+        self._wheel_id = self.root.bind("<MouseWheel>", self._on_mousewheel)
+        return True
+
+    def _teardown_root(self):
+        """Destroy the session window without leaving callbacks pointing at it"""
+        if self.root is None:
+            return
+        if self._sr_after is not None:
+            self.root.after_cancel(self._sr_after)
+            self._sr_after = None
+        if self._wheel_id is not None:
+            self.root.unbind("<MouseWheel>", self._wheel_id)
+            self._wheel_id = None
+        self.main_canvas = None
+        self._welcome_label = None
+        if self.root.winfo_exists():
+            self.root.destroy()
+        self.root = None
+
+    def _mount_page(self, name, page, window_width, window_height, x_offset):
+        """Register a built page as-is, or embedded in a scrolling canvas if it overflows"""
+        page.update_idletasks()
+        if page.winfo_reqheight() <= window_height:
+            self._page_containers[name] = page
+            self._page_canvases[name] = None
+            return
+
+        # The page is a child of root, which Tk allows as a canvas window item
+        # as long as it is an ancestor of the canvas
+        holder = self._themed(tk.Frame(self.root, bg=COLORS['background']), bg='background')
+        main_canvas = self._themed(tk.Canvas(holder, bg=COLORS['background']), bg='background')
+        main_scrollbar = tk.Scrollbar(
+            holder, orient="vertical", command=main_canvas.yview)
+        main_canvas.configure(yscrollcommand=main_scrollbar.set)
+        main_canvas.create_window(
+            (window_width // 2 + x_offset, 0), window=page, anchor="n")
+        page.lift(holder)  # Created before the holder, so raise it above
+
+        page.bind("<Configure>", self._on_scroll_frame_configure)
+
+        main_canvas.pack(side="left", fill="both", expand=True)
+        main_scrollbar.pack(side="right", fill="y")
+
+        self._page_containers[name] = holder
+        self._page_canvases[name] = main_canvas
+
+    def _show_page(self, name):
+        """Hide whichever page is showing and pack the named one in its place"""
+        for other, container in self._page_containers.items():
+            if other != name:
+                container.pack_forget()  # Embedded pages unmap with their canvas
+        self._page_containers[name].pack(expand=True, fill='both')
+        self.main_canvas = self._page_canvases[name]
+        self._scroll_bbox = None
+
+    def _on_mousewheel(self, event):
+        """Scroll the page canvas by whole wheel notches"""
+        if self.main_canvas is not None:
+            self.main_canvas.yview_scroll(-event.delta // 120, "units")
+
+    def _on_scroll_frame_configure(self, event):
+        """Coalesce a burst of <Configure> events into one scrollregion update"""
+        if self._sr_after is not None:
+            self.root.after_cancel(self._sr_after)
+        self._sr_after = self.root.after(50, self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Update the scrollregion only when the content bounds actually change"""
+        self._sr_after = None
+        if self.main_canvas is None or not self.main_canvas.winfo_exists():
+            return
+        bbox = self.main_canvas.bbox("all")
+        if bbox != self._scroll_bbox:
+            self._scroll_bbox = bbox
+            self.main_canvas.configure(scrollregion=bbox)
 
     def get_optimal_window_size(self, min_width=1000, min_height=700):
         """Get optimal window size for better desktop experience"""
-        # Create a temporary window to get screen size if root doesn't exist yet
+        # Callers create self.root first, so read the screen size from it
+        # instead of spinning up a throwaway Tk interpreter
         if not self.root or not self.root.winfo_exists():
-            temp_root = tk.Tk()
-            temp_root.withdraw()  # Hide it
-            screen_width = temp_root.winfo_screenwidth()
-            screen_height = temp_root.winfo_screenheight()
-            temp_root.destroy()
-        else:
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
+            return min_width, min_height
+        screen_width, screen_height = screen_size(self.root)
 
-        print(f"DEBUG: Screen dimensions: {screen_width}x{screen_height}")
+        _log.debug("Screen dimensions: %sx%s", screen_width, screen_height)
 
         # Calculate reasonable window size (not too big, not too small)
         if screen_width >= 1920:
@@ -176,66 +331,35 @@ class MainMenuApp:
         optimal_width = max(min_width, int(screen_width * width_percent))
         optimal_height = max(min_height, int(screen_height * height_percent))
 
-        print(f"DEBUG: Optimal window size: {optimal_width}x{optimal_height}")
+        _log.debug("Optimal window size: %sx%s", optimal_width, optimal_height)
 
         return optimal_width, optimal_height
 
     def show_login_page(self):
         """Display the login page for user authentication"""
         try:
-            print("DEBUG: Creating login page...")
+            _log.debug("Showing login page...")
 
-            # Clean up any existing window safely
-            if self.root and self.root.winfo_exists():
-                self.root.destroy()
-            self.root = None
-
-            self.root = tk.Tk()
+            # One root window is kept for the whole session; pages are
+            # built once and then only swapped in and out
+            created = self._ensure_root()
             self.root.title("TAR UMT Student Assistant - Login")
-            apply_theme_to_window(self.root)
-            self.root.resizable(True, True)
-            self.root.minsize(1000, 700)
-
-            # Get optimal size and center it properly
-            window_width, window_height = self.get_optimal_window_size(
-                1000, 700)
-
-            # FIXED: Use the corrected centering function
-            self.center_window_perfectly(
-                self.root, window_width, window_height)
-
-            # Create scrollable container for login page
-            main_canvas = tk.Canvas(self.root, bg=COLORS['background'])
-            main_scrollbar = tk.Scrollbar(
-                self.root, orient="vertical", command=main_canvas.yview)
-            scrollable_frame = tk.Frame(main_canvas, bg=COLORS['background'])
 
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: main_canvas.configure(
-                    scrollregion=main_canvas.bbox("all"))
-            )
-
-            main_canvas.create_window(
-                (window_width // 2+30, 0), window=scrollable_frame, anchor="n")
-            main_canvas.configure(yscrollcommand=main_scrollbar.set)
-
-            # Pack canvas and scrollbar
-            main_canvas.pack(side="left", fill="both", expand=True)
-            main_scrollbar.pack(side="right", fill="y")
-
-            # Mouse wheel scrolling support
-            def _on_mousewheel(event):
-                main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            if 'login' in self._page_containers:
+                self.username_entry.delete(0, 'end')
+                self.password_entry.delete(0, 'end')
+                self._show_page('login')
+                self._reveal_window(self.root)
+                self.username_entry.focus()
+                return
 
-            main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            window_width, window_height = self._window_size
 
             # Padding to fill the window
             padding_x = max(80, int(window_width * 0.08))
             padding_y = max(60, int(window_height * 0.08))
-            main_frame = tk.Frame(scrollable_frame, bg=COLORS['background'],
-                                  padx=padding_x, pady=padding_y)
-            main_frame.pack(expand=True, fill='both')
+            main_frame = self._themed(tk.Frame(self.root, bg=COLORS['background'],
+                                               padx=padding_x, pady=padding_y), bg='background')
 
             # Header section
             self._create_login_header(main_frame, window_width, window_height)
@@ -246,42 +370,75 @@ class MainMenuApp:
             # Footer section
             self._create_login_footer(main_frame, window_width, window_height)
 
-            # Setup exit protocol
-            self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
+            # Only wrap the page in a scrolling canvas if it does not fit
+            self._mount_page('login', main_frame, window_width, window_height, 30)
+            self._show_page('login')
+
+            self._reveal_window(self.root)
 
             # Focus on username entry
-            if hasattr(self, 'username_entry'):
-                self.username_entry.focus()
+            self.username_entry.focus()
 
-            print("DEBUG: Login page created, starting mainloop...")
-            self.root.mainloop()
+            if created:
+                # Input is only accepted once the dependency check is in
+                if not self._requirements_met():
+                    return
+                _log.debug("Login page created, starting mainloop...")
+                self.root.mainloop()
 
         except Exception as e:
             print(f"ERROR creating login page: {e}")
             messagebox.showerror(
                 "Error", f"Failed to create login page: {str(e)}")
 
+    def _requirements_met(self):
+        """Wait for the background check_requirements() started by main()"""
+        if self._requirements is None:
+            return True
+        future, self._requirements = self._requirements, None
+        try:
+            missing_packages = future.result(timeout=10)
+        except Exception as e:
+            print(f"ERROR checking requirements: {e}")
+            missing_packages = ["(the requirements check itself failed; see the console)"]
+
+        if not missing_packages:
+            print("\n✅ ALL REQUIREMENTS MET!")
+            print("=" * 80)
+            return True
+
+        print("\nCRITICAL: Missing required dependencies!")
+        print(f"Missing required packages: {', '.join(missing_packages)}")
+        print("Please install missing packages and try again.")
+        # Back on the main thread, so this is the one place that talks to Tk
+        messagebox.showerror("Missing Dependencies",
+                             "Required packages are missing:\n\n" +
+                             "\n".join([f"• {pkg}" for pkg in missing_packages]) +
+                             "\n\nPlease install the missing packages and try again.")
+        self._teardown_root()
+        return False
+
     def _create_login_header(self, parent, window_width, window_height):
         """Create login page header"""
-        header_frame = tk.Frame(parent, bg=COLORS['background'])
+        header_frame = self._themed(tk.Frame(parent, bg=COLORS['background']), bg='background')
         header_frame.pack(fill='x', pady=(
             0, max(20, int(window_height * 0.03))))
 
         logo_size = min(60, max(40, int(window_width * 0.04)))
-        logo_label = tk.Label(header_frame, text="📚", font=("Segoe UI", logo_size),
-                              bg=COLORS['background'], fg=COLORS['primary'])
+        logo_label = self._themed(tk.Label(header_frame, text="📚", font=self._font(logo_size),
+                                           bg=COLORS['background'], fg=COLORS['primary']), bg='background', fg='primary')
         logo_label.pack(pady=max(10, int(window_height * 0.015)))
 
         title_size = min(32, max(20, int(window_width * 0.025)))
-        title_label = tk.Label(header_frame, text="TAR UMT Student Assistant",
-                               font=("Segoe UI", title_size, "bold"),
-                               fg=COLORS['primary'], bg=COLORS['background'])
+        title_label = self._themed(tk.Label(header_frame, text="TAR UMT Student Assistant",
+                                            font=self._font(title_size, 'bold'),
+                                            fg=COLORS['primary'], bg=COLORS['background']), bg='background', fg='primary')
         title_label.pack(pady=max(8, int(window_height * 0.01)))
 
         subtitle_size = min(16, max(11, int(window_width * 0.012)))
-        subtitle_label = tk.Label(header_frame, text="Please sign in to continue",
-                                  font=("Segoe UI", subtitle_size),
-                                  fg=COLORS['text_secondary'], bg=COLORS['background'])
+        subtitle_label = self._themed(tk.Label(header_frame, text="Please sign in to continue",
+                                               font=self._font(subtitle_size),
+                                               fg=COLORS['text_secondary'], bg=COLORS['background']), bg='background', fg='text_secondary')
         subtitle_label.pack(pady=max(5, int(window_height * 0.008)))
 
     def _create_login_form(self, parent, window_width, window_height):
@@ -289,91 +446,92 @@ class MainMenuApp:
         form_padding_x = max(50, int(window_width * 0.08))
         form_padding_y = max(25, int(window_height * 0.035))
 
-        form_frame = tk.Frame(parent, bg=COLORS['white'], relief='raised',
-                              bd=2, padx=form_padding_x, pady=form_padding_y)
+        form_frame = self._themed(tk.Frame(parent, bg=COLORS['white'], relief='raised',
+                                           bd=2, padx=form_padding_x, pady=form_padding_y), bg='white')
         form_frame.pack(fill='x', pady=max(15, int(window_height * 0.02)))
 
         title_size = min(20, max(16, int(window_width * 0.016)))
-        tk.Label(form_frame, text="Sign In", font=("Segoe UI", title_size, "bold"),
-                 bg=COLORS['white'], fg=COLORS['text']).pack(pady=(0, max(20, int(window_height * 0.03))))
+        self._themed(tk.Label(form_frame, text="Sign In", font=self._font(title_size, 'bold'),
+                              bg=COLORS['white'], fg=COLORS['text']), bg='white', fg='text').pack(pady=(0, max(20, int(window_height * 0.03))))
 
-        username_frame = tk.Frame(form_frame, bg=COLORS['white'])
+        username_frame = self._themed(tk.Frame(form_frame, bg=COLORS['white']), bg='white')
         username_frame.pack(fill='x', pady=max(10, int(window_height * 0.015)))
 
         label_size = min(14, max(11, int(window_width * 0.01)))
 
-        tk.Label(username_frame, text="Username:", font=("Segoe UI", label_size),
-                 bg=COLORS['white'], fg=COLORS['text']).pack(anchor='w', pady=(0, 5))
+        self._themed(tk.Label(username_frame, text="Username:", font=self._font(label_size),
+                              bg=COLORS['white'], fg=COLORS['text']), bg='white', fg='text').pack(anchor='w', pady=(0, 5))
 
         entry_font_size = min(12, max(10, int(window_width * 0.009)))
         entry_padding = max(8, int(window_height * 0.01))
-        self.username_entry = tk.Entry(username_frame, font=("Segoe UI", entry_font_size),
-                                       relief='solid', bd=1, bg=COLORS['light'],
-                                       fg=COLORS['text'])
+        self.username_entry = self._themed(tk.Entry(username_frame, font=self._font(entry_font_size),
+                                                    relief='solid', bd=1, bg=COLORS['light'],
+                                                    fg=COLORS['text']), bg='light', fg='text')
         self.username_entry.pack(fill='x', ipady=entry_padding)
 
-        password_frame = tk.Frame(form_frame, bg=COLORS['white'])
+        password_frame = self._themed(tk.Frame(form_frame, bg=COLORS['white']), bg='white')
         password_frame.pack(fill='x', pady=max(10, int(window_height * 0.015)))
 
-        tk.Label(password_frame, text="Password:", font=("Segoe UI", label_size),
-                 bg=COLORS['white'], fg=COLORS['text']).pack(anchor='w', pady=(0, 5))
+        self._themed(tk.Label(password_frame, text="Password:", font=self._font(label_size),
+                              bg=COLORS['white'], fg=COLORS['text']), bg='white', fg='text').pack(anchor='w', pady=(0, 5))
 
-        self.password_entry = tk.Entry(password_frame, show="*", font=("Segoe UI", entry_font_size),
-                                       relief='solid', bd=1, bg=COLORS['light'],
-                                       fg=COLORS['text'])
+        self.password_entry = self._themed(tk.Entry(password_frame, show="*", font=self._font(entry_font_size),
+                                                    relief='solid', bd=1, bg=COLORS['light'],
+                                                    fg=COLORS['text']), bg='light', fg='text')
         self.password_entry.pack(fill='x', ipady=entry_padding)
 
-        login_btn_frame = tk.Frame(form_frame, bg=COLORS['white'])
+        login_btn_frame = self._themed(tk.Frame(form_frame, bg=COLORS['white']), bg='white')
         login_btn_frame.pack(pady=max(20, int(window_height * 0.03)))
 
         button_width = max(25, min(35, int(window_width * 0.03)))
         button_height = max(2, min(3, int(window_height * 0.005)))
-        EnhancedButton(login_btn_frame, text="Sign In",
-                       command=self.attempt_login, button_type='primary',
-                       width=button_width, height=button_height).pack(pady=5)
+        self._themed(EnhancedButton(login_btn_frame, text="Sign In",
+                                    command=self.attempt_login, button_type='primary',
+                                    width=button_width, height=button_height)).pack(pady=5)
 
-        register_frame = tk.Frame(form_frame, bg=COLORS['white'])
+        register_frame = self._themed(tk.Frame(form_frame, bg=COLORS['white']), bg='white')
         register_frame.pack(pady=max(15, int(window_height * 0.02)))
 
         reg_label_size = min(11, max(9, int(window_width * 0.008)))
-        tk.Label(register_frame, text="Don't have an account?", font=("Segoe UI", reg_label_size),
-                 bg=COLORS['white'], fg=COLORS['text_secondary']).pack()
+        self._themed(tk.Label(register_frame, text="Don't have an account?", font=self._font(reg_label_size),
+                              bg=COLORS['white'], fg=COLORS['text_secondary']), bg='white', fg='text_secondary').pack()
 
         reg_button_width = max(22, min(30, int(window_width * 0.025)))
         reg_button_height = max(1, min(2, int(window_height * 0.003)))
-        EnhancedButton(register_frame, text="Create New Account",
-                       command=self.show_register_window, button_type='success',
-                       width=reg_button_width, height=reg_button_height).pack(pady=8)
+        self._themed(EnhancedButton(register_frame, text="Create New Account",
+                                    command=self.show_register_window, button_type='success',
+                                    width=reg_button_width, height=reg_button_height)).pack(pady=8)
 
         self.username_entry.bind('<Return>', lambda e: self.attempt_login())
         self.password_entry.bind('<Return>', lambda e: self.attempt_login())
 
     def _create_login_footer(self, parent, window_width, window_height):
         """Create login page footer"""
-        footer_frame = tk.Frame(parent, bg=COLORS['background'])
+        footer_frame = self._themed(tk.Frame(parent, bg=COLORS['background']), bg='background')
         footer_frame.pack(fill='x', pady=max(30, int(window_height * 0.04)))
 
         theme_button_width = max(20, min(30, int(window_width * 0.02)))
         theme_button_height = max(2, min(3, int(window_height * 0.004)))
         theme_text = "🌙 Dark Mode" if not APP_STATE['dark_mode'] else "☀️ Light Mode"
-        theme_btn = EnhancedButton(footer_frame, text=theme_text,
-                                   command=self.toggle_theme, button_type='info',
-                                   width=theme_button_width, height=theme_button_height)
+        theme_btn = self._themed(EnhancedButton(footer_frame, text=theme_text,
+                                                command=self.toggle_theme, button_type='info',
+                                                width=theme_button_width, height=theme_button_height))
         theme_btn.pack(pady=20)
+        self._theme_buttons.append(theme_btn)
 
         info_padding = max(40, int(window_width * 0.03))
-        info_frame = tk.Frame(parent, bg=COLORS['info'], relief='raised',
-                              bd=2, padx=info_padding, pady=max(25, int(window_height * 0.03)))
+        info_frame = self._themed(tk.Frame(parent, bg=COLORS['info'], relief='raised',
+                                           bd=2, padx=info_padding, pady=max(25, int(window_height * 0.03))), bg='info')
         info_frame.pack(fill='x', pady=20)
 
         info_title_size = min(16, max(11, int(window_width * 0.012)))
-        tk.Label(info_frame, text="TAR UMT Student Productivity Suite",
-                 font=("Segoe UI", info_title_size, "bold"),
-                 bg=COLORS['info'], fg=COLORS['white']).pack(pady=5)
+        self._themed(tk.Label(info_frame, text="TAR UMT Student Productivity Suite",
+                              font=self._font(info_title_size, 'bold'),
+                              bg=COLORS['info'], fg=COLORS['white']), bg='info', fg='white').pack(pady=5)
 
         info_text_size = min(12, max(9, int(window_width * 0.009)))
-        tk.Label(info_frame, text="Developed by HO JUN YON and NA THEE LOK",
-                 font=("Segoe UI", info_text_size), bg=COLORS['info'], fg=COLORS['white']).pack(pady=5)
+        self._themed(tk.Label(info_frame, text="Developed by HO JUN YON and NA THEE LOK",
+                              font=self._font(info_text_size), bg=COLORS['info'], fg=COLORS['white']), bg='info', fg='white').pack(pady=5)
 
     def attempt_login(self):
         """Attempt to authenticate user login"""
@@ -387,31 +545,108 @@ class MainMenuApp:
                 return
 
             # Show loading feedback
-            self.username_entry.config(state='disabled')
-            self.password_entry.config(state='disabled')
+            self._set_entries_state('disabled', self.username_entry, self.password_entry)
+
+            # Authenticate on the DB worker so the window keeps repainting
+            self._submit_db(self.root, self.db.authenticate_user, (username, password),
+                            lambda success, message: self._finish_login(
+                                username, success, message),
+                            "Login failed")
+
+        except Exception as e:
+            # error handling
+            self._set_entries_state('normal', self.username_entry, self.password_entry)
+            messagebox.showerror("Error", f"Login failed: {str(e)}")
+
+    def _set_entries_state(self, state, *entries):
+        """Switch several entries to one state in a single Tcl round-trip"""
+        entries[0].tk.eval("\n".join(
+            f"{entry} configure -state {state}" for entry in entries))
+
+    def _submit_db(self, widget, func, args, on_done, error_prefix):
+        """Run a (success, message) database call on the DB worker, then on_done on Tk"""
+        future = self._db_executor.submit(func, *args)
+        self._db_futures.add(future)
+
+        def poll():
+            # Runs on the Tk thread via after(); the worker never touches Tk
+            try:
+                alive = bool(widget.winfo_exists())
+            except tk.TclError:
+                alive = False
+            if not alive:
+                self._db_futures.discard(future)
+                future.cancel()  # Window closed; drop the call if it hasn't started
+                return
+            if not future.done():
+                widget.after(_DB_POLL_MS, poll)
+                return
 
-            # Authenticate with database
-            success, message = self.db.authenticate_user(username, password)
+            self._db_futures.discard(future)
+            if future.cancelled():
+                return
+            try:
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, f"{error_prefix}: {str(e)}"
+            on_done(success, message)
+
+        widget.after(_DB_POLL_MS, poll)
+        return future
+
+    def _cancel_db_calls(self):
+        """Drop queued database calls that have not started yet"""
+        for future in list(self._db_futures):
+            future.cancel()
+
+    def _finish_login(self, username, success, message):
+        """Apply a login result on the Tk event thread"""
+        try:
+            # Re-enable entries
+            self._set_entries_state('normal', self.username_entry, self.password_entry)
 
             if success:
                 self.current_user = username
-                messagebox.showinfo(
-                    "Welcome!", f"Login successful!\nWelcome back, {username}!")
-                self.show_main_menu()
+                self._start_app_preload()
+                self.show_main_menu()  # The header already greets the user
+                self._show_toast(f"Login successful! Welcome back, {username}!")
             else:
                 messagebox.showerror("Login Failed", message)
                 self.password_entry.delete(0, 'end')  # Clear password field
 
-            # Re-enable entries
-            self.username_entry.config(state='normal')
-            self.password_entry.config(state='normal')
-
         except Exception as e:
-            # error handling
-            self.username_entry.config(state='normal')
-            self.password_entry.config(state='normal')
             messagebox.showerror("Error", f"Login failed: {str(e)}")
 
+    def _show_toast(self, text, duration=1500):
+        """Show a short non-modal notice over the top of the window"""
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)  # No title bar, and no focus grab
+        tk.Label(toast, text=text, font=self._font(12, 'bold'),
+                 bg=COLORS['success'], fg=COLORS['white'],
+                 padx=20, pady=10).pack()
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - toast.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + 20
+        toast.geometry(f"+{x}+{y}")
+        toast.after(duration, toast.destroy)
+
+    def _start_app_preload(self):
+        """Import the sub-app modules in the background once per session"""
+        if self._apps_preloaded:
+            return
+        self._apps_preloaded = True
+        threading.Thread(target=self._preload_apps, daemon=True).start()
+
+    def _preload_apps(self):
+        """Import pomodoro_app and reminder_app so launching them is instant"""
+        try:
+            import pomodoro_app  # Cached in sys.modules for open_pomodoro_app
+            import reminder_app  # Cached in sys.modules for open_reminder_app
+            pomodoro_app.init_sound()  # Audio device setup off the UI thread
+        except Exception as e:
+            # The click handlers import again and report the error properly
+            print(f"Background app preload failed: {e}")
+
     def show_register_window(self):
         """Show registration window for new users"""
         try:
@@ -419,7 +654,7 @@ class MainMenuApp:
             register_window.title("Create New Account")
             register_window.configure(bg=COLORS['background'])
             register_window.resizable(True, True)
-            register_window.grab_set()
+            register_window.withdraw()  # Build the form off-screen
 
             main_width = self.root.winfo_width()
             main_height = self.root.winfo_height()
@@ -436,7 +671,7 @@ class MainMenuApp:
 
             title_size = min(24, max(16, int(window_width * 0.04)))
             title_label = tk.Label(main_frame, text="Create Your Account",
-                                   font=("Segoe UI", title_size, "bold"), fg=COLORS['success'],
+                                   font=self._font(title_size, 'bold'), fg=COLORS['success'],
                                    bg=COLORS['background'])
             title_label.pack(pady=max(25, int(window_height * 0.04)))
 
@@ -450,23 +685,23 @@ class MainMenuApp:
             entry_padding = max(12, int(window_height * 0.02))
 
             # Username field
-            tk.Label(form_frame, text="Choose Username:", font=("Segoe UI", label_size),
+            tk.Label(form_frame, text="Choose Username:", font=self._font(label_size),
                      bg=COLORS['white'], fg=COLORS['text']).pack(anchor='w', pady=(15, 8))
-            username_entry = tk.Entry(form_frame, font=("Segoe UI", entry_size),
+            username_entry = tk.Entry(form_frame, font=self._font(entry_size),
                                       relief='solid', bd=2, bg=COLORS['light'])
             username_entry.pack(fill='x', ipady=entry_padding, pady=(0, 20))
 
             # Password field
-            tk.Label(form_frame, text="Create Password:", font=("Segoe UI", label_size),
+            tk.Label(form_frame, text="Create Password:", font=self._font(label_size),
                      bg=COLORS['white'], fg=COLORS['text']).pack(anchor='w', pady=(10, 8))
-            password_entry = tk.Entry(form_frame, show="*", font=("Segoe UI", entry_size),
+            password_entry = tk.Entry(form_frame, show="*", font=self._font(entry_size),
                                       relief='solid', bd=2, bg=COLORS['light'])
             password_entry.pack(fill='x', ipady=entry_padding, pady=(0, 20))
 
             # Confirm Password field
-            tk.Label(form_frame, text="Confirm Password:", font=("Segoe UI", label_size),
+            tk.Label(form_frame, text="Confirm Password:", font=self._font(label_size),
                      bg=COLORS['white'], fg=COLORS['text']).pack(anchor='w', pady=(10, 8))
-            confirm_entry = tk.Entry(form_frame, show="*", font=("Segoe UI", entry_size),
+            confirm_entry = tk.Entry(form_frame, show="*", font=self._font(entry_size),
                                      relief='solid', bd=2, bg=COLORS['light'])
             confirm_entry.pack(fill='x', ipady=entry_padding, pady=(0, 30))
 
@@ -487,12 +722,21 @@ class MainMenuApp:
                         return
 
                     # Disable buttons during registration
-                    username_entry.config(state='disabled')
-                    password_entry.config(state='disabled')
-                    confirm_entry.config(state='disabled')
+                    self._set_entries_state('disabled', username_entry, password_entry, confirm_entry)
 
-                    success, message = self.db.register_user(
-                        username, password)
+                    # Hash and insert on the DB worker
+                    self._submit_db(register_window, self.db.register_user,
+                                    (username, password), finish_registration,
+                                    "Registration failed")
+
+                except Exception as e:
+                    messagebox.showerror(
+                        "Error", f"Registration failed: {str(e)}")
+
+            def finish_registration(success, message):
+                try:
+                    if not register_window.winfo_exists():
+                        return
 
                     if success:
                         messagebox.showinfo("Success", f"{message}")
@@ -500,17 +744,15 @@ class MainMenuApp:
                     else:
                         messagebox.showerror("Registration Failed", message)
                         # Re-enable entries
-                        username_entry.config(state='normal')
-                        password_entry.config(state='normal')
-                        confirm_entry.config(state='normal')
+                        self._set_entries_state('normal', username_entry, password_entry, confirm_entry)
 
                 except Exception as e:
                     messagebox.showerror(
                         "Error", f"Registration failed: {str(e)}")
 
             # Enter key bindings for registration
-            username_entry.bind('<Return>', lambda e: password_entry.focus())
-            password_entry.bind('<Return>', lambda e: confirm_entry.focus())
+            username_entry.bind('<Return>', _focus_next)
+            password_entry.bind('<Return>', _focus_next)
             confirm_entry.bind('<Return>', lambda e: register_user())
 
             button_frame = tk.Frame(form_frame, bg=COLORS['white'])
@@ -527,6 +769,9 @@ class MainMenuApp:
                            command=register_window.destroy, button_type='danger',
                            width=max(12, int(button_width * 0.7)), height=button_height).pack(side=tk.LEFT, padx=10)
 
+            self._reveal_window(register_window)
+            register_window.grab_set()  # Grab needs the window to be viewable
+
             # Focus on username
             username_entry.focus()
 
@@ -537,175 +782,182 @@ class MainMenuApp:
     def show_main_menu(self):
         """Display the main menu"""
         try:
-            print("DEBUG: Creating main menu...")
-
-            # Clean up any existing window safely
-            if self.root and self.root.winfo_exists():
-                self.root.destroy()
-            self.root = None
+            _log.debug("Showing main menu...")
 
-            self.root = tk.Tk()
+            # Reuse the session window; a sub-app launch destroys it, in
+            # which case a fresh one is created here
+            created = self._ensure_root()
             self.root.title("TAR UMT Student Assistant")
-            apply_theme_to_window(self.root)
-            self.root.resizable(True, True)
-            self.root.minsize(1000, 650)
-
-            # Get optimal size and center properly
-            window_width, window_height = self.get_optimal_window_size(
-                1000, 650)
 
-            # FIXED: Use the corrected centering function
-            self.center_window_perfectly(
-                self.root, window_width, window_height)
-
-            main_canvas = tk.Canvas(self.root, bg=COLORS['background'])
-            main_scrollbar = tk.Scrollbar(
-                self.root, orient="vertical", command=main_canvas.yview)
-            scrollable_frame = tk.Frame(main_canvas, bg=COLORS['background'])
-
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: main_canvas.configure(
-                    scrollregion=main_canvas.bbox("all"))
-            )
-
-            main_canvas.create_window(
-                (window_width // 2+60, 0), window=scrollable_frame, anchor="n")
-            main_canvas.configure(yscrollcommand=main_scrollbar.set)
-
-            main_canvas.pack(side="left", fill="both", expand=True)
-            main_scrollbar.pack(side="right", fill="y")
-
-            def _on_mousewheel(event):
-                main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            if 'menu' in self._page_containers:
+                self._welcome_label['text'] = self._welcome_text()
+                self._show_page('menu')
+                self._reveal_window(self.root)
+                return
 
-            main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            window_width, window_height = self._window_size
 
-            padding_x = max(80, int(window_width * 0.06))
-            padding_y = max(60, int(window_height * 0.06))
-            main_frame = tk.Frame(scrollable_frame, bg=COLORS['background'],
-                                  padx=padding_x, pady=padding_y)
-            main_frame.pack(expand=True, fill='both')
+            # Work out all sizes once and share them with every section
+            sizes = self._compute_menu_sizes(window_width, window_height)
+            main_frame = self._themed(tk.Frame(self.root, bg=COLORS['background'],
+                                               padx=sizes.page_pad_x, pady=sizes.page_pad_y), bg='background')
 
             # Header section
-            self._create_header(main_frame, window_width, window_height)
+            self._create_header(main_frame, sizes)
 
             # Applications section
-            self._create_apps_section(main_frame, window_width, window_height)
+            self._create_apps_section(main_frame, sizes)
 
             # Footer section
-            self._create_footer(main_frame, window_width, window_height)
+            self._create_footer(main_frame, sizes)
 
-            # Setup exit protocol
-            self.root.protocol("WM_DELETE_WINDOW", self.exit_application)
+            # Only wrap the menu in a scrolling canvas if it does not fit
+            self._mount_page('menu', main_frame, window_width, window_height, 60)
+            self._show_page('menu')
 
-            print("DEBUG: Main menu created, starting mainloop...")
-            self.root.mainloop()
+            self._reveal_window(self.root)
+
+            if created:
+                _log.debug("Main menu created, starting mainloop...")
+                self.root.mainloop()
 
         except Exception as e:
             print(f"ERROR creating main menu: {e}")
             messagebox.showerror(
                 "Error", f"Failed to create main menu: {str(e)}")
 
-    def _create_header(self, parent, window_width, window_height):
+    def _welcome_text(self):
+        """Greeting shown at the top of the main menu"""
+        return f"Welcome back, {self.current_user}!" if self.current_user else "Welcome!"
+
+    def _compute_menu_sizes(self, window_width, window_height):
+        """Derive every main menu font size and spacing once per layout"""
+        W, H = window_width, window_height
+        return MenuLayout(
+            page_pad_x=max(80, int(W * 0.06)),
+            page_pad_y=max(60, int(H * 0.06)),
+            # Header
+            header_pady=max(30, int(H * 0.04)),
+            user_pady=max(15, int(H * 0.02)),
+            logout_width=max(12, min(16, int(W * 0.012))),
+            logout_height=max(1, min(2, int(H * 0.003))),
+            welcome_size=min(22, max(16, int(W * 0.015))),
+            title_size=min(32, max(24, int(W * 0.02))),
+            title_pady=max(12, int(H * 0.015)),
+            subtitle_size=min(16, max(12, int(W * 0.01))),
+            subtitle_pady=max(8, int(H * 0.012)),
+            # Applications section
+            content_pady=max(25, int(H * 0.03)),
+            apps_pad_x=max(50, int(W * 0.05)),
+            apps_pad_y=max(35, int(H * 0.045)),
+            section_title_size=min(26, max(18, int(W * 0.018))),
+            section_title_pady=max(30, int(H * 0.04)),
+            # Application cards
+            card_pad_x=max(35, int(W * 0.025)),
+            card_pad_y=max(25, int(H * 0.03)),
+            grid_pad_x=max(20, int(W * 0.015)),
+            grid_pad_y=max(15, int(H * 0.02)),
+            card_header_size=min(20, max(16, int(W * 0.014))),
+            card_header_pady=max(15, int(H * 0.02)),
+            card_title_size=min(18, max(14, int(W * 0.012))),
+            card_title_pady=max(8, int(H * 0.01)),
+            desc_size=min(12, max(10, int(W * 0.009))),
+            desc_wrap=max(300, int(W * 0.22)),
+            desc_pady=max(15, int(H * 0.02)),
+            launch_width=max(25, min(32, int(W * 0.022))),
+            launch_height=max(2, min(3, int(H * 0.004))),
+            launch_pady=max(20, int(H * 0.025)),
+            # Footer
+            footer_pady=max(40, int(H * 0.05)),
+            theme_width=max(25, min(35, int(W * 0.025))),
+            theme_height=max(2, min(4, int(H * 0.005))),
+            theme_pady=max(20, int(H * 0.025)),
+            info_pad_x=max(50, int(W * 0.04)),
+            info_pad_y=max(30, int(H * 0.04)),
+            info_pady=max(20, int(H * 0.025)),
+            info_title_size=min(18, max(12, int(W * 0.015))),
+            info_text_size=min(14, max(10, int(W * 0.01))),
+            info_wrap=max(1000, int(W * 0.7)),
+        )
+
+    def _create_header(self, parent, sizes):
         """Create header section"""
-        header_frame = tk.Frame(parent, bg=COLORS['background'])
-        header_frame.pack(fill='x', pady=(
-            0, max(30, int(window_height * 0.04))))
+        header_frame = self._themed(tk.Frame(parent, bg=COLORS['background']), bg='background')
+        header_frame.pack(fill='x', pady=(0, sizes.header_pady))
 
         # User welcome section with logout button
-        user_frame = tk.Frame(header_frame, bg=COLORS['background'])
-        user_frame.pack(fill='x', pady=(0, max(15, int(window_height * 0.02))))
+        user_frame = self._themed(tk.Frame(header_frame, bg=COLORS['background']), bg='background')
+        user_frame.pack(fill='x', pady=(0, sizes.user_pady))
 
-        logout_width = max(12, min(16, int(window_width * 0.012)))
-        logout_height = max(1, min(2, int(window_height * 0.003)))
-        EnhancedButton(user_frame, text="Logout",
-                       command=self.logout, button_type='dark',
-                       width=logout_width, height=logout_height).pack(side='right')
+        self._themed(EnhancedButton(user_frame, text="Logout",
+                                    command=self.logout, button_type='dark',
+                                    width=sizes.logout_width, height=sizes.logout_height)).pack(side='right')
 
-        welcome_frame = tk.Frame(header_frame, bg=COLORS['background'])
-        welcome_frame.pack(fill='x', pady=(
-            0, max(15, int(window_height * 0.02))))
+        welcome_frame = self._themed(tk.Frame(header_frame, bg=COLORS['background']), bg='background')
+        welcome_frame.pack(fill='x', pady=(0, sizes.user_pady))
 
         # welcome text
-        welcome_size = min(22, max(16, int(window_width * 0.015)))
-        welcome_text = f"Welcome back, {self.current_user}!" if self.current_user else "Welcome!"
-        welcome_label = tk.Label(welcome_frame, text=welcome_text,
-                                 font=("Segoe UI", welcome_size, "bold"),
-                                 fg=COLORS['success'], bg=COLORS['background'])
+        welcome_label = self._themed(tk.Label(welcome_frame, text=self._welcome_text(),
+                                              font=self._font(sizes.welcome_size, 'bold'),
+                                              fg=COLORS['success'], bg=COLORS['background']), bg='background', fg='success')
         welcome_label.pack(anchor='center')
+        self._welcome_label = welcome_label  # Retitled on later visits
 
         # main title
-        title_size = min(32, max(24, int(window_width * 0.02)))
-        title_label = tk.Label(header_frame, text="TAR UMT Student Assistant",
-                               font=("Segoe UI", title_size, "bold"),
-                               fg=COLORS['primary'], bg=COLORS['background'])
-        title_label.pack(pady=max(12, int(window_height * 0.015)))
-
-        subtitle_size = min(16, max(12, int(window_width * 0.01)))
-        subtitle_label = tk.Label(header_frame, text="Boost Your Academic Success with Productivity Tools",
-                                  font=("Segoe UI", subtitle_size, "italic"),
-                                  fg=COLORS['text_secondary'], bg=COLORS['background'])
-        subtitle_label.pack(pady=max(8, int(window_height * 0.012)))
-
-    def _create_apps_section(self, parent, window_width, window_height):
-        """Create applications section"""
-        content_frame = tk.Frame(parent, bg=COLORS['background'])
-        content_frame.pack(expand=True, fill='both',
-                           pady=max(25, int(window_height * 0.03)))
+        title_label = self._themed(tk.Label(header_frame, text="TAR UMT Student Assistant",
+                                            font=self._font(sizes.title_size, 'bold'),
+                                            fg=COLORS['primary'], bg=COLORS['background']), bg='background', fg='primary')
+        title_label.pack(pady=sizes.title_pady)
 
-        apps_padding_x = max(50, int(window_width * 0.05))
-        apps_padding_y = max(35, int(window_height * 0.045))
+        subtitle_label = self._themed(tk.Label(header_frame, text="Boost Your Academic Success with Productivity Tools",
+                                               font=self._font(sizes.subtitle_size, slant='italic'),
+                                               fg=COLORS['text_secondary'], bg=COLORS['background']), bg='background', fg='text_secondary')
+        subtitle_label.pack(pady=sizes.subtitle_pady)
 
-        apps_frame = tk.Frame(content_frame, bg=COLORS['white'], relief='raised',
-                              bd=2, padx=apps_padding_x, pady=apps_padding_y)
+    def _create_apps_section(self, parent, sizes):
+        """Create applications section"""
+        content_frame = self._themed(tk.Frame(parent, bg=COLORS['background']), bg='background')
+        content_frame.pack(expand=True, fill='both', pady=sizes.content_pady)
+
+        apps_frame = self._themed(tk.Frame(content_frame, bg=COLORS['white'], relief='raised',
+                                           bd=2, padx=sizes.apps_pad_x, pady=sizes.apps_pad_y), bg='white')
         apps_frame.pack(fill='both', expand=True)
 
         # section title
-        section_title_size = min(26, max(18, int(window_width * 0.018)))
-        section_title = tk.Label(apps_frame, text="Choose Your Productivity Tool",
-                                 font=("Segoe UI", section_title_size, "bold"),
-                                 bg=COLORS['white'], fg=COLORS['text'])
-        section_title.pack(pady=(0, max(30, int(window_height * 0.04))))
+        section_title = self._themed(tk.Label(apps_frame, text="Choose Your Productivity Tool",
+                                              font=self._font(sizes.section_title_size, 'bold'),
+                                              bg=COLORS['white'], fg=COLORS['text']), bg='white', fg='text')
+        section_title.pack(pady=(0, sizes.section_title_pady))
 
         # application cards grid
-        cards_frame = tk.Frame(apps_frame, bg=COLORS['white'])
+        cards_frame = self._themed(tk.Frame(apps_frame, bg=COLORS['white']), bg='white')
         cards_frame.pack(expand=True, fill='both')
 
         # Create cards
-        self._create_pomodoro_card(cards_frame, window_width, window_height)
-        self._create_reminder_card(cards_frame, window_width, window_height)
+        self._create_pomodoro_card(cards_frame, sizes)
+        self._create_reminder_card(cards_frame, sizes)
 
         # Configure grid weights
         cards_frame.grid_columnconfigure(0, weight=1)
         cards_frame.grid_columnconfigure(1, weight=1)
 
-    def _create_pomodoro_card(self, parent, window_width, window_height):
+    def _create_pomodoro_card(self, parent, sizes):
         """Create Pomodoro Timer card"""
-        # card padding
-        card_padding_x = max(35, int(window_width * 0.025))
-        card_padding_y = max(25, int(window_height * 0.03))
-        grid_padding_x = max(20, int(window_width * 0.015))
-        grid_padding_y = max(15, int(window_height * 0.02))
-
-        pomodoro_card = tk.Frame(parent, bg=COLORS['light'], relief='raised',
-                                 bd=2, padx=card_padding_x, pady=card_padding_y)
-        pomodoro_card.grid(row=0, column=0, padx=grid_padding_x,
-                           pady=grid_padding_y, sticky='nsew')
+        pomodoro_card = self._themed(tk.Frame(parent, bg=COLORS['light'], relief='raised',
+                                              bd=2, padx=sizes.card_pad_x, pady=sizes.card_pad_y), bg='light')
+        pomodoro_card.grid(row=0, column=0, padx=sizes.grid_pad_x,
+                           pady=sizes.grid_pad_y, sticky='nsew')
 
         # card header
-        header_size = min(20, max(16, int(window_width * 0.014)))
-        tk.Label(pomodoro_card, text="🍅 TIMER", font=("Segoe UI", header_size, "bold"),
-                 bg=COLORS['light'], fg=COLORS['accent']).pack(pady=max(15, int(window_height * 0.02)))
+        self._themed(tk.Label(pomodoro_card, text="🍅 TIMER", font=self._font(sizes.card_header_size, 'bold'),
+                              bg=COLORS['light'], fg=COLORS['accent']), bg='light', fg='accent').pack(pady=sizes.card_header_pady)
 
         # card title
-        title_size = min(18, max(14, int(window_width * 0.012)))
-        tk.Label(pomodoro_card, text="Pomodoro Study Timer",
-                 font=("Segoe UI", title_size, "bold"),
-                 bg=COLORS['light'], fg=COLORS['text']).pack(pady=max(8, int(window_height * 0.01)))
+        self._themed(tk.Label(pomodoro_card, text="Pomodoro Study Timer",
+                              font=self._font(sizes.card_title_size, 'bold'),
+                              bg=COLORS['light'], fg=COLORS['text']), bg='light', fg='text').pack(pady=sizes.card_title_pady)
 
         # description with readable text
-        desc_size = min(12, max(10, int(window_width * 0.009)))
         description_text = """Enhanced productivity timer using the Pomodoro Technique
 
 • Focus sessions with customizable breaks
@@ -714,44 +966,52 @@ class MainMenuApp:
 • Fully customizable timer settings & themes
 • Advanced notification system with sound alerts"""
 
-        wrap_length = max(300, int(window_width * 0.22))
-        tk.Label(pomodoro_card, text=description_text,
-                 font=("Segoe UI", desc_size), bg=COLORS['light'],
-                 fg=COLORS['text_secondary'], justify='center',
-                 wraplength=wrap_length).pack(pady=max(15, int(window_height * 0.02)))
+        self._create_card_description(pomodoro_card, description_text, sizes)
 
         # launch button
-        button_width = max(25, min(32, int(window_width * 0.022)))
-        button_height = max(2, min(3, int(window_height * 0.004)))
-        EnhancedButton(pomodoro_card, text="Launch Pomodoro Timer",
-                       command=self.open_pomodoro_app, button_type='primary',
-                       width=button_width, height=button_height).pack(pady=max(20, int(window_height * 0.025)))
+        self._themed(EnhancedButton(pomodoro_card, text="Launch Pomodoro Timer",
+                                    command=self.open_pomodoro_app, button_type='primary',
+                                    width=sizes.launch_width, height=sizes.launch_height)
+                     ).pack(pady=sizes.launch_pady)
+
+    def _create_card_description(self, card, text, sizes):
+        """Lay out a card description once at a fixed size so resizes never re-wrap it"""
+        font = self._font(sizes.desc_size)
+        lines = text.split('\n')
+        widest = max(font.measure(line) for line in lines)
+        if widest > sizes.desc_wrap:
+            # Too wide for the card at this size, so let Tk wrap it once
+            self._themed(tk.Label(card, text=text, font=font, bg=COLORS['light'],
+                                  fg=COLORS['text_secondary'], justify='center',
+                                  wraplength=sizes.desc_wrap), bg='light', fg='text_secondary').pack(pady=sizes.desc_pady)
+            return
 
-    def _create_reminder_card(self, parent, window_width, window_height):
-        """Create Reminder card"""
-        card_padding_x = max(35, int(window_width * 0.025))
-        card_padding_y = max(25, int(window_height * 0.03))
-        grid_padding_x = max(20, int(window_width * 0.015))
-        grid_padding_y = max(15, int(window_height * 0.02))
+        # The hand-broken lines already fit: pin the box size and skip wrapping
+        box = self._themed(tk.Frame(card, bg=COLORS['light'], width=widest,
+                                    height=font.metrics('linespace') * len(lines)), bg='light')
+        box.pack_propagate(False)
+        box.pack(pady=sizes.desc_pady)
+        self._themed(tk.Label(box, text=text, font=font, bg=COLORS['light'],
+                              fg=COLORS['text_secondary'], justify='center', wraplength=0),
+                     bg='light', fg='text_secondary').pack(expand=True, fill='both')
 
-        reminder_card = tk.Frame(parent, bg=COLORS['light'], relief='raised',
-                                 bd=2, padx=card_padding_x, pady=card_padding_y)
-        reminder_card.grid(row=0, column=1, padx=grid_padding_x,
-                           pady=grid_padding_y, sticky='nsew')
+    def _create_reminder_card(self, parent, sizes):
+        """Create Reminder card"""
+        reminder_card = self._themed(tk.Frame(parent, bg=COLORS['light'], relief='raised',
+                                              bd=2, padx=sizes.card_pad_x, pady=sizes.card_pad_y), bg='light')
+        reminder_card.grid(row=0, column=1, padx=sizes.grid_pad_x,
+                           pady=sizes.grid_pad_y, sticky='nsew')
 
         # card header
-        header_size = min(20, max(16, int(window_width * 0.014)))
-        tk.Label(reminder_card, text="⏰ REMINDER", font=("Segoe UI", header_size, "bold"),
-                 bg=COLORS['light'], fg=COLORS['success']).pack(pady=max(15, int(window_height * 0.02)))
+        self._themed(tk.Label(reminder_card, text="⏰ REMINDER", font=self._font(sizes.card_header_size, 'bold'),
+                              bg=COLORS['light'], fg=COLORS['success']), bg='light', fg='success').pack(pady=sizes.card_header_pady)
 
         # card title
-        title_size = min(18, max(14, int(window_width * 0.012)))
-        tk.Label(reminder_card, text="Smart Reminder System",
-                 font=("Segoe UI", title_size, "bold"),
-                 bg=COLORS['light'], fg=COLORS['text']).pack(pady=max(8, int(window_height * 0.01)))
+        self._themed(tk.Label(reminder_card, text="Smart Reminder System",
+                              font=self._font(sizes.card_title_size, 'bold'),
+                              bg=COLORS['light'], fg=COLORS['text']), bg='light', fg='text').pack(pady=sizes.card_title_pady)
 
         # description
-        desc_size = min(12, max(10, int(window_width * 0.009)))
         description_text = """Never miss important tasks and deadlines again
 
 • Time-based alert notifications with sound
@@ -760,64 +1020,53 @@ class MainMenuApp:
 • Beautiful calendar view with reminder indicators  
 • Real-time clock display with date tracking"""
 
-        wrap_length = max(300, int(window_width * 0.22))
-        tk.Label(reminder_card, text=description_text,
-                 font=("Segoe UI", desc_size), bg=COLORS['light'],
-                 fg=COLORS['text_secondary'], justify='center',
-                 wraplength=wrap_length).pack(pady=max(15, int(window_height * 0.02)))
+        self._create_card_description(reminder_card, description_text, sizes)
 
         # launch button
-        button_width = max(25, min(32, int(window_width * 0.022)))
-        button_height = max(2, min(3, int(window_height * 0.004)))
-        EnhancedButton(reminder_card, text="Launch Reminder App",
-                       command=self.open_reminder_app, button_type='success',
-                       width=button_width, height=button_height).pack(pady=max(20, int(window_height * 0.025)))
+        self._themed(EnhancedButton(reminder_card, text="Launch Reminder App",
+                                    command=self.open_reminder_app, button_type='success',
+                                    width=sizes.launch_width, height=sizes.launch_height)
+                     ).pack(pady=sizes.launch_pady)
 
-    def _create_footer(self, parent, window_width, window_height):
+    def _create_footer(self, parent, sizes):
         """Create footer section"""
-        footer_frame = tk.Frame(parent, bg=COLORS['background'])
-        footer_frame.pack(fill='x', pady=max(40, int(window_height * 0.05)))
+        footer_frame = self._themed(tk.Frame(parent, bg=COLORS['background']), bg='background')
+        footer_frame.pack(fill='x', pady=sizes.footer_pady)
         # theme toggle button
-        controls_frame = tk.Frame(footer_frame, bg=COLORS['background'])
+        controls_frame = self._themed(tk.Frame(footer_frame, bg=COLORS['background']), bg='background')
         controls_frame.pack()
 
-        theme_width = max(25, min(35, int(window_width * 0.025)))
-        theme_height = max(2, min(4, int(window_height * 0.005)))
         theme_text = "🌙 Dark Mode" if not APP_STATE['dark_mode'] else "☀️ Light Mode"
-        theme_btn = EnhancedButton(controls_frame, text=theme_text,
-                                   command=self.toggle_theme, button_type='info',
-                                   width=theme_width, height=theme_height)
-        theme_btn.pack(pady=max(20, int(window_height * 0.025)))
+        theme_btn = self._themed(EnhancedButton(controls_frame, text=theme_text,
+                                                command=self.toggle_theme, button_type='info',
+                                                width=sizes.theme_width, height=sizes.theme_height))
+        theme_btn.pack(pady=sizes.theme_pady)
+        self._theme_buttons.append(theme_btn)
 
         # info footer
-        info_padding = max(50, int(window_width * 0.04))
-        info_frame = tk.Frame(parent, bg=COLORS['info'], relief='raised',
-                              bd=2, padx=info_padding, pady=max(30, int(window_height * 0.04)))
-        info_frame.pack(fill='x', pady=max(20, int(window_height * 0.025)))
-
-        info_title_size = min(18, max(12, int(window_width * 0.015)))
-        tk.Label(info_frame, text="Developed by HO JUN YON and NA THEE LOK",
-                 font=("Segoe UI", info_title_size, "bold"),
-                 bg=COLORS['info'], fg=COLORS['white']).pack(pady=8)
-
-        info_text_size = min(14, max(10, int(window_width * 0.01)))
-        tk.Label(info_frame, text="AMCS1034 Software Development Fundamentals - TAR UMT Student Assistant Project",
-                 font=("Segoe UI", info_text_size), bg=COLORS['info'], fg=COLORS['white'],
-                 wraplength=max(1000, int(window_width * 0.7)),
-                 justify='center').pack(pady=5)
+        info_frame = self._themed(tk.Frame(parent, bg=COLORS['info'], relief='raised',
+                                           bd=2, padx=sizes.info_pad_x, pady=sizes.info_pad_y), bg='info')
+        info_frame.pack(fill='x', pady=sizes.info_pady)
+
+        self._themed(tk.Label(info_frame, text="Developed by HO JUN YON and NA THEE LOK",
+                              font=self._font(sizes.info_title_size, 'bold'),
+                              bg=COLORS['info'], fg=COLORS['white']), bg='info', fg='white').pack(pady=8)
+
+        self._themed(tk.Label(info_frame, text="AMCS1034 Software Development Fundamentals - TAR UMT Student Assistant Project",
+                              font=self._font(sizes.info_text_size), bg=COLORS['info'], fg=COLORS['white'],
+                              wraplength=sizes.info_wrap,
+                              justify='center'), bg='info', fg='white').pack(pady=5)
 
     def open_pomodoro_app(self):
         """Launch the Pomodoro Timer application"""
         try:
-            # loading feedback
-            print(f"Launching Pomodoro Timer for user: {self.current_user}")
+            # Launch feedback (APP_DEBUG only)
+            _log.debug("Launching Pomodoro Timer for user: %s", self.current_user)
 
             # Safely destroy and clear reference
-            if self.root and self.root.winfo_exists():
-                self.root.destroy()
-            self.root = None
+            self._teardown_root()
 
-            # Import and launch Pomodoro app with current user
+            # Import (already cached after the login preload) and launch
             from pomodoro_app import PomodoroApp
             self.current_app = PomodoroApp(current_user=self.current_user,
                                            return_callback=self.show_main_menu)
@@ -835,15 +1084,13 @@ class MainMenuApp:
     def open_reminder_app(self):
         """Launch the Simple Reminder application"""
         try:
-            # Better loading feedback
-            print(f"Launching Reminder App for user: {self.current_user}")
+            # Launch feedback (APP_DEBUG only)
+            _log.debug("Launching Reminder App for user: %s", self.current_user)
 
             # Safely destroy and clear reference
-            if self.root and self.root.winfo_exists():
-                self.root.destroy()
-            self.root = None
+            self._teardown_root()
 
-            # Import and launch Reminder app with current user
+            # Import (already cached after the login preload) and launch
             from reminder_app import ReminderApp
             self.current_app = ReminderApp(current_user=self.current_user,
                                            return_callback=self.show_main_menu)
@@ -858,13 +1105,60 @@ class MainMenuApp:
                 "Error", f"Failed to launch Reminder app: {str(e)}")
             self.show_main_menu()
 
+    def _ask_confirm(self, title, message):
+        """Ask a Yes/No question in a dialog that is built once and then reused"""
+        if self._confirm_dlg is None or not self._confirm_dlg.winfo_exists():
+            dlg = tk.Toplevel(self.root)
+            dlg.withdraw()
+            dlg.resizable(False, False)
+            dlg.transient(self.root)
+            self._themed(dlg, bg='white')
+            dlg.configure(bg=COLORS['white'])
+            self._confirm_var = tk.BooleanVar(dlg, value=False)
+            dlg.protocol("WM_DELETE_WINDOW", lambda: self._confirm_var.set(False))
+            dlg.bind('<Escape>', lambda e: self._confirm_var.set(False))
+
+            self._confirm_label = self._themed(tk.Label(dlg, font=self._font(12), bg=COLORS['white'],
+                                                        fg=COLORS['text'], justify='center',
+                                                        wraplength=360, padx=30, pady=20), bg='white', fg='text')
+            self._confirm_label.pack()
+
+            button_frame = self._themed(tk.Frame(dlg, bg=COLORS['white']), bg='white')
+            button_frame.pack(pady=(0, 20))
+            self._themed(EnhancedButton(button_frame, text="Yes", button_type='primary', width=10,
+                                        command=lambda: self._confirm_var.set(True))).pack(side='left', padx=10)
+            self._themed(EnhancedButton(button_frame, text="No", button_type='dark', width=10,
+                                        command=lambda: self._confirm_var.set(False))).pack(side='left', padx=10)
+            self._confirm_dlg = dlg
+
+        dlg = self._confirm_dlg
+        dlg.title(title)
+        self._confirm_label['text'] = message
+
+        # Center over the main window, then wait for an answer
+        dlg.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - dlg.winfo_reqwidth()) // 2
+        y = self.root.winfo_rooty() + (self.root.winfo_height() - dlg.winfo_reqheight()) // 2
+        dlg.geometry(f"+{x}+{y}")
+        dlg.deiconify()
+        dlg.lift()
+        dlg.grab_set()
+        dlg.focus_force()
+        try:
+            dlg.wait_variable(self._confirm_var)
+        finally:
+            if dlg.winfo_exists():
+                dlg.grab_release()
+                dlg.withdraw()
+        return self._confirm_var.get()
+
     def logout(self):
         """Logout current user and return to login page"""
         try:
-            result = messagebox.askquestion("Logout Confirmation",
-                                            f"Are you sure you want to logout?\n\n" +
-                                            f"User: {self.current_user}")
-            if result == 'yes':
+            if self._ask_confirm("Logout Confirmation",
+                                 f"Are you sure you want to logout?\n\n" +
+                                 f"User: {self.current_user}"):
+                self._cancel_db_calls()
                 self.current_user = None
                 messagebox.showinfo(
                     "Goodbye!", f"You have been logged out successfully.\nThank you for using TAR UMT Student Assistant!")
@@ -877,22 +1171,20 @@ class MainMenuApp:
         """Toggle between light and dark theme"""
         try:
             toggle_theme()
-            if self.current_user:
-                self.show_main_menu()  # Refresh main menu if logged in
-            else:
-                self.show_login_page()  # Refresh login page if not logged in
+            self._apply_theme_in_place()  # Only colors change, so keep the widgets
         except Exception as e:
             messagebox.showerror("Error", f"Theme toggle failed: {str(e)}")
 
     def exit_application(self):
         """Exit the application with confirmation"""
         try:
-            result = messagebox.askquestion("Exit Application",
-                                            "Are you sure you want to exit TAR UMT Student Assistant?")
-            if result == 'yes':
+            if self._ask_confirm("Exit Application",
+                                 "Are you sure you want to exit TAR UMT Student Assistant?"):
                 cleanup_application()
-                if self.root and self.root.winfo_exists():
-                    self.root.destroy()
+                # cancel_futures= needs Python 3.9, so drop queued calls ourselves
+                self._cancel_db_calls()
+                self._db_executor.shutdown(wait=False)
+                self._teardown_root()
                 print("Thank you for using TAR UMT Student Assistant!")
                 sys.exit(0)
         except Exception as e:
@@ -909,23 +1201,22 @@ def main():
     print("Course: AMCS1034 Software Development Fundamentals")
     print("=" * 80)
 
-    # Check system requirements
-    if not check_requirements():
-        print("\nCRITICAL: Missing required dependencies!")
-        print("Please install missing packages and try again.")
-        return False
-
-    print("\n✅ ALL REQUIREMENTS MET!")
     print("Launching Student Assistant Application...")
-    print("=" * 80)
 
     try:
         # Setup cleanup
         atexit.register(cleanup_application)
 
+        # Check system requirements while the login window is being built;
+        # the app waits for the answer before it accepts any input
+        executor = ThreadPoolExecutor(max_workers=1)
+        requirements = executor.submit(check_requirements)
+        executor.shutdown(wait=False)
+
         # Launch main application
-        app = MainMenuApp()
-        return True
+        app = MainMenuApp(requirements=requirements)
+        # check_requirements() returns the missing packages; none means success
+        return not requirements.result()
 
     except KeyboardInterrupt:
         print("\nApplication interrupted by user")
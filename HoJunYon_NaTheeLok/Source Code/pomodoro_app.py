@@ -6,11 +6,14 @@ Authors: HO JUN YON AND NA THEE LOK
 Course: AMCS1034 Software Development Fundamentals
 """
 
+import logging
+import math
+import os
 import random
 import sys
-import threading
 import time
 import tkinter as tk
+from datetime import datetime, timezone
 from tkinter import messagebox
 
 # Import shared modules
@@ -33,32 +36,107 @@ try:
 except ImportError:
     WINSOUND_AVAILABLE = False
 
+# Diagnostics (extra queries and DEBUG output) are off unless POMODORO_DEBUG is set
+_DEBUG = bool(os.environ.get("POMODORO_DEBUG"))
+_log = logging.getLogger(__name__)
+_log.addHandler(logging.NullHandler())
+if _DEBUG:
+    logging.basicConfig(level=logging.DEBUG, format="DEBUG: %(message)s")
+
+# Rows per page in the history window
+HISTORY_PAGE_SIZE = 50
+# History status labels, indexed by the completed flag
+_STATUS = ("SKIPPED", "COMPLETED")
+
+# Per-user database reads, cleared when the user's sessions are written.
+# Stats also expire after STATS_CACHE_TTL seconds since "today" and "this
+# week" move on by themselves; history only changes through new sessions.
+STATS_CACHE_TTL = 30
+_stats_cache = {}  # username -> (time.monotonic() stamp, (stats, message))
+_history_cache = {}  # (username, limit) -> (tuple of rows, message)
+
+
+# "MM:SS" strings indexed by seconds, grown to the longest session in use
+_TIME_STRINGS = []
+
+
+def _extend_time_strings(seconds):
+    """Make sure every "MM:SS" up to seconds is prebuilt"""
+    for i in range(len(_TIME_STRINGS), seconds + 1):
+        minutes, secs = divmod(i, 60)
+        _TIME_STRINGS.append(f"{minutes:02d}:{secs:02d}")
+
+
+def time_string(seconds):
+    """format_time() from the prebuilt table when possible"""
+    if 0 <= seconds < len(_TIME_STRINGS):
+        return _TIME_STRINGS[seconds]
+    return format_time(seconds)
+
+
+def invalidate_user_cache(username):
+    """Forget cached stats and history for a user after their sessions change"""
+    _stats_cache.pop(username, None)
+    for key in [key for key in _history_cache if key[0] == username]:
+        del _history_cache[key]
+
+
+def init_sound():
+    """Start the pygame mixer once; the main menu calls this in the background"""
+    if not PYGAME_AVAILABLE:
+        return False
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        return True
+    except:
+        return False
+
 
 class EnhancedPomodoroTimer:
     """Enhanced Pomodoro Timer with database integration"""
 
-    def __init__(self, database, username):
+    # Fixed attribute set: every tick reads several of these
+    __slots__ = ('db', 'username', 'scheduler',
+                 'work_time', 'break_time', 'long_break_time', '_long_break_every',
+                 'current_time', 'is_work_session', 'session_count',
+                 'timer_running', 'paused', 'sound_enabled',
+                 'on_time_update', 'on_session_complete', 'on_state_change',
+                 '_deadline', '_pause_remaining', '_tick_id',
+                 '_pending_sessions', '_current_total', '_session_info', '_last_emitted',
+                 '_motiv_order', '_motiv_i')
+
+    def __init__(self, database, username, scheduler):
         self.db = database
         self.username = username
+        self.scheduler = scheduler  # Tk widget whose event loop drives the countdown
 
         self.work_time = TIMER_CONFIG['work_time']
         self.break_time = TIMER_CONFIG['break_time']
         self.long_break_time = TIMER_CONFIG['long_break_time']
+        self._long_break_every = TIMER_CONFIG['sessions_until_long_break']
 
         self.current_time = self.work_time
         self.is_work_session = True
         self.session_count = 0
         self.timer_running = False
         self.paused = False
-        self.timer_thread = None
-        self.thread_stop_event = threading.Event()
+        self._deadline = None  # time.monotonic() at which the running session ends
+        self._pause_remaining = None  # Seconds left when the timer was paused
+        self._tick_id = None  # Pending after() id of the next countdown check
+        self._pending_sessions = []  # Finished sessions not yet written to the database
+        self._current_total = self.work_time  # Full length of the current session
+        self._session_info = None  # get_session_info() result for the current session
+        self._last_emitted = None  # (time string, whole percent) last sent to on_time_update
+        # Messages are dealt from a shuffled deck so none repeats within a cycle
+        self._motiv_order = list(range(len(MOTIVATIONAL_MESSAGES)))
+        random.shuffle(self._motiv_order)
+        self._motiv_i = 0
+        self._refresh_session()
 
         self.sound_enabled = True
-        if PYGAME_AVAILABLE:
-            try:
-                pygame.mixer.init()
-            except:
-                self.sound_enabled = False
+        if PYGAME_AVAILABLE and not init_sound():
+            self.sound_enabled = False
 
         self.on_time_update = None
         self.on_session_complete = None
@@ -70,6 +148,28 @@ class EnhancedPomodoroTimer:
         self.on_session_complete = session_complete
         self.on_state_change = state_change
 
+    def apply_settings(self, work_time, break_time, long_break_time):
+        """Use new session lengths (seconds) without disturbing a running session
+
+        A running or paused session keeps its deadline and the new lengths
+        apply from the next session. When idle, a session that hasn't been
+        started yet is resized straight away.
+        """
+        self.work_time = work_time
+        self.break_time = break_time
+        self.long_break_time = long_break_time
+        if self.timer_running:
+            return  # _refresh_session() picks them up at the next switch
+
+        untouched = self.current_time == self._current_total
+        self._refresh_session()
+        if untouched:
+            self.current_time = self._current_total
+        else:
+            # A stopped session never has more left than its new length
+            self.current_time = min(self.current_time, self._current_total)
+        self._emit_time()
+
     def start_timer(self):
         """Start the timer"""
         try:
@@ -78,13 +178,12 @@ class EnhancedPomodoroTimer:
 
             self.timer_running = True
             self.paused = False
-            self.thread_stop_event.clear()
+            self._deadline = time.monotonic() + self.current_time
 
-            self._safe_callback(self.on_state_change, "started")
+            if self.on_state_change:
+                self.on_state_change("started")
 
-            self.timer_thread = threading.Thread(
-                target=self._timer_loop, daemon=True)
-            self.timer_thread.start()
+            self._schedule_tick()
             return True
 
         except Exception as e:
@@ -99,8 +198,15 @@ class EnhancedPomodoroTimer:
                 return False
 
             self.paused = not self.paused
+            if self.paused:
+                self._pause_remaining = max(0, self._deadline - time.monotonic())
+                self._cancel_tick()
+            else:
+                self._deadline = time.monotonic() + self._pause_remaining
+                self._schedule_tick()
             state = "paused" if self.paused else "resumed"
-            self._safe_callback(self.on_state_change, state)
+            if self.on_state_change:
+                self.on_state_change(state)
             return True
         except Exception as e:
             print(f"ERROR pausing timer: {e}")
@@ -114,12 +220,10 @@ class EnhancedPomodoroTimer:
 
             self.timer_running = False
             self.paused = False
-            self.thread_stop_event.set()
-
-            if self.timer_thread and self.timer_thread.is_alive():
-                self.timer_thread.join(timeout=2.0)
+            self._cancel_tick()
 
-            self._safe_callback(self.on_state_change, "stopped")
+            if self.on_state_change:
+                self.on_state_change("stopped")
             return True
         except Exception as e:
             print(f"ERROR stopping timer: {e}")
@@ -132,14 +236,10 @@ class EnhancedPomodoroTimer:
             if was_running:
                 self.stop_timer()
 
-            if self.is_work_session:
-                self.current_time = self.work_time
-            elif self.session_count % TIMER_CONFIG['sessions_until_long_break'] == 0:
-                self.current_time = self.long_break_time
-            else:
-                self.current_time = self.break_time
+            self._refresh_session()
+            self.current_time = self._current_total
 
-            self._safe_callback(self.on_time_update, self.current_time)
+            self._emit_time()
             return True
         except Exception as e:
             print(f"ERROR resetting timer: {e}")
@@ -153,19 +253,10 @@ class EnhancedPomodoroTimer:
             if self.is_work_session:
                 # Save skipped work session as incomplete
                 duration = self.work_time // 60
-                print(
-                    f"DEBUG: Saving skipped session - User: '{self.username}', Duration: {duration}")
-
-                success, message = self.db.save_session(
-                    self.username, duration, 'work', completed=False)
+                _log.debug("Queueing skipped session - User: '%s', Duration: %s",
+                           self.username, duration)
 
-                print(
-                    f"DEBUG: Skip session result - Success: {success}, Message: '{message}'")
-
-                if not success:
-                    print(f"ERROR: Failed to save skipped session: {message}")
-                    messagebox.showwarning("Database Warning",
-                                           f"Session skipped but couldn't save to database:\n{message}")
+                self._queue_session(duration, 'work', completed=False)
 
                 # Increment session count even when skipping
                 self.session_count += 1
@@ -181,29 +272,47 @@ class EnhancedPomodoroTimer:
                                     "Break skipped.\nReady for next work session!")
 
             # Notify completion callbacks to update UI
-            self._safe_callback(self.on_session_complete, False)
+            if self.on_session_complete:
+                self.on_session_complete(False)
             return True
         except Exception as e:
             print(f"ERROR in skip_session: {e}")
             return False
 
-    def _timer_loop(self):
-        """Main timer loop running in separate thread"""
+    def _schedule_tick(self):
+        """Check the countdown again shortly on the Tk event loop"""
+        self._tick_id = self.scheduler.after(250, self._tick)
+
+    def _cancel_tick(self):
+        """Drop the pending countdown check, if any"""
+        if self._tick_id is not None:
+            try:
+                self.scheduler.after_cancel(self._tick_id)
+            except tk.TclError:
+                pass  # Window already destroyed
+            self._tick_id = None
+
+    def _tick(self):
+        """Recompute the time left from the deadline and finish the session at zero"""
+        self._tick_id = None
         try:
-            while self.timer_running and self.current_time > 0 and not self.thread_stop_event.is_set():
-                if not self.paused:
-                    time.sleep(1)
-                    self.current_time -= 1
-                    self._safe_callback(self.on_time_update, self.current_time)
-                else:
-                    time.sleep(0.1)
-
-            if self.timer_running and self.current_time <= 0:
+            if not self.timer_running or self.paused:
+                return
+
+            remaining = max(0, math.ceil(self._deadline - time.monotonic()))
+            if remaining != self.current_time:
+                self.current_time = remaining
+                self._emit_time()
+
+            if remaining <= 0:
                 self._complete_session(completed=True)
+            else:
+                self._schedule_tick()
         except Exception as e:
-            print(f"ERROR in timer loop: {e}")
+            print(f"ERROR in timer tick: {e}")
             self.timer_running = False
-            self._safe_callback(self.on_state_change, "error")
+            if self.on_state_change:
+                self.on_state_change("error")
 
     def _complete_session(self, completed=True):
         """Handle session completion"""
@@ -217,23 +326,14 @@ class EnhancedPomodoroTimer:
                 self.session_count += 1
                 duration = self.work_time // 60
 
-                print(
-                    f"DEBUG: Saving completed session - User: '{self.username}', Duration: {duration}")
+                _log.debug("Queueing completed session - User: '%s', Duration: %s",
+                           self.username, duration)
 
-                success, message = self.db.save_session(
-                    self.username, duration, 'work', completed)
-
-                print(
-                    f"DEBUG: Complete session result - Success: {success}, Message: '{message}'")
-
-                if not success:
-                    print(
-                        f"ERROR: Failed to save completed session: {message}")
-                    messagebox.showwarning("Database Warning",
-                                           f"Session completed but couldn't save to database:\n{message}")
+                self._queue_session(duration, 'work', completed)
 
                 if completed:
-                    motivation_msg = random.choice(MOTIVATIONAL_MESSAGES)
+                    motivation_msg = MOTIVATIONAL_MESSAGES[self._motiv_order[self._motiv_i]]
+                    self._motiv_i = (self._motiv_i + 1) % len(self._motiv_order)
                     try:
                         messagebox.showinfo("Session Complete!",
                                             f"{motivation_msg}\n\n"
@@ -254,94 +354,109 @@ class EnhancedPomodoroTimer:
 
                 self._switch_to_work()
 
-            self._safe_callback(self.on_session_complete, completed)
+            if self.on_session_complete:
+                self.on_session_complete(completed)
         except Exception as e:
             print(f"ERROR in _complete_session: {e}")
 
+    def _queue_session(self, duration, session_type, completed):
+        """Hand a finished session to the database's background writer right away"""
+        # Stamped now in the same UTC format as the column's CURRENT_TIMESTAMP default
+        start_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        self._pending_sessions.append(
+            (self.username, duration, session_type, completed, start_time))
+        # Queueing is cheap, so every session is persisted as it completes;
+        # _pending_sessions only holds rows that must be retried
+        self.flush_sessions()
+
+    def flush_sessions(self):
+        """Hand all queued sessions to the database's background writer"""
+        # Rows the writer failed to save earlier come back here to be retried
+        failed, error = self.db.take_failed_sessions()
+        if failed:
+            self._pending_sessions[:0] = failed
+            messagebox.showwarning("Database Warning",
+                                   f"{len(failed)} finished session(s) couldn't be saved to the database "
+                                   f"and will be retried:\n{error}")
+
+        if not self._pending_sessions:
+            return True
+
+        success, message = self.db.queue_sessions(self._pending_sessions)
+        _log.debug("Flushed %d session(s) - Success: %s, Message: '%s'",
+                   len(self._pending_sessions), success, message)
+
+        if not success:
+            # Keep the rows so the next flush can retry them
+            print(f"ERROR: Failed to save sessions: {message}")
+            messagebox.showwarning("Database Warning",
+                                   f"Sessions finished but couldn't save to database:\n{message}")
+            return False
+
+        invalidate_user_cache(self.username)
+        self._pending_sessions.clear()
+        return True
+
     def _switch_to_break(self):
         """Switch to break mode"""
-        try:
-            self.is_work_session = False
-
-            if self.session_count % TIMER_CONFIG['sessions_until_long_break'] == 0:
-                self.current_time = self.long_break_time
-            else:
-                self.current_time = self.break_time
-        except Exception as e:
-            print(f"ERROR switching to break: {e}")
-            self.current_time = self.break_time
+        self.is_work_session = False
+        self._refresh_session()
+        self.current_time = self._current_total
 
     def _switch_to_work(self):
         """Switch to work mode"""
-        try:
-            self.is_work_session = True
-            self.current_time = self.work_time
-        except Exception as e:
-            print(f"ERROR switching to work: {e}")
-            self.current_time = self.work_time
+        self.is_work_session = True
+        self._refresh_session()
+        self.current_time = self.work_time
 
     def _play_notification(self):
         """Play notification sound"""
-        try:
-            if self.sound_enabled:
-                print("\a")  # System beep
-        except Exception as e:
-            print(f"ERROR playing notification: {e}")
-
-    def _safe_callback(self, callback, *args):
-        """Safely execute callback with error handling"""
-        if callback:
-            try:
-                callback(*args)
-            except Exception as e:
-                print(f"ERROR in callback: {e}")
+        if self.sound_enabled:
+            print("\a")  # System beep
+
+    def _emit_time(self):
+        """Send on_time_update only when the displayed time or whole percent changes"""
+        shown = (time_string(self.current_time), int(self.get_progress_percentage()))
+        if shown == self._last_emitted:
+            return
+        self._last_emitted = shown
+        if self.on_time_update:
+            self.on_time_update(self.current_time)
 
     def get_formatted_time(self):
         """Get formatted time string"""
-        return format_time(self.current_time)
+        return time_string(self.current_time)
+
+    def _refresh_session(self):
+        """Work out the current session's length and info once per session change"""
+        if self.is_work_session:
+            self._current_total = self.work_time
+            self._session_info = {
+                'type': 'work',
+                'title': 'Focus Time',
+                'color': COLORS['accent']
+            }
+        else:
+            is_long_break = self.session_count % self._long_break_every == 0
+            self._current_total = self.long_break_time if is_long_break else self.break_time
+            self._session_info = {
+                'type': 'break',
+                'title': 'Long Break' if is_long_break else 'Short Break',
+                'color': COLORS['success']
+            }
+        _extend_time_strings(self._current_total)
+        self._last_emitted = None  # New session: the next update always goes out
 
     def get_progress_percentage(self):
         """Get progress as percentage"""
-        try:
-            if self.is_work_session:
-                total = self.work_time
-            elif self.session_count % TIMER_CONFIG['sessions_until_long_break'] == 0:
-                total = self.long_break_time
-            else:
-                total = self.break_time
-
-            if total <= 0:
-                return 0
-
-            elapsed = total - self.current_time
-            return max(0, min(100, (elapsed / total) * 100))
-        except Exception as e:
-            print(f"ERROR calculating progress: {e}")
+        total = self._current_total
+        if total <= 0:
             return 0
+        return max(0.0, min(100.0, (total - self.current_time) * 100.0 / total))
 
     def get_session_info(self):
         """Get current session information"""
-        try:
-            if self.is_work_session:
-                return {
-                    'type': 'work',
-                    'title': 'Focus Time',
-                    'color': COLORS['accent']
-                }
-            else:
-                is_long_break = self.session_count % TIMER_CONFIG['sessions_until_long_break'] == 0
-                return {
-                    'type': 'break',
-                    'title': 'Long Break' if is_long_break else 'Short Break',
-                    'color': COLORS['success']
-                }
-        except Exception as e:
-            print(f"ERROR getting session info: {e}")
-            return {
-                'type': 'work',
-                'title': 'Focus Time',
-                'color': COLORS['accent']
-            }
+        return self._session_info
 
 
 class PomodoroApp:
@@ -350,17 +465,23 @@ class PomodoroApp:
     def __init__(self, current_user=None, return_callback=None):
         self.return_callback = return_callback
         self.current_user = current_user
-        self.db = None
+        self._db = None  # Opened (or borrowed) on first use by the db property
         self.timer = None
         self.current_window = None
+        self._shown_session_count = None  # Count last drawn in the timer stats label
+        self._widgets_alive = False  # True while the timer window's widgets exist
+        self._timer_window = None  # Timer Toplevel, withdrawn between visits
+        self._stats_frame = None  # Dashboard stats area and what it currently shows
+        self._stats_cards = None
+        self._stats_placeholder = None
+        self._tip_label = None
 
         print(f"Starting Pomodoro Timer for user: {current_user}")
         self._init_application()
 
     def center_window_perfectly(self, window, width, height):
         """Center window EXACTLY in the middle of the screen"""
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = screen_size(window)
 
         x = (screen_width - width) // 2
         y = (screen_height - height) // 2
@@ -368,15 +489,13 @@ class PomodoroApp:
 
         window.geometry(f"{width}x{height}+{x}+{y}")
         window.configure(relief='flat', bd=0)
-        window.update_idletasks()
         window.lift()
         window.focus_force()
 
     def get_optimal_window_size(self, min_width=800, min_height=600):
         """Get optimal window size for pomodoro app"""
         if self.current_window:
-            screen_width = self.current_window.winfo_screenwidth()
-            screen_height = self.current_window.winfo_screenheight()
+            screen_width, screen_height = screen_size(self.current_window)
         else:
             screen_width = 1920  # Default assumption
             screen_height = 1080
@@ -394,17 +513,25 @@ class PomodoroApp:
 
         return optimal_width, optimal_height
 
+    @property
+    def db(self):
+        """Shared database, reusing the main menu's open connection when there is one"""
+        if self._db is None:
+            shared_db = APP_STATE.get('database')
+            if shared_db is not None and getattr(shared_db, 'connected', False):
+                self._db = shared_db
+            else:
+                _log.debug("Initializing database...")
+                self._db = PomodoroDatabase()
+                APP_STATE['database'] = self._db
+                _log.debug("Database initialized successfully")
+        return self._db
+
     def _init_application(self):
         """Initialize the application"""
         try:
-            print("DEBUG: Initializing database...")
-            self.db = PomodoroDatabase()
-            APP_STATE['database'] = self.db
-            print("DEBUG: Database initialized successfully")
-
             if self.current_user:
-                print(
-                    f"DEBUG: Starting Pomodoro menu for user: {self.current_user}")
+                _log.debug("Starting Pomodoro menu for user: %s", self.current_user)
                 self.show_pomodoro_menu()
             else:
                 messagebox.showerror(
@@ -416,51 +543,63 @@ class PomodoroApp:
                                  f"Failed to initialize: {str(e)}")
             self.back_to_main_menu()
 
+    def _get_user_stats(self):
+        """get_user_stats for the current user, reused for STATS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        hit = _stats_cache.get(self.current_user)
+        if hit and now - hit[0] < STATS_CACHE_TTL:
+            return hit[1]
+        result = self.db.get_user_stats(self.current_user)
+        if result[0] is not None:
+            _stats_cache[self.current_user] = (now, result)
+        return result
+
+    def _get_session_history(self, limit):
+        """get_session_history for the current user, reused until their sessions change"""
+        key = (self.current_user, limit)
+        hit = _history_cache.get(key)
+        if hit:
+            return hit
+        history, message = self.db.get_session_history(self.current_user, limit)
+        if history:
+            history = tuple(history)  # Shared between callers, so keep it read-only
+            _history_cache[key] = (history, message)
+        return history, message
+
     def debug_database_for_user(self, operation="general"):
-        """Debug database issues for current user"""
+        """Debug database issues for current user (POMODORO_DEBUG only)"""
+        if not _DEBUG:
+            return
         try:
-            print(
-                f"\nDEBUG: Database check for user '{self.current_user}' - Operation: {operation}")
-
-            # Check database connection
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-
-            # Check all users in database
-            cursor.execute("SELECT DISTINCT username FROM pomodoro_logs")
-            all_users = cursor.fetchall()
-            print(
-                f"DEBUG: All users in database: {[user[0] for user in all_users]}")
-
-            # Check exact match for current user
-            cursor.execute(
-                "SELECT COUNT(*) FROM pomodoro_logs WHERE username = ?", (self.current_user,))
-            exact_count = cursor.fetchone()[0]
-            print(
-                f"DEBUG: Exact match sessions for '{self.current_user}': {exact_count}")
-
-            # Check case-insensitive match
-            cursor.execute(
-                "SELECT COUNT(*) FROM pomodoro_logs WHERE LOWER(username) = LOWER(?)", (self.current_user,))
-            case_insensitive_count = cursor.fetchone()[0]
-            print(
-                f"DEBUG: Case-insensitive match for '{self.current_user}': {case_insensitive_count}")
-
-            # Show actual sessions for debugging
-            cursor.execute("SELECT username, start_time, duration_minutes, session_type, completed FROM pomodoro_logs WHERE LOWER(username) = LOWER(?) ORDER BY start_time DESC LIMIT 5", (self.current_user,))
-            sessions = cursor.fetchall()
+            _log.debug("Database check for user '%s' - Operation: %s",
+                       self.current_user, operation)
+
+            with self.db.connection() as conn:
+                # All users, exact matches and case-insensitive matches in one pass
+                all_users, exact_count, case_insensitive_count = conn.execute("""
+                    SELECT GROUP_CONCAT(DISTINCT username),
+                           COALESCE(SUM(username = ?), 0),
+                           COALESCE(SUM(LOWER(username) = LOWER(?)), 0)
+                    FROM pomodoro_logs
+                """, (self.current_user, self.current_user)).fetchone()
+
+                # Show actual sessions for debugging
+                sessions = conn.execute("SELECT username, start_time, duration_minutes, session_type, completed FROM pomodoro_logs WHERE LOWER(username) = LOWER(?) ORDER BY start_time DESC LIMIT 5", (self.current_user,)).fetchall()
+
+            _log.debug("All users in database: %s",
+                       all_users.split(',') if all_users else [])
+            _log.debug("Exact match sessions for '%s': %s", self.current_user, exact_count)
+            _log.debug("Case-insensitive match for '%s': %s",
+                       self.current_user, case_insensitive_count)
 
             if sessions:
-                print(f"DEBUG: Recent sessions found:")
+                _log.debug("Recent sessions found:")
                 for session in sessions:
                     username, start_time, duration, session_type, completed = session
-                    print(
-                        f"  Username: '{username}' | {start_time} | {duration}min | {session_type} | {'COMPLETED' if completed else 'SKIPPED'}")
+                    _log.debug("  Username: '%s' | %s | %smin | %s | %s", username, start_time,
+                               duration, session_type, _STATUS[bool(completed)])
             else:
-                print(
-                    f"DEBUG: NO sessions found for user '{self.current_user}'")
-
-            conn.close()
+                _log.debug("NO sessions found for user '%s'", self.current_user)
 
         except Exception as e:
             print(f"ERROR in database debug: {e}")
@@ -468,9 +607,13 @@ class PomodoroApp:
     def show_pomodoro_menu(self):
         """Show the main Pomodoro dashboard with better window sizing"""
         try:
-            self.timer = EnhancedPomodoroTimer(self.db, self.current_user)
+            if self.timer:
+                self.timer.flush_sessions()  # Rebuilt on theme toggle; keep its queue
 
             self.current_window = tk.Tk()
+            self._timer_window = None  # Any previous one died with the old root
+            self.timer = EnhancedPomodoroTimer(
+                self.db, self.current_user, self.current_window)
             self.current_window.title(f"Pomodoro Timer - {self.current_user}")
             apply_theme_to_window(self.current_window)
 
@@ -517,45 +660,13 @@ class PomodoroApp:
 
             # Get and display enhanced statistics
             self.debug_database_for_user("stats")
-            stats, stats_message = self.db.get_user_stats(self.current_user)
-            print(f"DEBUG: Stats result - {stats}, Message: '{stats_message}'")
+            stats, stats_message = self._get_user_stats()
+            _log.debug("Stats result - %s, Message: '%s'", stats, stats_message)
 
-            if stats:
-                # Create stats cards
-                cards_frame = tk.Frame(stats_frame, bg=COLORS['white'])
-                cards_frame.pack(fill='x', pady=8)
-
-                # Today's sessions
-                today_card = StatusCard(cards_frame, "Today's Sessions",
-                                        stats['today_sessions'], "", COLORS['success'])
-                today_card.grid(row=0, column=0, padx=8, pady=4, sticky='ew')
-
-                # Weekly progress
-                week_card = StatusCard(cards_frame, "This Week",
-                                       f"{stats['week_sessions']} sessions", "", COLORS['info'])
-                week_card.grid(row=0, column=1, padx=8, pady=4, sticky='ew')
-
-                # Total time
-                total_hours = stats['total_minutes'] // 60
-                total_mins = stats['total_minutes'] % 60
-                time_card = StatusCard(cards_frame, "Total Study Time",
-                                       f"{total_hours}h {total_mins}m", "", COLORS['warning'])
-                time_card.grid(row=1, column=0, padx=8, pady=4, sticky='ew')
-
-                # Average session
-                avg_card = StatusCard(cards_frame, "Average Session",
-                                      f"{stats['avg_duration']:.1f} min", "", COLORS['primary'])
-                avg_card.grid(row=1, column=1, padx=8, pady=4, sticky='ew')
-
-                # Configure grid
-                cards_frame.grid_columnconfigure(0, weight=1)
-                cards_frame.grid_columnconfigure(1, weight=1)
-
-            else:
-                tk.Label(stats_frame, text="Ready to start your first session?\n"
-                                           "Your progress will appear here!",
-                         font=FONTS['label'], bg=COLORS['white'], fg=COLORS['text'],
-                         justify='center').pack(pady=12)
+            self._stats_frame = stats_frame
+            self._stats_cards = None
+            self._stats_placeholder = None
+            self._show_stats(stats)
 
             # Enhanced Action Buttons
             button_frame = tk.Frame(main_frame, bg=COLORS['background'])
@@ -588,9 +699,10 @@ class PomodoroApp:
                      bg=COLORS['info'], fg=COLORS['white']).pack()
 
             tip_text = random.choice(STUDY_TIPS)
-            tk.Label(tip_frame, text=tip_text, font=FONTS['label'],
-                     bg=COLORS['info'], fg=COLORS['white'],
-                     wraplength=500, justify='center').pack(pady=6)
+            self._tip_label = tk.Label(tip_frame, text=tip_text, font=FONTS['label'],
+                                       bg=COLORS['info'], fg=COLORS['white'],
+                                       wraplength=500, justify='center')
+            self._tip_label.pack(pady=6)
 
             self.current_window.protocol(
                 "WM_DELETE_WINDOW", self.back_to_main_menu)
@@ -601,10 +713,84 @@ class PomodoroApp:
             messagebox.showerror(
                 "Error", f"Failed to load main menu: {str(e)}")
 
+    def _show_stats(self, stats):
+        """Fill the dashboard stats area, updating the cards in place once built"""
+        if not stats:
+            if self._stats_cards is None and self._stats_placeholder is None:
+                self._stats_placeholder = tk.Label(self._stats_frame, text="Ready to start your first session?\n"
+                                                   "Your progress will appear here!",
+                                                   font=FONTS['label'], bg=COLORS['white'], fg=COLORS['text'],
+                                                   justify='center')
+                self._stats_placeholder.pack(pady=12)
+            return
+
+        total_hours, total_mins = divmod(stats['total_minutes'], 60)
+        values = (stats['today_sessions'],
+                  f"{stats['week_sessions']} sessions",
+                  f"{total_hours}h {total_mins}m",
+                  f"{stats['avg_duration']:.1f} min")
+
+        if self._stats_cards is not None:
+            for card, value in zip(self._stats_cards, values):
+                card.update_value(value)
+            return
+
+        if self._stats_placeholder is not None:
+            self._stats_placeholder.destroy()
+            self._stats_placeholder = None
+
+        # Create stats cards
+        cards_frame = tk.Frame(self._stats_frame, bg=COLORS['white'])
+        cards_frame.pack(fill='x', pady=8)
+
+        # Today's sessions, weekly progress, total time, average session
+        today_card = StatusCard(cards_frame, "Today's Sessions",
+                                values[0], "", COLORS['success'])
+        today_card.grid(row=0, column=0, padx=8, pady=4, sticky='ew')
+
+        week_card = StatusCard(cards_frame, "This Week",
+                               values[1], "", COLORS['info'])
+        week_card.grid(row=0, column=1, padx=8, pady=4, sticky='ew')
+
+        time_card = StatusCard(cards_frame, "Total Study Time",
+                               values[2], "", COLORS['warning'])
+        time_card.grid(row=1, column=0, padx=8, pady=4, sticky='ew')
+
+        avg_card = StatusCard(cards_frame, "Average Session",
+                              values[3], "", COLORS['primary'])
+        avg_card.grid(row=1, column=1, padx=8, pady=4, sticky='ew')
+
+        # Configure grid
+        cards_frame.grid_columnconfigure(0, weight=1)
+        cards_frame.grid_columnconfigure(1, weight=1)
+
+        self._stats_cards = (today_card, week_card, time_card, avg_card)
+
+    def _refresh_dashboard(self):
+        """Bring the dashboard's stats and tip up to date without rebuilding it"""
+        try:
+            self.timer.flush_sessions()
+            stats, _ = self._get_user_stats()
+            self._show_stats(stats)
+            self._tip_label.config(text=random.choice(STUDY_TIPS))
+        except Exception as e:
+            print(f"ERROR refreshing dashboard: {e}")
+
     def show_timer_window(self):
         """Show the timer interface with better sizing"""
         try:
+            # Built once per dashboard; later visits just refresh and re-show it
+            timer_window = self._timer_window
+            if timer_window is not None and timer_window.winfo_exists():
+                self.on_session_complete(False)
+                self.update_timer_display(self.timer.current_time)
+                timer_window.deiconify()
+                timer_window.lift()
+                timer_window.grab_set()
+                return
+
             timer_window = tk.Toplevel(self.current_window)
+            self._timer_window = timer_window
             timer_window.title("Focus Session Active")
             timer_window.configure(bg=COLORS['background'])
             timer_window.grab_set()
@@ -614,8 +800,7 @@ class PomodoroApp:
             timer_window.minsize(600, 500)
 
             # Get screen size for better sizing
-            screen_width = timer_window.winfo_screenwidth()
-            screen_height = timer_window.winfo_screenheight()
+            screen_width, screen_height = screen_size(timer_window)
 
             # Use smaller, more reasonable size
             window_width = min(700, int(screen_width * 0.45))
@@ -697,6 +882,7 @@ class PomodoroApp:
                                    bd=1, padx=15, pady=10)
             stats_frame.pack(fill='x', pady=8)
 
+            self._shown_session_count = self.timer.session_count
             self.stats_label = tk.Label(stats_frame,
                                         text=f"Sessions Completed Today: {self.timer.session_count}",
                                         font=FONTS['label'], bg=COLORS['light'],
@@ -719,6 +905,11 @@ class PomodoroApp:
             timer_window.protocol("WM_DELETE_WINDOW",
                                   lambda: self._close_timer_window(timer_window))
 
+            # The timer callbacks check this flag instead of probing each
+            # widget; any way the window goes away clears it
+            self._widgets_alive = True
+            timer_window.bind("<Destroy>", lambda e: self._on_timer_window_destroy(e, timer_window))
+
         except Exception as e:
             print(f"ERROR in show_timer_window: {e}")
             messagebox.showerror("Error", f"Failed to open timer: {str(e)}")
@@ -731,9 +922,9 @@ class PomodoroApp:
                                                 "Timer is still running. Stop and return to dashboard?")
                 if result == 'yes':
                     self.timer.stop_timer()
-                    window.destroy()
+                    self._hide_timer_window(window)
             else:
-                window.destroy()
+                self._hide_timer_window(window)
         except Exception as e:
             print(f"ERROR closing timer window: {e}")
             try:
@@ -741,31 +932,40 @@ class PomodoroApp:
             except:
                 pass
 
+    def _hide_timer_window(self, window):
+        """Put the timer window away for reuse and update the dashboard behind it"""
+        window.grab_release()
+        window.withdraw()
+        self._refresh_dashboard()
+
+    def _on_timer_window_destroy(self, event, timer_window):
+        """Stop updating the timer widgets once their window is gone"""
+        if event.widget is timer_window:  # Children report their own <Destroy>
+            self._widgets_alive = False
+
     def update_timer_display(self, time_left):
         """Update timer display"""
+        if not self._widgets_alive:
+            return
         try:
-            if hasattr(self, 'time_label') and self.time_label.winfo_exists():
-                formatted_time = format_time(time_left)
-                self.time_label.config(text=formatted_time)
-
-                progress = self.timer.get_progress_percentage()
-                if hasattr(self, 'progress_bar'):
-                    self.progress_bar.set_progress(progress)
+            self.time_label.config(text=time_string(time_left))
+            self.progress_bar.set_progress(self.timer.get_progress_percentage())
         except Exception as e:
             print(f"ERROR updating timer display: {e}")
 
     def on_session_complete(self, completed):
         """Handle session completion"""
+        if not self._widgets_alive:
+            return
         try:
             session_info = self.timer.get_session_info()
-            if hasattr(self, 'session_label') and self.session_label.winfo_exists():
-                self.session_label.config(
-                    text=session_info['title'], fg=session_info['color'])
-
-            if hasattr(self, 'time_label') and self.time_label.winfo_exists():
-                self.time_label.config(bg=session_info['color'])
+            self.session_label.config(
+                text=session_info['title'], fg=session_info['color'])
+            self.time_label.config(bg=session_info['color'])
 
-            if hasattr(self, 'stats_label') and self.stats_label.winfo_exists():
+            # Skipping a break leaves the count unchanged, so skip the redraw too
+            if self.timer.session_count != self._shown_session_count:
+                self._shown_session_count = self.timer.session_count
                 self.stats_label.config(
                     text=f"Sessions Completed Today: {self.timer.session_count}")
         except Exception as e:
@@ -773,79 +973,58 @@ class PomodoroApp:
 
     def on_timer_state_change(self, state):
         """Handle timer state changes"""
+        if not self._widgets_alive:
+            return
         try:
-            if not hasattr(self, 'start_btn') or not self.start_btn.winfo_exists():
-                return
-
             if state == "started":
                 self.start_btn.config(state='disabled')
-                if hasattr(self, 'pause_btn'):
-                    self.pause_btn.config(state='normal')
+                self.pause_btn.config(state='normal')
             elif state == "paused":
-                if hasattr(self, 'pause_btn'):
-                    self.pause_btn.config(text="Resume")
+                self.pause_btn.config(text="Resume")
             elif state == "resumed":
-                if hasattr(self, 'pause_btn'):
-                    self.pause_btn.config(text="Pause")
+                self.pause_btn.config(text="Pause")
             elif state == "stopped":
                 self.start_btn.config(state='normal')
-                if hasattr(self, 'pause_btn'):
-                    self.pause_btn.config(state='disabled', text="Pause")
+                self.pause_btn.config(state='disabled', text="Pause")
         except Exception as e:
             print(f"ERROR in on_timer_state_change: {e}")
 
-    def show_history_window(self):
-        """Show session history with FIXED database retrieval"""
-        # COMPREHENSIVE DEBUG FOR HISTORY ISSUE
-        print(f"\nDEBUG: ===== HISTORY WINDOW DEBUG START =====")
-        print(f"DEBUG: Opening history for user: '{self.current_user}'")
+    def _debug_history(self):
+        """Log what the history queries return for the current user (POMODORO_DEBUG only)"""
+        _log.debug("===== HISTORY WINDOW DEBUG START =====")
+        _log.debug("Opening history for user: '%s'", self.current_user)
 
         # Debug database directly
         self.debug_database_for_user("history")
 
         # Test get_session_history method specifically
         try:
-            print(
-                f"DEBUG: Testing db.get_session_history('{self.current_user}', 50)")
-            history, message = self.db.get_session_history(
-                self.current_user, 50)
-            print(
-                f"DEBUG: get_session_history returned {len(history)} records")
-            print(f"DEBUG: Message: '{message}'")
+            _log.debug("Testing db.get_session_history('%s', %d)",
+                       self.current_user, HISTORY_PAGE_SIZE)
+            history, message = self._get_session_history(HISTORY_PAGE_SIZE)
+            _log.debug("get_session_history returned %d records", len(history))
+            _log.debug("Message: '%s'", message)
 
             if history:
-                print(f"DEBUG: First few history records:")
+                _log.debug("First few history records:")
                 for i, record in enumerate(history[:3]):
-                    print(f"  Record {i}: {record}")
+                    _log.debug("  Record %d: %s", i, record)
             else:
-                print(f"DEBUG: get_session_history returned EMPTY!")
-
-                # Try alternative query to see if it's a method issue
-                try:
-                    conn = self.db.get_connection()
-                    cursor = conn.cursor()
-
-                    # Try case-insensitive search
-                    cursor.execute(
-                        "SELECT start_time, duration_minutes, session_type, completed FROM pomodoro_logs WHERE LOWER(username) = LOWER(?) ORDER BY start_time DESC LIMIT 50", (self.current_user,))
-                    alt_history = cursor.fetchall()
-                    print(
-                        f"DEBUG: Alternative query found {len(alt_history)} records")
+                # Already case-insensitive, so a second probe would find nothing more
+                _log.debug("get_session_history returned EMPTY!")
 
-                    if alt_history:
-                        print(f"DEBUG: Alternative query results:")
-                        for record in alt_history[:3]:
-                            print(f"  Alt Record: {record}")
-
-                    conn.close()
+        except Exception as e:
+            _log.debug("get_session_history failed with error: %s", e)
 
-                except Exception as e:
-                    print(f"DEBUG: Alternative query failed: {e}")
+        _log.debug("===== HISTORY WINDOW DEBUG END =====")
 
-        except Exception as e:
-            print(f"DEBUG: get_session_history failed with error: {e}")
+    def show_history_window(self):
+        """Show session history with FIXED database retrieval"""
+        if self.timer:
+            self.timer.flush_sessions()  # History and stats read the database
 
-        print(f"DEBUG: ===== HISTORY WINDOW DEBUG END =====\n")
+        if _DEBUG:
+            self._debug_history()
 
         try:
             history_window = tk.Toplevel(self.current_window)
@@ -858,8 +1037,7 @@ class PomodoroApp:
             history_window.minsize(650, 500)
 
             # Get screen size for better sizing
-            screen_width = history_window.winfo_screenwidth()
-            screen_height = history_window.winfo_screenheight()
+            screen_width, screen_height = screen_size(history_window)
 
             window_width = min(750, int(screen_width * 0.5))
             window_height = min(550, int(screen_height * 0.65))
@@ -877,14 +1055,13 @@ class PomodoroApp:
             title_label.pack(pady=15)
 
             # Enhanced quick stats
-            stats, _ = self.db.get_user_stats(self.current_user)
+            stats, _ = self._get_user_stats()
             if stats:
                 summary_frame = tk.Frame(main_frame, bg=COLORS['info'], relief='raised',
                                          bd=2, padx=15, pady=12)
                 summary_frame.pack(fill='x', pady=8)
 
-                total_hours = stats['total_minutes'] // 60
-                total_mins = stats['total_minutes'] % 60
+                total_hours, total_mins = divmod(stats['total_minutes'], 60)
                 stats_text = (f"Total: {stats['total_sessions']} sessions | "
                               f"{total_hours}h {total_mins}m studied | "
                               f"Avg: {stats['avg_duration']:.1f} min/session")
@@ -915,71 +1092,55 @@ class PomodoroApp:
             listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-            # Get and display enhanced history - WITH FIXED RETRIEVAL
+            # Get and display enhanced history (the lookup ignores username case)
             try:
-                # First try the normal method
-                history, history_message = self.db.get_session_history(
-                    self.current_user, 50)
-
-                # If that fails, try a direct database query with case-insensitive search
-                if not history:
-                    print(
-                        f"DEBUG: Normal history method returned empty, trying direct query...")
-                    try:
-                        conn = self.db.get_connection()
-                        cursor = conn.cursor()
-                        cursor.execute("""
-                            SELECT start_time, duration_minutes, session_type, completed
-                            FROM pomodoro_logs 
-                            WHERE LOWER(username) = LOWER(?)
-                            ORDER BY start_time DESC 
-                            LIMIT 50
-                        """, (self.current_user,))
-                        history = cursor.fetchall()
-                        conn.close()
-                        print(
-                            f"DEBUG: Direct query found {len(history)} records")
-                    except Exception as e:
-                        print(f"DEBUG: Direct query failed: {e}")
-                        history = []
-
+                history, history_message = self._get_session_history(HISTORY_PAGE_SIZE)
             except Exception as e:
                 print(f"ERROR getting session history: {e}")
                 history = []
 
+            def show_records(records):
+                # Parse and format the whole page in two passes; rows come from
+                # our own inserts, so stamps are ISO strings
+                try:
+                    stamps = [datetime.fromisoformat(r[0][:-1] if r[0].endswith('Z') else r[0])
+                              for r in records]
+                    dates = [f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+                             for dt in stamps]
+                except (TypeError, ValueError, AttributeError) as e:
+                    print(f"ERROR parsing history timestamps: {e}")
+                    dates = [str(r[0]) for r in records]  # Show them as stored
+
+                display_texts = [f"{_STATUS[bool(r[3])]} | {date_str} | "
+                                 f"{r[1]} min | {r[2].upper()}"
+                                 for r, date_str in zip(records, dates)]
+                # One Tcl call for the whole page rather than one per row
+                listbox.insert(tk.END, *display_texts)
+
+            def load_more():
+                # Continue after the last row shown: (start_time, id) keyset
+                last = history[-1]
+                page, _ = self.db.get_session_history(self.current_user, HISTORY_PAGE_SIZE,
+                                                      before=(last[0], last[4]))
+                history.extend(page)
+                show_records(page)
+                if len(page) < HISTORY_PAGE_SIZE:
+                    more_btn.pack_forget()
+
             if history:
-                print(
-                    f"DEBUG: Displaying {len(history)} history records in UI")
-                for record in history:
-                    try:
-                        date_time = record[0]
-                        duration = record[1]
-                        session_type = record[2]
-                        completed = record[3]
-
-                        # Parse date_time if it's a string
-                        if isinstance(date_time, str):
-                            try:
-                                from datetime import datetime
-                                date_time = datetime.fromisoformat(
-                                    date_time.replace('Z', '+00:00'))
-                            except:
-                                pass
-
-                        date_str = date_time.strftime(
-                            "%Y-%m-%d %H:%M") if hasattr(date_time, 'strftime') else str(date_time)
-                        status_text = "COMPLETED" if completed else "SKIPPED"
-
-                        display_text = f"{status_text} | {date_str} | {duration} min | {session_type.upper()}"
-                        listbox.insert(tk.END, display_text)
-                    except Exception as e:
-                        print(f"ERROR processing history record {record}: {e}")
-                        continue
+                _log.debug("Displaying %d history records in UI", len(history))
+                history = list(history)
+                show_records(history)
             else:
-                listbox.insert(tk.END, "No session history found yet.")
-                listbox.insert(
-                    tk.END, "Complete your first session to see it here!")
-                print(f"DEBUG: No history records to display")
+                listbox.insert(tk.END, "No session history found yet.",
+                               "Complete your first session to see it here!")
+                _log.debug("No history records to display")
+
+            # A short first page means there is nothing more to load
+            more_btn = EnhancedButton(history_frame, text="Load More", command=load_more,
+                                      button_type='info', width=12)
+            if len(history) == HISTORY_PAGE_SIZE:
+                more_btn.pack(pady=(8, 0))
 
             # Enhanced close button
             EnhancedButton(main_frame, text="Close",
@@ -993,7 +1154,15 @@ class PomodoroApp:
     def show_settings_window(self):
         """Show settings configuration with better window sizing"""
         try:
-            settings_window = tk.Toplevel(self.current_window)
+            settings_window = tk.Toplevel(self.current_window, name='settings')
+            # Shared widget defaults go in the option database once, so each
+            # widget below only passes what differs from them
+            for pattern, value in (('*settings*Frame.background', COLORS['white']),
+                                   ('*settings*Label.background', COLORS['white']),
+                                   ('*settings*Label.foreground', COLORS['text']),
+                                   ('*settings*Label.font', FONTS['label']),
+                                   ('*settings*Entry.font', FONTS['label'])):
+                settings_window.option_add(pattern, value)
             settings_window.title("Settings")
             settings_window.configure(bg=COLORS['background'])
             settings_window.grab_set()
@@ -1003,8 +1172,7 @@ class PomodoroApp:
             settings_window.minsize(500, 450)
 
             # Get screen size for better sizing
-            screen_width = settings_window.winfo_screenwidth()
-            screen_height = settings_window.winfo_screenheight()
+            screen_width, screen_height = screen_size(settings_window)
 
             window_width = min(550, int(screen_width * 0.4))
             window_height = min(500, int(screen_height * 0.55))
@@ -1022,18 +1190,16 @@ class PomodoroApp:
             title_label.pack(pady=15)
 
             # Enhanced Theme Settings
-            theme_frame = tk.Frame(main_frame, bg=COLORS['white'], relief='raised',
+            theme_frame = tk.Frame(main_frame, relief='raised',
                                    bd=2, padx=20, pady=15)
             theme_frame.pack(fill='x', pady=8)
 
-            tk.Label(theme_frame, text="Appearance", font=FONTS['subheader'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(pady=(0, 12))
+            tk.Label(theme_frame, text="Appearance", font=FONTS['subheader']).pack(pady=(0, 12))
 
-            theme_control_frame = tk.Frame(theme_frame, bg=COLORS['white'])
+            theme_control_frame = tk.Frame(theme_frame)
             theme_control_frame.pack(fill='x')
 
-            tk.Label(theme_control_frame, text="Theme Mode:", font=FONTS['label'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(side=tk.LEFT)
+            tk.Label(theme_control_frame, text="Theme Mode:").pack(side=tk.LEFT)
 
             current_theme = "Dark Mode" if APP_STATE['dark_mode'] else "Light Mode"
             switch_to = "Light" if APP_STATE['dark_mode'] else "Dark"
@@ -1043,53 +1209,49 @@ class PomodoroApp:
                            button_type='info', width=16, height=1).pack(side=tk.RIGHT)
 
             tk.Label(theme_frame, text=f"Current: {current_theme}", font=FONTS['small'],
-                     bg=COLORS['white'], fg=COLORS['text_secondary']).pack(pady=4)
+                     fg=COLORS['text_secondary']).pack(pady=4)
 
             # Enhanced Timer Settings
-            timer_frame = tk.Frame(main_frame, bg=COLORS['white'], relief='raised',
+            timer_frame = tk.Frame(main_frame, relief='raised',
                                    bd=2, padx=20, pady=15)
             timer_frame.pack(fill='x', pady=8)
 
-            tk.Label(timer_frame, text="Timer Durations (minutes)", font=FONTS['subheader'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(pady=(0, 12))
+            tk.Label(timer_frame, text="Timer Durations (minutes)", font=FONTS['subheader']).pack(pady=(0, 12))
 
             # Enhanced duration controls
-            durations_grid = tk.Frame(timer_frame, bg=COLORS['white'])
+            durations_grid = tk.Frame(timer_frame)
             durations_grid.pack(fill='x', pady=8)
 
             # Work duration
-            work_frame = tk.Frame(durations_grid, bg=COLORS['white'])
+            work_frame = tk.Frame(durations_grid)
             work_frame.pack(fill='x', pady=6)
 
-            tk.Label(work_frame, text="Work Session:", font=FONTS['label'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(side=tk.LEFT)
+            tk.Label(work_frame, text="Work Session:").pack(side=tk.LEFT)
             work_var = tk.StringVar(value=str(TIMER_CONFIG['work_time'] // 60))
-            work_entry = tk.Entry(work_frame, textvariable=work_var, font=FONTS['label'],
+            work_entry = tk.Entry(work_frame, textvariable=work_var,
                                   width=8, justify='center', relief='solid', bd=1)
             work_entry.pack(side=tk.RIGHT)
 
             # Break duration
-            break_frame = tk.Frame(durations_grid, bg=COLORS['white'])
+            break_frame = tk.Frame(durations_grid)
             break_frame.pack(fill='x', pady=6)
 
-            tk.Label(break_frame, text="Short Break:", font=FONTS['label'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(side=tk.LEFT)
+            tk.Label(break_frame, text="Short Break:").pack(side=tk.LEFT)
             break_var = tk.StringVar(
                 value=str(TIMER_CONFIG['break_time'] // 60))
-            break_entry = tk.Entry(break_frame, textvariable=break_var, font=FONTS['label'],
+            break_entry = tk.Entry(break_frame, textvariable=break_var,
                                    width=8, justify='center', relief='solid', bd=1)
             break_entry.pack(side=tk.RIGHT)
 
             # Long break duration
-            long_break_frame = tk.Frame(durations_grid, bg=COLORS['white'])
+            long_break_frame = tk.Frame(durations_grid)
             long_break_frame.pack(fill='x', pady=6)
 
-            tk.Label(long_break_frame, text="Long Break:", font=FONTS['label'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(side=tk.LEFT)
+            tk.Label(long_break_frame, text="Long Break:").pack(side=tk.LEFT)
             long_break_var = tk.StringVar(
                 value=str(TIMER_CONFIG['long_break_time'] // 60))
             long_break_entry = tk.Entry(long_break_frame, textvariable=long_break_var,
-                                        font=FONTS['label'], width=8, justify='center',
+                                        width=8, justify='center',
                                         relief='solid', bd=1)
             long_break_entry.pack(side=tk.RIGHT)
 
@@ -1112,9 +1274,9 @@ class PomodoroApp:
                     TIMER_CONFIG['long_break_time'] = long_break_minutes * 60
 
                     if self.timer:
-                        self.timer.work_time = TIMER_CONFIG['work_time']
-                        self.timer.break_time = TIMER_CONFIG['break_time']
-                        self.timer.long_break_time = TIMER_CONFIG['long_break_time']
+                        self.timer.apply_settings(TIMER_CONFIG['work_time'],
+                                                  TIMER_CONFIG['break_time'],
+                                                  TIMER_CONFIG['long_break_time'])
 
                     messagebox.showinfo(
                         "Success", "Timer settings saved successfully!")
@@ -1170,6 +1332,9 @@ class PomodoroApp:
 
                 self.timer.stop_timer()
 
+            if self.timer:
+                self.timer.flush_sessions()
+
             APP_STATE['running'] = False
             if self.current_window and self.current_window.winfo_exists():
                 self.current_window.destroy()
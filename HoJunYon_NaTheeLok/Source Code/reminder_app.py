@@ -1,12 +1,18 @@
 # Import necessary standard library modules
 import platform  # For getting operating system information
+import queue  # For handing beep requests to the sound thread
 import sys  # For system-specific parameters and functions
 import threading  # For multi-threading support
 import time  # For time-related functions
 import tkinter as tk  # For GUI creation
-from datetime import datetime, timedelta, date  # For date and time manipulation
+from datetime import datetime, timedelta, date, time as dt_time  # For date and time manipulation
 from tkinter import messagebox, ttk  # For dialog boxes and themed widgets
 import calendar as cal  # For calendar-related functions
+import heapq  # For ordering reminders by due time
+from bisect import bisect_right  # For keeping each day's reminders in time order
+from collections import defaultdict  # For grouping reminders by date
+from functools import lru_cache  # For memoizing hover colors
+from itertools import count  # For numbering reminders
 
 # Try to import winsound for Windows audio notifications
 try:
@@ -39,6 +45,19 @@ COLORS = {
     'calendar_overdue': '#ef4444'        # Red for overdue reminders
 }
 
+# Calendar day cell look per state: (background, text color, label format)
+# where n is the day number, p the pending count and c the completed count
+CALENDAR_CELL_STYLES = {
+    'selected': (COLORS['calendar_selected'], COLORS['white'], "{n}"),
+    'today': (COLORS['calendar_today'], COLORS['dark'], "{n}"),
+    'today_marked': (COLORS['calendar_today'], COLORS['dark'], "{n}\n•"),
+    'overdue': (COLORS['calendar_overdue'], COLORS['white'], "{n}\n{p}!"),
+    'both': (COLORS['calendar_has_both'], COLORS['white'], "{n}\n{p}+{c}"),
+    'completed': (COLORS['calendar_has_completed'], COLORS['white'], "{n}\n✓{c}"),
+    'pending': (COLORS['calendar_has_reminders'], COLORS['white'], "{n}\n{p}"),
+    'none': (COLORS['white'], COLORS['text'], "{n}")
+}
+
 # Font configurations for the application
 FONTS = {
     'header': ('Segoe UI', 16, 'bold'),      # Main headers
@@ -49,10 +68,155 @@ FONTS = {
     'calendar_header': ('Segoe UI', 11, 'bold')  # Calendar headers
 }
 
-# Global list to store all reminders
-reminders = []
+# All reminders, stored per user and then per date string so per-day
+# lookups don't scan every reminder; kept in step by the helpers below.
+# A date's list is never changed in place: writers (holding the user's lock)
+# store a new list, so readers can take one without locking
+reminders_by_user = defaultdict(lambda: defaultdict(list))
+# The same reminder dicts by their id, so a listbox row finds its reminder
+# directly; ids come from a counter and are never reused
+reminders_by_id = {}
+_reminder_ids = count(1)
+# Number of reminders each user has, kept up to date by the same helpers
+reminder_counts = defaultdict(int)
+# Each user's reminders in order as a tuple, built on first use after a change
+_user_views = {}
+# One lock per user's reminders, shared by every ReminderApp for that user
+# and its checker thread; other users' data is never held up
+_user_locks = defaultdict(threading.Lock)
 # Application state dictionary to manage running status
 APP_STATE = {'running': True}
+# Reminder sounds are played one after another by a single daemon thread,
+# started on first use, instead of a new thread per notification
+_beep_queue = queue.Queue()
+_beep_thread = None
+
+
+# Monday-first month layouts, shared by every calendar widget
+_CALENDAR = cal.Calendar(firstweekday=0)
+# Month names (index 1-12) and Monday-first weekday headers, built once
+MONTH_NAMES = tuple(cal.month_name)
+DAY_NAMES = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+@lru_cache(maxsize=128)
+def month_days(year, month):
+    """Day numbers of a month's weeks, flattened row by row; 0 pads the edges"""
+    return tuple(_CALENDAR.itermonthdays(year, month))
+
+
+# How long until a new reminder fires: the first row whose minimum number
+# of seconds is reached formats the text, checked from largest to smallest
+_TIME_DESC = (
+    (86400, lambda s: f"in {s // 86400} day(s)"),
+    (3601, lambda s: f"in {s // 3600} hour(s) and {s % 3600 // 60} minute(s)"),
+    (61, lambda s: f"in {s // 60} minute(s)"),
+)
+
+
+def describe_time_until(delta):
+    """Human-readable 'in ...' text for a timedelta until a reminder"""
+    seconds = int(delta.total_seconds())
+    return next((fmt(seconds) for minimum, fmt in _TIME_DESC if seconds >= minimum),
+                "very soon")
+
+
+def parse_reminder_date(text):
+    """Parse a date exactly as strptime("%Y-%m-%d") accepts it"""
+    # Zero-padded input, the usual case, takes the faster ISO parser
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        return date.fromisoformat(text)
+    return datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def parse_reminder_time(text):
+    """Parse a time exactly as strptime("%H:%M:%S") accepts it"""
+    if len(text) == 8 and text[2] == ':' and text[5] == ':':
+        return dt_time.fromisoformat(text)
+    return datetime.strptime(text, "%H:%M:%S").time()
+
+
+def add_reminder(reminder):
+    """Give a new reminder an id and store it under its user and date"""
+    # Every optional field is present from here on, so readers index directly
+    reminder.setdefault('category', 'General')
+    reminder.setdefault('done', False)
+    reminder.setdefault('notified', False)
+    # The searchable fields lowercased once; \x1f keeps a keyword from
+    # matching across two fields
+    reminder['search_text'] = "\x1f".join(
+        (reminder['text'], reminder['category'], reminder['time'], reminder['date'])).lower()
+    reminder['id'] = next(_reminder_ids)
+    reminders_by_id[reminder['id']] = reminder
+    by_date = reminders_by_user[reminder['user']]
+    day = by_date.get(reminder['date'], [])
+    # Slot it in by time so the day's list is always in order
+    i = bisect_right([r['time'] for r in day], reminder['time'])
+    by_date[reminder['date']] = day[:i] + [reminder] + day[i:]
+    reminder_counts[reminder['user']] += 1
+    _user_views.pop(reminder['user'], None)
+
+
+def remove_reminder(reminder):
+    """Remove a reminder from its user and date"""
+    del reminders_by_id[reminder['id']]
+    by_date = reminders_by_user[reminder['user']]
+    remaining = [r for r in by_date[reminder['date']] if r is not reminder]
+    reminder_counts[reminder['user']] -= 1
+    _user_views.pop(reminder['user'], None)
+    if remaining:
+        by_date[reminder['date']] = remaining
+    else:
+        del by_date[reminder['date']]
+
+
+# Keyed on the displayed fields, so an unchanged reminder is a cache hit on
+# every listbox refresh and a status change simply makes a new entry
+@lru_cache(maxsize=4096)
+def format_reminder_row(category, text, date_str, time_str, done, notified):
+    """Listbox line for one reminder"""
+    category_text = f"[{category}] " if category else ""
+    status_text = " ✅ [COMPLETED]" if done else (
+        " 📢 [NOTIFIED]" if notified else "")
+    return f"{category_text}{text} - {date_str} at {time_str}{status_text}"
+
+
+def _beep_loop():
+    """Play one beep sequence per queued request, for the life of the process"""
+    for _ in iter(_beep_queue.get, None):
+        try:
+            if platform.system() == "Windows" and WINSOUND_AVAILABLE:
+                for _ in range(3):
+                    winsound.Beep(1000, 300)
+                    time.sleep(0.1)
+            else:
+                for _ in range(3):
+                    print('\a')
+                    time.sleep(0.1)
+        except Exception as e:
+            print(f"Could not play sound: {e}")
+            print('\a')
+
+
+def user_reminders(user):
+    """All of user's reminders in date and time order, as a shared tuple"""
+    view = _user_views.get(user)
+    if view is None:
+        # list() takes the day lists in one step, so a date added meanwhile
+        # can't break the iteration; only the dates need sorting, each day's
+        # list is kept in time order by add_reminder
+        days = sorted(list(reminders_by_user.get(user, {}).items()))
+        view = _user_views[user] = tuple(r for _, day in days for r in day)
+    return view
+
+
+def clear_user_reminders(user):
+    """Remove every reminder belonging to user"""
+    for day in reminders_by_user.pop(user, {}).values():
+        for r in day:
+            del reminders_by_id[r['id']]
+    reminder_counts.pop(user, None)
+    _user_views.pop(user, None)
 
 
 def apply_theme_to_window(window):
@@ -60,10 +224,21 @@ def apply_theme_to_window(window):
     window.configure(bg=COLORS['background'])
 
 
+# Screen size in pixels, asked from Tk once; it doesn't change while the app runs
+_SCREEN = [None, None]
+
+
+def screen_size(window):
+    """Return (width, height) of the screen, querying Tk only the first time"""
+    if _SCREEN[0] is None:
+        _SCREEN[0] = window.winfo_screenwidth()
+        _SCREEN[1] = window.winfo_screenheight()
+    return _SCREEN[0], _SCREEN[1]
+
+
 def center_window(window, width, height):
     """Center window on screen"""
-    screen_width = window.winfo_screenwidth()
-    screen_height = window.winfo_screenheight()
+    screen_width, screen_height = screen_size(window)
     x = (screen_width - width) // 2
     y = (screen_height - height) // 2
     # Adjust for taskbar
@@ -86,14 +261,17 @@ class EnhancedButton:
             'dark': COLORS['dark']
         }
 
+        # Default to primary color; the hover shade is worked out once here
+        base_color = color_map.get(button_type, COLORS['primary'])
+        hover_color = self.lighten_color(base_color)
+
         self.button = tk.Button(
             parent,
             text=text,
             command=command,
             width=width,
             height=height,
-            # Default to primary color
-            bg=color_map.get(button_type, COLORS['primary']),
+            bg=base_color,
             fg=COLORS['white'],  # White text
             font=FONTS['label'],
             relief='flat',  # Flat button style
@@ -102,11 +280,10 @@ class EnhancedButton:
 
         # Hover effects
         def on_enter(e):
-            self.button['bg'] = self.lighten_color(
-                color_map.get(button_type, COLORS['primary']))
+            self.button['bg'] = hover_color
 
         def on_leave(e):
-            self.button['bg'] = color_map.get(button_type, COLORS['primary'])
+            self.button['bg'] = base_color
 
         # Bind hover events to the button
         self.button.bind("<Enter>", on_enter)
@@ -118,7 +295,9 @@ class EnhancedButton:
     def grid(self, **kwargs):
         self.button.grid(**kwargs)
 
-    def lighten_color(self, hex_color, factor=0.1):
+    @staticmethod
+    @lru_cache(maxsize=32)  # Only a handful of button colors exist
+    def lighten_color(hex_color, factor=0.1):
         """Lighten a hex color"""
         hex_color = hex_color.lstrip('#')  # Remove '#' if present
         rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
@@ -142,20 +321,26 @@ class CalendarWidget:
             parent, bg=COLORS['white'], relief='raised', bd=2)
         self.create_calendar()
 
-    def get_date_reminder_info(self, check_date):
+    def _reminders_by_date(self):
+        """The current user's reminders keyed by date string"""
+        return reminders_by_user.get(self.current_user, {})
+
+    def get_date_reminder_info(self, check_date, by_date=None, today=None):
         """Get reminder information for a specific date"""
-        date_str = check_date.strftime("%Y-%m-%d")
-        today = date.today()
+        date_str = check_date.isoformat()
+        if today is None:
+            today = date.today()
 
-        # Get reminders for this date and user
-        date_reminders = [r for r in reminders
-                          if r.get('user') == self.current_user
-                          and r.get('date', today.strftime("%Y-%m-%d")) == date_str]
+        # Get reminders for this date and user; a calendar redraw passes in
+        # the user's index once instead of looking it up for every cell
+        if by_date is None:
+            by_date = self._reminders_by_date()
+        date_reminders = by_date.get(date_str, ())
 
         if not date_reminders:
             return None, 0, 0
 
-        completed = sum(1 for r in date_reminders if r.get('done', False))
+        completed = sum(1 for r in date_reminders if r['done'])
         pending = len(date_reminders) - completed
 
         if check_date < today and pending > 0:
@@ -170,130 +355,81 @@ class CalendarWidget:
             return None, pending, completed
 
     def create_calendar(self):
-        """Create the calendar interface with reminder indicators"""
-        # Clear existing widgets
-        for widget in self.frame.winfo_children():
-            widget.destroy()
+        """Create the calendar interface once; refresh_calendar fills in each month"""
+        # Colours and fonts used by many widgets below, looked up once
+        light_bg, white, header_bg = COLORS['light'], COLORS['white'], COLORS['calendar_header']
+        cell_font, tiny_font = FONTS['calendar'], FONTS['tiny']
 
         # Header with navigation
-        header_frame = tk.Frame(self.frame, bg=COLORS['calendar_header'])
+        header_frame = tk.Frame(self.frame, bg=header_bg)
         header_frame.pack(fill='x', padx=2, pady=2)
 
         tk.Button(header_frame, text="◀", command=self.prev_month,
-                  bg=COLORS['calendar_header'], fg=COLORS['white'],
-                  font=FONTS['calendar'], relief='flat', width=3).pack(side='left')
+                  bg=header_bg, fg=white,
+                  font=cell_font, relief='flat', width=3).pack(side='left')
 
-        month_label = tk.Label(header_frame,
-                               text=self.display_date.strftime("%B %Y"),
-                               bg=COLORS['calendar_header'], fg=COLORS['white'],
-                               font=FONTS['calendar_header'])
-        month_label.pack(expand=True)
+        self._month_label = tk.Label(header_frame,
+                                     bg=header_bg, fg=white,
+                                     font=FONTS['calendar_header'])
+        self._month_label.pack(expand=True)
 
         tk.Button(header_frame, text="▶", command=self.next_month,
-                  bg=COLORS['calendar_header'], fg=COLORS['white'],
-                  font=FONTS['calendar'], relief='flat', width=3).pack(side='right')
+                  bg=header_bg, fg=white,
+                  font=cell_font, relief='flat', width=3).pack(side='right')
 
         # Calendar grid with proper alignment
-        calendar_frame = tk.Frame(self.frame, bg=COLORS['white'])
+        calendar_frame = tk.Frame(self.frame, bg=white)
         calendar_frame.pack(fill='both', expand=True, padx=5, pady=5)
 
         # Days of week header
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        for col, day in enumerate(days):
-            tk.Label(calendar_frame, text=day, bg=COLORS['light'],
-                     font=FONTS['tiny'], width=5, height=1,
+        for col, day in enumerate(DAY_NAMES):
+            tk.Label(calendar_frame, text=day, bg=light_bg,
+                     font=tiny_font, width=5, height=1,
                      relief='solid', bd=1).grid(row=0, column=col, sticky='nsew')
 
-        # Get calendar data (starts from Monday)
-        cal_data = cal.monthcalendar(
-            self.display_date.year, self.display_date.month)
-
-        # Create calendar grid
-        for week_num, week in enumerate(cal_data):
-            for day_col, day_num in enumerate(week):
-                row = week_num + 1  # +1 because row 0 is headers
-
-                if day_num == 0:
-                    # Empty cell
-                    tk.Label(calendar_frame, text="", bg=COLORS['white'],
-                             width=5, height=2, relief='solid', bd=1).grid(
-                        row=row, column=day_col, sticky='nsew')
-                else:
-                    day_date = date(self.display_date.year,
-                                    self.display_date.month, day_num)
-
-                    # Get reminder info for this date
-                    reminder_type, pending_count, completed_count = self.get_date_reminder_info(
-                        day_date)
-
-                    # Determine button appearance
-                    if day_date == self.selected_date:
-                        # Selected date - always use selected color with white text
-                        bg_color = COLORS['calendar_selected']
-                        fg_color = COLORS['white']
-                        button_text = str(day_num)
-                    elif day_date == date.today():
-                        # Today - use today color but show reminder indicator
-                        bg_color = COLORS['calendar_today']
-                        fg_color = COLORS['dark']
-                        button_text = str(day_num)
-                        if reminder_type:
-                            button_text += f"\n•"  # Add dot indicator
-                    elif reminder_type == 'overdue':
-                        bg_color = COLORS['calendar_overdue']
-                        fg_color = COLORS['white']
-                        button_text = f"{day_num}\n{pending_count}!"
-                    elif reminder_type == 'both':
-                        bg_color = COLORS['calendar_has_both']
-                        fg_color = COLORS['white']
-                        button_text = f"{day_num}\n{pending_count}+{completed_count}"
-                    elif reminder_type == 'completed':
-                        bg_color = COLORS['calendar_has_completed']
-                        fg_color = COLORS['white']
-                        button_text = f"{day_num}\n✓{completed_count}"
-                    elif reminder_type == 'pending':
-                        bg_color = COLORS['calendar_has_reminders']
-                        fg_color = COLORS['white']
-                        button_text = f"{day_num}\n{pending_count}"
-                    else:
-                        # No reminders
-                        bg_color = COLORS['white']
-                        fg_color = COLORS['text']
-                        button_text = str(day_num)
-
-                    btn = tk.Button(calendar_frame, text=button_text,
-                                    bg=bg_color, fg=fg_color,
-                                    font=FONTS['calendar'], width=5, height=2,
-                                    relief='solid', bd=1,
-                                    command=lambda d=day_date: self.select_date(d))
-                    btn.grid(row=row, column=day_col, sticky='nsew')
+        # A fixed pool of 6 weeks x 7 day cells, reconfigured for each month
+        # instead of being destroyed and rebuilt on every navigation
+        self._calendar_frame = calendar_frame
+        self._day_cells = []
+        for week_num in range(6):
+            row_cells = []
+            for day_col in range(7):
+                btn = tk.Button(calendar_frame, font=cell_font, width=5, height=2,
+                                relief='solid', bd=1)
+                btn.grid(row=week_num + 1, column=day_col, sticky='nsew')  # +1 because row 0 is headers
+                # One command per cell for its lifetime; refresh_calendar sets _day
+                btn._day = None
+                btn._look = None  # (text, bg, fg, state) last applied to the cell
+                btn.config(command=lambda b=btn: self.select_date(b._day))
+                row_cells.append(btn)
+            self._day_cells.append(row_cells)
 
         # Configure grid weights for proper resizing
         for i in range(7):  # 7 columns
             calendar_frame.grid_columnconfigure(i, weight=1)
-        for i in range(len(cal_data) + 1):  # +1 for header row
-            calendar_frame.grid_rowconfigure(i, weight=1)
+        calendar_frame.grid_rowconfigure(0, weight=1)  # Week rows are set per month
+        self._shown_weeks = None  # Week rows currently gridded
 
         # Selected date display and legend
-        info_frame = tk.Frame(self.frame, bg=COLORS['light'])
+        info_frame = tk.Frame(self.frame, bg=light_bg)
         info_frame.pack(fill='x', padx=5, pady=5)
 
         # Selected date
-        selected_frame = tk.Frame(info_frame, bg=COLORS['light'])
+        selected_frame = tk.Frame(info_frame, bg=light_bg)
         selected_frame.pack(fill='x', pady=(0, 5))
 
         tk.Label(selected_frame, text="Selected Date:",
-                 font=FONTS['tiny'], bg=COLORS['light']).pack(side='left')
-        tk.Label(selected_frame, text=self.selected_date.strftime("%Y-%m-%d"),
-                 font=FONTS['label'], bg=COLORS['light'],
-                 fg=COLORS['success']).pack(side='right')
+                 font=tiny_font, bg=light_bg).pack(side='left')
+        self._selected_label = tk.Label(selected_frame, font=FONTS['label'], bg=light_bg,
+                                        fg=COLORS['success'])
+        self._selected_label.pack(side='right')
 
         # Legend
-        legend_frame = tk.Frame(info_frame, bg=COLORS['light'])
+        legend_frame = tk.Frame(info_frame, bg=light_bg)
         legend_frame.pack(fill='x')
 
         tk.Label(legend_frame, text="Legend:",
-                 font=FONTS['tiny'], bg=COLORS['light'], fg=COLORS['text']).pack(anchor='w')
+                 font=tiny_font, bg=light_bg, fg=COLORS['text']).pack(anchor='w')
 
         legend_items = [
             ("● Today", COLORS['calendar_today']),
@@ -307,22 +443,24 @@ class CalendarWidget:
             if i < 3:  # First row
                 row_frame = legend_frame if i == 0 else row_frame
                 if i == 0:
-                    row_frame = tk.Frame(legend_frame, bg=COLORS['light'])
+                    row_frame = tk.Frame(legend_frame, bg=light_bg)
                     row_frame.pack(fill='x')
             else:  # Second row
                 if i == 3:
-                    row_frame = tk.Frame(legend_frame, bg=COLORS['light'])
+                    row_frame = tk.Frame(legend_frame, bg=light_bg)
                     row_frame.pack(fill='x')
 
-            item_frame = tk.Frame(row_frame, bg=COLORS['light'])
+            item_frame = tk.Frame(row_frame, bg=light_bg)
             item_frame.pack(side='left', padx=5)
 
             color_label = tk.Label(item_frame, text="■ ", fg=color,
-                                   bg=COLORS['light'], font=FONTS['tiny'])
+                                   bg=light_bg, font=tiny_font)
             color_label.pack(side='left')
 
             tk.Label(item_frame, text=text.replace("● ", ""),
-                     font=FONTS['tiny'], bg=COLORS['light']).pack(side='left')
+                     font=tiny_font, bg=light_bg).pack(side='left')
+
+        self.refresh_calendar()
 
     def prev_month(self):
         """Go to previous month"""
@@ -332,7 +470,7 @@ class CalendarWidget:
         else:
             self.display_date = self.display_date.replace(
                 month=self.display_date.month-1)
-        self.create_calendar()
+        self.refresh_calendar()
 
     def next_month(self):
         """Go to next month"""
@@ -342,12 +480,12 @@ class CalendarWidget:
         else:
             self.display_date = self.display_date.replace(
                 month=self.display_date.month+1)
-        self.create_calendar()
+        self.refresh_calendar()
 
     def select_date(self, selected_date):
         """Select a date"""
         self.selected_date = selected_date
-        self.create_calendar()
+        self.refresh_calendar()
         if self.callback:
             self.callback(selected_date)
 
@@ -355,9 +493,78 @@ class CalendarWidget:
         """Get the currently selected date"""
         return self.selected_date
 
+    def reset(self):
+        """Go back to today's month with today selected"""
+        self.selected_date = date.today()
+        self.display_date = self.selected_date.replace(day=1)
+        self.refresh_calendar()
+
     def refresh_calendar(self):
         """Refresh calendar to update reminder indicators"""
-        self.create_calendar()
+        self._month_label.config(
+            text=f"{MONTH_NAMES[self.display_date.month]} {self.display_date.year}")
+        self._selected_label.config(text=self.selected_date.isoformat())
+
+        by_date = self._reminders_by_date()
+        today = date.today()
+        year, month = self.display_date.year, self.display_date.month
+
+        # Days of this month that have any reminders, found in one pass over
+        # the user's dates so the cell loop only tests set membership
+        prefix = f"{year:04d}-{month:02d}-"
+        marked_days = {int(d[8:10]) for d, rs in by_date.items()
+                       if rs and d.startswith(prefix)}
+
+        days = month_days(year, month)
+        for i, day_num in enumerate(days):
+            week_num, day_col = divmod(i, 7)
+            btn = self._day_cells[week_num][day_col]
+
+            if day_num == 0:
+                # Empty cell
+                look = ("", COLORS['white'], COLORS['text'], 'disabled')
+            else:
+                day_date = date(year, month, day_num)
+
+                # Get reminder info for this date
+                if day_num in marked_days:
+                    reminder_type, pending_count, completed_count = self.get_date_reminder_info(
+                        day_date, by_date, today)
+                else:
+                    reminder_type, pending_count, completed_count = None, 0, 0
+
+                # Determine button appearance
+                if day_date == self.selected_date:
+                    cell_state = 'selected'  # Always selected color with white text
+                elif day_date == today:
+                    # Today - use today color but show reminder indicator
+                    cell_state = 'today_marked' if reminder_type else 'today'
+                else:
+                    cell_state = reminder_type or 'none'
+                bg_color, fg_color, text_fmt = CALENDAR_CELL_STYLES[cell_state]
+                look = (text_fmt.format(n=day_num, p=pending_count, c=completed_count),
+                        bg_color, fg_color, 'normal')
+                btn._day = day_date
+
+            # Only cells whose appearance changed go back to Tk; selecting a
+            # date usually touches just the old and new selection
+            if look != btn._look:
+                btn._look = look
+                btn.config(text=look[0], bg=look[1], fg=look[2], state=look[3])
+
+        # Months span four to six weeks: show just the rows this one uses
+        weeks = len(days) // 7
+        if weeks != self._shown_weeks:
+            for week_num, row_cells in enumerate(self._day_cells):
+                shown = week_num < weeks
+                for btn in row_cells:
+                    if shown:
+                        btn.grid()
+                    else:
+                        btn.grid_remove()
+                self._calendar_frame.grid_rowconfigure(
+                    week_num + 1, weight=1 if shown else 0)  # +1 because row 0 is headers
+            self._shown_weeks = weeks
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
@@ -379,18 +586,37 @@ class ReminderApp:
         self.time_entry = None  # Entry for reminder time
         self.category_entry = None  # Entry for reminder category
         self.search_entry = None  # Entry for search
+        self._listbox_rows = []  # (reminder id, done, notified) of each listbox row, as shown
+        self.status_label = None  # Transient result line under the Add button
+        self._status_id = None  # Pending after() id that clears it
+        self._add_pending = False  # A Return-key add is queued for the next idle
+        self._search_pending = False  # A Return-key search is queued for the next idle
         self.calendar_widget = None  # Calendar widget
         self.date_entry = None  # Entry for reminder date
-        self.calendar_window = None  # Calendar popup window
+        self.calendar_window = None  # Date popup shared by the picker and the date filter
+        self._date_popup_prompt = None  # Its instruction label and confirm button
+        self._date_popup_confirm = None
+        self.calendar_view = None  # Calendar view window
+        self.calendar_view_widget = None  # Calendar widget in the calendar view
 
-        self.reminder_lock = threading.Lock()  # Lock for thread-safe reminder access
+        self.reminder_lock = _user_locks[self.current_user]  # Guards this user's reminders
         self.clock_running = True  # Flag to control clock thread
+        self._due_heap = []  # (due timestamp, reminder id) of reminders still to fire
+        self._wake = threading.Event()  # Wakes the reminder checker early
+        self._clock_id = None  # Pending after() id of the next clock tick
+        self._clock_date = None  # Date the cached clock date line belongs to
+        self._clock_date_str = ""
 
         print(f"Starting Enhanced Reminder App for user: {self.current_user}")
         self.show_reminder_interface()  # Start the main interface
 
     def show_reminder_interface(self):
         """Main Reminder App interface"""
+        # Colours and fonts used by many widgets below, looked up once
+        page_bg, light_bg, white_bg = COLORS['background'], COLORS['light'], COLORS['white']
+        text_fg = COLORS['text']
+        label_font, subheader_font = FONTS['label'], FONTS['subheader']
+
         try:
             # Create main window
             self.current_window = tk.Tk()
@@ -399,29 +625,28 @@ class ReminderApp:
             apply_theme_to_window(self.current_window)
             self.current_window.resizable(True, True)
             self.current_window.minsize(1000, 700)
-            screen_width = self.current_window.winfo_screenwidth()
-            screen_height = self.current_window.winfo_screenheight()
+            screen_width, screen_height = screen_size(self.current_window)
             window_width = min(1600, int(screen_width * 0.75))
             window_height = min(1000, int(screen_height * 0.8))
             center_window(self.current_window, window_width, window_height)
 
-            main_frame = tk.Frame(self.current_window, bg=COLORS['background'],
+            main_frame = tk.Frame(self.current_window, bg=page_bg,
                                   padx=30, pady=25)
             main_frame.pack(expand=True, fill='both')
 
             # Header
-            header_frame = tk.Frame(main_frame, bg=COLORS['background'])
+            header_frame = tk.Frame(main_frame, bg=page_bg)
             header_frame.pack(fill='x', pady=(0, 25))
 
-            user_frame = tk.Frame(header_frame, bg=COLORS['background'])
+            user_frame = tk.Frame(header_frame, bg=page_bg)
             user_frame.pack(fill='x', pady=(0, 10))
 
             title_label = tk.Label(user_frame, text="📅 Smart Reminder Assistant",
                                    font=("Segoe UI", 22, "bold"),
-                                   fg=COLORS['primary'], bg=COLORS['background'])
+                                   fg=COLORS['primary'], bg=page_bg)
             title_label.pack(side='left')
 
-            controls_frame = tk.Frame(user_frame, bg=COLORS['background'])
+            controls_frame = tk.Frame(user_frame, bg=page_bg)
             controls_frame.pack(side='right')
 
             EnhancedButton(controls_frame, text="📅 Calendar View",
@@ -433,67 +658,67 @@ class ReminderApp:
 
             welcome_label = tk.Label(header_frame, text=f"Welcome, {self.current_user}!",
                                      font=("Segoe UI", 14),
-                                     fg=COLORS['success'], bg=COLORS['background'])
+                                     fg=COLORS['success'], bg=page_bg)
             welcome_label.pack(pady=5)
 
             # Clock
-            clock_frame = tk.Frame(main_frame, bg=COLORS['white'], relief='raised',
+            clock_frame = tk.Frame(main_frame, bg=white_bg, relief='raised',
                                    bd=2, padx=20, pady=15)
             clock_frame.pack(fill='x', pady=10)
-            tk.Label(clock_frame, text="🕐 Current Time", font=FONTS['subheader'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack()
+            tk.Label(clock_frame, text="🕐 Current Time", font=subheader_font,
+                     bg=white_bg, fg=text_fg).pack()
             self.clock_label = tk.Label(clock_frame, font=("Segoe UI", 18, "bold"),
-                                        fg=COLORS['success'], bg=COLORS['white'])
+                                        fg=COLORS['success'], bg=white_bg)
             self.clock_label.pack(pady=5)
 
             # Input section
-            input_frame = tk.Frame(main_frame, bg=COLORS['white'], relief='raised',
+            input_frame = tk.Frame(main_frame, bg=white_bg, relief='raised',
                                    bd=2, padx=30, pady=25)
             input_frame.pack(fill='x', pady=15)
-            tk.Label(input_frame, text="➕ Create New Reminder", font=FONTS['subheader'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(pady=(0, 15))
-            input_grid = tk.Frame(input_frame, bg=COLORS['white'])
+            tk.Label(input_frame, text="➕ Create New Reminder", font=subheader_font,
+                     bg=white_bg, fg=text_fg).pack(pady=(0, 15))
+            input_grid = tk.Frame(input_frame, bg=white_bg)
             input_grid.pack(fill='x')
 
             # Reminder message
-            tk.Label(input_grid, text="*  Reminder Message:", bg=COLORS['white'],
-                     fg=COLORS['text'], font=FONTS['label']).grid(row=0, column=0,
+            tk.Label(input_grid, text="*  Reminder Message:", bg=white_bg,
+                     fg=text_fg, font=label_font).grid(row=0, column=0,
                                                                   padx=5, pady=8, sticky='w')
-            self.reminder_entry = tk.Entry(input_grid, font=FONTS['label'], width=35,
-                                           relief='solid', bd=1, bg=COLORS['light'])
+            self.reminder_entry = tk.Entry(input_grid, font=label_font, width=35,
+                                           relief='solid', bd=1, bg=light_bg)
             self.reminder_entry.grid(
                 row=0, column=1, padx=10, pady=8, sticky='ew')
 
             # Date selection
-            tk.Label(input_grid, text="*  Date (YYYY-MM-DD):", bg=COLORS['white'],
-                     fg=COLORS['text'], font=FONTS['label']).grid(row=1, column=0,
+            tk.Label(input_grid, text="*  Date (YYYY-MM-DD):", bg=white_bg,
+                     fg=text_fg, font=label_font).grid(row=1, column=0,
                                                                   padx=5, pady=8, sticky='w')
-            date_frame = tk.Frame(input_grid, bg=COLORS['white'])
+            date_frame = tk.Frame(input_grid, bg=white_bg)
             date_frame.grid(row=1, column=1, padx=10, pady=8, sticky='w')
 
-            self.date_entry = tk.Entry(date_frame, font=FONTS['label'], width=15,
-                                       relief='solid', bd=1, bg=COLORS['light'])
+            self.date_entry = tk.Entry(date_frame, font=label_font, width=15,
+                                       relief='solid', bd=1, bg=light_bg)
             self.date_entry.pack(side='left')
-            self.date_entry.insert(0, date.today().strftime("%Y-%m-%d"))
+            self.date_entry.insert(0, date.today().isoformat())
 
             EnhancedButton(date_frame, text="📅 Pick Date",
                            command=self.open_date_picker, button_type='info',
                            width=10, height=1).pack(side='left', padx=5)
 
             # Time selection
-            tk.Label(input_grid, text="*  Time (HH:MM:SS):", bg=COLORS['white'],
-                     fg=COLORS['text'], font=FONTS['label']).grid(row=2, column=0,
+            tk.Label(input_grid, text="*  Time (HH:MM:SS):", bg=white_bg,
+                     fg=text_fg, font=label_font).grid(row=2, column=0,
                                                                   padx=5, pady=8, sticky='w')
-            self.time_entry = tk.Entry(input_grid, font=FONTS['label'], width=20,
-                                       relief='solid', bd=1, bg=COLORS['light'])
+            self.time_entry = tk.Entry(input_grid, font=label_font, width=20,
+                                       relief='solid', bd=1, bg=light_bg)
             self.time_entry.grid(row=2, column=1, padx=10, pady=8, sticky='w')
 
             # Category
-            tk.Label(input_grid, text="*  Category:", bg=COLORS['white'],
-                     fg=COLORS['text'], font=FONTS['label']).grid(row=3, column=0,
+            tk.Label(input_grid, text="*  Category:", bg=white_bg,
+                     fg=text_fg, font=label_font).grid(row=3, column=0,
                                                                   padx=5, pady=8, sticky='w')
-            self.category_entry = tk.Entry(input_grid, font=FONTS['label'], width=25,
-                                           relief='solid', bd=1, bg=COLORS['light'])
+            self.category_entry = tk.Entry(input_grid, font=label_font, width=25,
+                                           relief='solid', bd=1, bg=light_bg)
             self.category_entry.grid(
                 row=3, column=1, padx=10, pady=8, sticky='w')
 
@@ -501,19 +726,22 @@ class ReminderApp:
 
             EnhancedButton(input_frame, text="➕ Add Reminder",
                            command=self.add_reminder, button_type='success',
-                           width=20, height=2).pack(pady=15)
+                           width=20, height=2).pack(pady=(15, 0))
+            self.status_label = tk.Label(input_frame, text="", font=FONTS['tiny'],
+                                         bg=white_bg, fg=COLORS['success'])
+            self.status_label.pack(pady=(5, 0))
 
             # Search section
-            search_frame = tk.Frame(main_frame, bg=COLORS['light'], relief='raised',
+            search_frame = tk.Frame(main_frame, bg=light_bg, relief='raised',
                                     bd=1, padx=20, pady=15)
             search_frame.pack(fill='x', pady=10)
-            search_controls = tk.Frame(search_frame, bg=COLORS['light'])
+            search_controls = tk.Frame(search_frame, bg=light_bg)
             search_controls.pack(fill='x')
 
-            tk.Label(search_controls, text="🔍 Search (Only) Category/Message:", bg=COLORS['light'],
-                     fg=COLORS['text'], font=FONTS['label']).pack(side='left', padx=5)
-            self.search_entry = tk.Entry(search_controls, font=FONTS['label'], width=30,
-                                         relief='solid', bd=1, bg=COLORS['white'])
+            tk.Label(search_controls, text="🔍 Search (Only) Category/Message:", bg=light_bg,
+                     fg=text_fg, font=label_font).pack(side='left', padx=5)
+            self.search_entry = tk.Entry(search_controls, font=label_font, width=30,
+                                         relief='solid', bd=1, bg=white_bg)
             self.search_entry.pack(side='left', padx=10)
             EnhancedButton(search_controls, text="🔍 Search",
                            command=self.search_reminders, button_type='info',
@@ -530,15 +758,15 @@ class ReminderApp:
 
             # Reminder list
             list_frame = tk.Frame(
-                main_frame, bg=COLORS['white'], relief='raised', bd=2)
+                main_frame, bg=white_bg, relief='raised', bd=2)
             list_frame.pack(fill='both', expand=True, pady=15)
-            tk.Label(list_frame, text="📝 Your Reminders", font=FONTS['subheader'],
-                     bg=COLORS['white'], fg=COLORS['text']).pack(pady=15)
-            listbox_frame = tk.Frame(list_frame, bg=COLORS['white'])
+            tk.Label(list_frame, text="📝 Your Reminders", font=subheader_font,
+                     bg=white_bg, fg=text_fg).pack(pady=15)
+            listbox_frame = tk.Frame(list_frame, bg=white_bg)
             listbox_frame.pack(fill='both', expand=True, padx=15, pady=(0, 15))
-            self.reminder_listbox = tk.Listbox(listbox_frame, font=FONTS['label'],
-                                               height=10, bg=COLORS['light'],
-                                               fg=COLORS['text'], relief='solid', bd=1)
+            self.reminder_listbox = tk.Listbox(listbox_frame, font=label_font,
+                                               height=10, bg=light_bg,
+                                               fg=text_fg, relief='solid', bd=1)
             scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL,
                                      command=self.reminder_listbox.yview)
             self.reminder_listbox.configure(yscrollcommand=scrollbar.set)
@@ -546,7 +774,7 @@ class ReminderApp:
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
             # Action buttons
-            btn_frame = tk.Frame(main_frame, bg=COLORS['background'])
+            btn_frame = tk.Frame(main_frame, bg=page_bg)
             btn_frame.pack(pady=20)
             EnhancedButton(btn_frame, text="✅ Mark Done",
                            command=self.mark_reminder_done, button_type='success',
@@ -564,12 +792,12 @@ class ReminderApp:
             self.update_reminder_clock()
 
             # Key bindings
-            self.reminder_entry.bind('<Return>', lambda e: self.add_reminder())
-            self.time_entry.bind('<Return>', lambda e: self.add_reminder())
-            self.category_entry.bind('<Return>', lambda e: self.add_reminder())
-            self.date_entry.bind('<Return>', lambda e: self.add_reminder())
+            self.reminder_entry.bind('<Return>', lambda e: self._schedule_add())
+            self.time_entry.bind('<Return>', lambda e: self._schedule_add())
+            self.category_entry.bind('<Return>', lambda e: self._schedule_add())
+            self.date_entry.bind('<Return>', lambda e: self._schedule_add())
             self.search_entry.bind(
-                '<Return>', lambda e: self.search_reminders())
+                '<Return>', lambda e: self._schedule_search())
 
             self.current_window.protocol(
                 "WM_DELETE_WINDOW", self.back_to_main_menu)
@@ -579,35 +807,59 @@ class ReminderApp:
             messagebox.showerror(
                 "Error", f"Failed to create reminder app: {str(e)}")
 
+    def _reopen_popup(self, window, cal_widget):
+        """Show a popup kept from an earlier call again, reset to today"""
+        if not (window and window.winfo_exists()):
+            return False
+        if window.state() == 'withdrawn':
+            cal_widget.reset()
+            window.deiconify()
+        window.lift()
+        return True
+
+    def _open_date_popup(self, title, prompt, confirm_text, on_confirm):
+        """Show the date popup shared by the date picker and the date filter"""
+        # One popup and calendar serve both uses: it is built once, hidden on
+        # confirm/cancel, and only relabelled and reset when shown again
+        if not self._reopen_popup(self.calendar_window, self.calendar_widget):
+            self.calendar_window = tk.Toplevel(self.current_window)
+            apply_theme_to_window(self.calendar_window)
+            center_window(self.calendar_window, 450, 600)
+            self.calendar_window.resizable(False, False)
+            self.calendar_window.protocol(
+                "WM_DELETE_WINDOW", self.calendar_window.withdraw)
+
+            # Instructions
+            self._date_popup_prompt = tk.Label(self.calendar_window,
+                                               font=FONTS['subheader'], bg=COLORS['background'],
+                                               fg=COLORS['text'])
+            self._date_popup_prompt.pack(pady=10)
+
+            # Calendar widget with current user context (past dates allowed for filtering)
+            self.calendar_widget = CalendarWidget(self.calendar_window,
+                                                  callback=self.on_date_selected,
+                                                  current_user=self.current_user)
+            self.calendar_widget.pack(padx=10, pady=10, fill='both', expand=True)
+
+            # Buttons
+            btn_frame = tk.Frame(self.calendar_window, bg=COLORS['background'])
+            btn_frame.pack(fill='x', padx=10, pady=10)
+
+            self._date_popup_confirm = EnhancedButton(btn_frame, button_type='success',
+                                                      width=12, height=1)
+            self._date_popup_confirm.pack(side='right', padx=5)
+            EnhancedButton(btn_frame, text="❌ Cancel",
+                           command=self.calendar_window.withdraw, button_type='danger',
+                           width=12, height=1).pack(side='right', padx=5)
+
+        self.calendar_window.title(title)
+        self._date_popup_prompt.config(text=prompt)
+        self._date_popup_confirm.button.config(text=confirm_text, command=on_confirm)
+
     def open_date_picker(self):
         """Open date picker window"""
-        # If already open, bring to front
-        if self.calendar_window and self.calendar_window.winfo_exists():
-            self.calendar_window.lift()
-            return
-
-        self.calendar_window = tk.Toplevel(self.current_window)
-        self.calendar_window.title("📅 Select Date")
-        apply_theme_to_window(self.calendar_window)
-        center_window(self.calendar_window, 450, 550)
-        self.calendar_window.resizable(False, False)
-
-        # Calendar widget with current user context
-        self.calendar_widget = CalendarWidget(self.calendar_window,
-                                              callback=self.on_date_selected,
-                                              current_user=self.current_user)
-        self.calendar_widget.pack(padx=10, pady=10, fill='both', expand=True)
-
-        # Buttons
-        btn_frame = tk.Frame(self.calendar_window, bg=COLORS['background'])
-        btn_frame.pack(fill='x', padx=10, pady=10)
-
-        EnhancedButton(btn_frame, text="✅ Select",
-                       command=self.confirm_date_selection, button_type='success',
-                       width=12, height=1).pack(side='right', padx=5)
-        EnhancedButton(btn_frame, text="❌ Cancel",
-                       command=self.calendar_window.destroy, button_type='danger',
-                       width=12, height=1).pack(side='right', padx=5)
+        self._open_date_popup("📅 Select Date", "Select a date for the reminder:",
+                              "✅ Select", self.confirm_date_selection)
 
     def on_date_selected(self, selected_date):
         """Handle date selection from calendar"""
@@ -618,15 +870,20 @@ class ReminderApp:
         if self.calendar_widget:
             selected_date = self.calendar_widget.get_selected_date()
             self.date_entry.delete(0, tk.END)
-            self.date_entry.insert(0, selected_date.strftime("%Y-%m-%d"))
-            self.calendar_window.destroy()
+            self.date_entry.insert(0, selected_date.isoformat())
+            self.calendar_window.withdraw()
 
     def show_calendar_view(self):
         """Show calendar view with reminders in table format"""
-        calendar_view = tk.Toplevel(self.current_window)
+        if self._reopen_popup(self.calendar_view, self.calendar_view_widget):
+            self.show_date_reminders(date.today())
+            return
+
+        self.calendar_view = calendar_view = tk.Toplevel(self.current_window)
         calendar_view.title("📅 Calendar View - Your Reminders")
         apply_theme_to_window(calendar_view)
         center_window(calendar_view, 1200, 800)
+        calendar_view.protocol("WM_DELETE_WINDOW", calendar_view.withdraw)
 
         main_frame = tk.Frame(
             calendar_view, bg=COLORS['background'], padx=20, pady=20)
@@ -640,8 +897,8 @@ class ReminderApp:
                  bg=COLORS['background'], fg=COLORS['primary']).pack(pady=(0, 10))
 
         # Calendar widget with current user context
-        cal_widget = CalendarWidget(main_frame, callback=self.show_date_reminders,
-                                    current_user=self.current_user)
+        self.calendar_view_widget = cal_widget = CalendarWidget(
+            main_frame, callback=self.show_date_reminders, current_user=self.current_user)
         cal_widget.pack(side='top', fill='x', pady=(0, 20))
 
         # Reminders for selected date in table format
@@ -685,26 +942,17 @@ class ReminderApp:
         self.date_reminders_label.pack(pady=5)
 
         # Show today's reminders initially
-        today = date.today()
-        self.show_date_reminders(today)
-        self.date_reminders_label.config(
-            text=f"Reminders for {today.strftime('%Y-%m-%d')}")
+        self.show_date_reminders(date.today())
 
     def show_date_reminders(self, selected_date):
         """Show reminders for a specific date in table format"""
         if hasattr(self, 'date_reminders_tree'):
-            # Clear existing items
-            for item in self.date_reminders_tree.get_children():
-                self.date_reminders_tree.delete(item)
-
-            self.date_reminders_label.config(
-                text=f"Reminders for {selected_date.strftime('%Y-%m-%d')}")
+            # Clear existing items in one call
+            self.date_reminders_tree.delete(*self.date_reminders_tree.get_children())
 
-            date_str = selected_date.strftime("%Y-%m-%d")
-            with self.reminder_lock:
-                date_reminders = [r for r in reminders
-                                  if r.get('user') == self.current_user
-                                  and r.get('date', date.today().strftime("%Y-%m-%d")) == date_str]
+            date_str = selected_date.isoformat()
+            self.date_reminders_label.config(text=f"Reminders for {date_str}")
+            date_reminders = reminders_by_user.get(self.current_user, {}).get(date_str, ())
 
             if not date_reminders:
                 # Add a placeholder row
@@ -712,76 +960,43 @@ class ReminderApp:
                     "No reminders", "", "", "for this date", ""))
                 return
 
-            for r in date_reminders:
-                status = "✅" if r["done"] else (
-                    "📢" if r.get("notified") else "⏰")
-                category = r.get('category', 'General')
-                reminder_date = r.get(
-                    'date', date.today().strftime("%Y-%m-%d"))
-
-                self.date_reminders_tree.insert("", "end", values=(
-                    category,
-                    reminder_date,
-                    r['time'],
-                    r['text'],
-                    status
-                ))
+            # Build every row first so the inserts run back to back and Tk
+            # redraws the tree once when it next goes idle
+            rows = [(r['category'],
+                     r['date'],
+                     r['time'],
+                     r['text'],
+                     "✅" if r["done"] else ("📢" if r["notified"] else "⏰"))
+                    for r in date_reminders]
+            insert = self.date_reminders_tree.insert
+            for values in rows:
+                insert("", "end", values=values)
 
     def filter_by_date(self):
         """Open date picker to filter reminders by selected date"""
-        filter_window = tk.Toplevel(self.current_window)
-        filter_window.title("📅 Filter Reminders by Date")
-        apply_theme_to_window(filter_window)
-        center_window(filter_window, 450, 600)
-        filter_window.resizable(False, False)
-
-        # Instructions
-        tk.Label(filter_window, text="Select a date to view reminders:",
-                 font=FONTS['subheader'], bg=COLORS['background'],
-                 fg=COLORS['text']).pack(pady=10)
-
-        # Calendar widget for filtering with current user context (allow past dates for viewing)
-        filter_calendar = CalendarWidget(
-            filter_window, current_user=self.current_user)
-        filter_calendar.pack(padx=10, pady=10, fill='both', expand=True)
-
-        # Buttons
-        btn_frame = tk.Frame(filter_window, bg=COLORS['background'])
-        btn_frame.pack(fill='x', padx=10, pady=10)
-
-        def apply_date_filter():
-            selected_date = filter_calendar.get_selected_date()
-            date_str = selected_date.strftime("%Y-%m-%d")
+        self._open_date_popup("📅 Filter Reminders by Date", "Select a date to view reminders:",
+                              "✅ Apply Filter", self.apply_date_filter)
 
-            with self.reminder_lock:
-                date_reminders = [r for r in reminders
-                                  if r.get('user') == self.current_user
-                                  and r.get('date', date.today().strftime("%Y-%m-%d")) == date_str]
+    def apply_date_filter(self):
+        """Show the reminders for the date chosen in the filter popup"""
+        selected_date = self.calendar_widget.get_selected_date()
+        date_str = selected_date.isoformat()
 
-            self.update_reminder_listbox(date_reminders)
+        date_reminders = reminders_by_user.get(self.current_user, {}).get(date_str, ())
 
-            # Update search entry to show current filter
-            self.search_entry.delete(0, tk.END)
-            self.search_entry.insert(0, f"Date: {date_str}")
+        self.update_reminder_listbox(date_reminders)
 
-            messagebox.showinfo("Date Filter Applied",
-                                f"📅 Showing {len(date_reminders)} reminder(s) for {date_str}")
-            filter_window.destroy()
+        # Update search entry to show current filter
+        self.search_entry.delete(0, tk.END)
+        self.search_entry.insert(0, f"Date: {date_str}")
 
-        EnhancedButton(btn_frame, text="✅ Apply Filter",
-                       command=apply_date_filter, button_type='success',
-                       width=12, height=1).pack(side='right', padx=5)
-        EnhancedButton(btn_frame, text="❌ Cancel",
-                       command=filter_window.destroy, button_type='danger',
-                       width=12, height=1).pack(side='right', padx=5)
+        self._show_status(f"📅 Showing {len(date_reminders)} reminder(s) for {date_str}")
+        self.calendar_window.withdraw()
 
     def show_todays_reminders(self):
         """Filter and show today's reminders"""
-        today_str = date.today().strftime("%Y-%m-%d")
-        with self.reminder_lock:
-            today_reminders = [r for r in reminders
-                               if r.get('user') == self.current_user
-                               and r.get('date', today_str) == today_str]
+        today_str = date.today().isoformat()
+        today_reminders = reminders_by_user.get(self.current_user, {}).get(today_str, ())
 
         self.update_reminder_listbox(today_reminders)
 
@@ -789,11 +1004,77 @@ class ReminderApp:
         self.search_entry.delete(0, tk.END)
         self.search_entry.insert(0, f"Today: {today_str}")
 
-        messagebox.showinfo(
-            "Today's Reminders", f"📅 Showing {len(today_reminders)} reminder(s) for today")
+        self._show_status(f"📅 Showing {len(today_reminders)} reminder(s) for today")
+
+    @staticmethod
+    def _validate_reminder(parsed_date, parsed_time, now):
+        """Error message for a reminder date/time in the past, or None"""
+        current_date = now.date()
+        current_time = now.time()
+
+        # Validation 1: Check if date is in the past
+        if parsed_date < current_date:
+            return (f"❌ Cannot create reminder for past date!\n\n"
+                    f"Selected date: {parsed_date.isoformat()}\n"
+                    f"Current date: {current_date.isoformat()}\n\n"
+                    f"Please select today's date or a future date.")
+
+        # Validation 2: Check if it's today but time is in the past
+        if parsed_date == current_date and parsed_time <= current_time:
+            # Add a small buffer (1 minute) to allow for immediate reminders
+            buffer_time = (now + timedelta(minutes=1)).time()
+            return (f"❌ Cannot create reminder for past time!\n\n"
+                    f"Selected time: {parsed_time.strftime('%H:%M:%S')}\n"
+                    f"Current time: {current_time.strftime('%H:%M:%S')}\n\n"
+                    f"For today's date, please set time to at least {buffer_time.strftime('%H:%M:%S')} or later.")
+        return None
+
+    def _show_status(self, text):
+        """Show a short result line under the Add button, cleared after 2 seconds"""
+        if self._status_id is not None:
+            self.current_window.after_cancel(self._status_id)
+        self.status_label.config(text=text)
+        self._status_id = self.current_window.after(2000, self._clear_status)
+
+    def _clear_status(self):
+        """Clear the result line under the Add button"""
+        self._status_id = None
+        self.status_label.config(text="")
+
+    def _schedule_add(self):
+        """Queue one Return-key add; repeats before it runs are dropped"""
+        if self._add_pending:
+            return
+        self._add_pending = True
+        self.current_window.after_idle(self._do_add)
 
-    def add_reminder(self):
-        """Add a new reminder with date support and past date/time validation"""
+    def _do_add(self):
+        """Run the queued Return-key add"""
+        try:
+            self.add_reminder(quiet=True)
+        finally:
+            self._add_pending = False
+
+    def _schedule_search(self):
+        """Queue one Return-key search; repeats before it runs are dropped"""
+        if self._search_pending:
+            return
+        self._search_pending = True
+        self.current_window.after_idle(self._do_search)
+
+    def _do_search(self):
+        """Run the queued Return-key search"""
+        try:
+            self.search_reminders()
+        finally:
+            self._search_pending = False
+
+    def add_reminder(self, quiet=False):
+        """Add a new reminder with date support and past date/time validation
+
+        quiet reports success in the status line instead of a dialog, for
+        adds made with the Return key.
+        """
         try:
             text = self.reminder_entry.get().strip()
             reminder_time = self.time_entry.get().strip()
@@ -805,41 +1086,29 @@ class ReminderApp:
                     "Warning", "Reminder message, date, and time are all required!")
                 return
 
+            bad_field = "date"  # Which entry a ValueError below is about
             try:
-                # Validate date format
-                parsed_date = datetime.strptime(
-                    reminder_date, "%Y-%m-%d").date()
-                # Validate time format
-                parsed_time = datetime.strptime(
-                    reminder_time, "%H:%M:%S").time()
+                # Validate date and time format (YYYY-MM-DD and HH:MM:SS, as before)
+                parsed_date = parse_reminder_date(reminder_date)
+                bad_field = "time"
+                parsed_time = parse_reminder_time(reminder_time)
+                bad_field = None
+
+                # Store the canonical forms the reminder checker compares against
+                reminder_date = parsed_date.isoformat()
+                reminder_time = parsed_time.strftime("%H:%M:%S")
 
                 # Get current date and time
                 current_datetime = datetime.now()
                 current_date = current_datetime.date()
-                current_time = current_datetime.time()
 
                 # Create the full reminder datetime for comparison
                 reminder_datetime = datetime.combine(parsed_date, parsed_time)
 
-                # Validation 1: Check if date is in the past
-                if parsed_date < current_date:
-                    messagebox.showerror("Invalid Date",
-                                         f"❌ Cannot create reminder for past date!\n\n"
-                                         f"Selected date: {reminder_date}\n"
-                                         f"Current date: {current_date.strftime('%Y-%m-%d')}\n\n"
-                                         f"Please select today's date or a future date.")
-                    return
-
-                # Validation 2: Check if it's today but time is in the past
-                elif parsed_date == current_date and parsed_time <= current_time:
-                    # Add a small buffer (1 minute) to allow for immediate reminders
-                    buffer_time = (current_datetime +
-                                   timedelta(minutes=1)).time()
-                    messagebox.showerror("Invalid Time",
-                                         f"❌ Cannot create reminder for past time!\n\n"
-                                         f"Selected time: {reminder_time}\n"
-                                         f"Current time: {current_time.strftime('%H:%M:%S')}\n\n"
-                                         f"For today's date, please set time to at least {buffer_time.strftime('%H:%M:%S')} or later.")
+                # Past date/time checks report one error, in one dialog
+                err = self._validate_reminder(parsed_date, parsed_time, current_datetime)
+                if err:
+                    messagebox.showerror("Invalid Reminder", err)
                     return
 
                 # Validation 3: Check if the reminder datetime is too far in the future (optional - prevents accidental entries)
@@ -855,17 +1124,23 @@ class ReminderApp:
                         return
 
                 # All validations passed - create the reminder
+                new_reminder = {
+                    "text": text,
+                    "time": reminder_time,
+                    "date": reminder_date,
+                    "category": category if category else "General",
+                    "done": False,
+                    "notified": False,
+                    "created": current_datetime.strftime("%Y-%m-%d %H:%M"),
+                    "user": self.current_user,
+                    # Due time as epoch seconds, parsed once here for sorting
+                    # and for the checker's heap
+                    "due": reminder_datetime.timestamp()
+                }
                 with self.reminder_lock:
-                    reminders.append({
-                        "text": text,
-                        "time": reminder_time,
-                        "date": reminder_date,
-                        "category": category if category else "General",
-                        "done": False,
-                        "notified": False,
-                        "created": datetime.now().strftime("%Y-%m-%d %H:%M"),
-                        "user": self.current_user
-                    })
+                    add_reminder(new_reminder)
+                    heapq.heappush(self._due_heap, (new_reminder['due'], new_reminder['id']))
+                self._wake.set()  # It may be due before the checker's next wake-up
 
                 self.update_reminder_listbox()  # Refresh listbox
                 self.reminder_entry.delete(0, tk.END)  # Clear message entry
@@ -881,19 +1156,11 @@ class ReminderApp:
                         pass
 
                 # Show success message with time until reminder
-                time_until = reminder_datetime - current_datetime
-                if time_until.days > 0:
-                    time_desc = f"in {time_until.days} day(s)"
-                elif time_until.seconds > 3600:
-                    hours = time_until.seconds // 3600
-                    minutes = (time_until.seconds % 3600) // 60
-                    time_desc = f"in {hours} hour(s) and {minutes} minute(s)"
-                elif time_until.seconds > 60:
-                    minutes = time_until.seconds // 60
-                    time_desc = f"in {minutes} minute(s)"
-                else:
-                    time_desc = "very soon"
+                time_desc = describe_time_until(reminder_datetime - current_datetime)
 
+                if quiet:
+                    self._show_status(f"✅ Reminder added for {reminder_date} {reminder_time} ({time_desc})")
+                    return
                 messagebox.showinfo("Success", f"✅ Reminder added successfully!\n\n"
                                     f"📝 Message: {text}\n"
                                     f"📅 Date: {reminder_date}\n"
@@ -901,8 +1168,8 @@ class ReminderApp:
                                     f"📂 Category: {category if category else 'General'}\n"
                                     f"⏳ Reminder will trigger {time_desc}")
 
-            except ValueError as ve:
-                if "time" in str(ve).lower():
+            except ValueError:
+                if bad_field == "time":
                     messagebox.showerror("Error",
                                          "❌ Invalid time format!\n\n"
                                          "Time must be in HH:MM:SS format\n"
@@ -921,37 +1188,54 @@ class ReminderApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add reminder: {str(e)}")
 
+    @staticmethod
+    def _row_text(r):
+        """Listbox text for a reminder"""
+        return format_reminder_row(r['category'], r['text'], r['date'], r['time'],
+                                   r["done"], r["notified"])
+
     def update_reminder_listbox(self, filtered=None):
         """Refresh reminder listbox with date information"""
         try:
-            self.reminder_listbox.delete(0, tk.END)
-            with self.reminder_lock:
-                items = filtered if filtered is not None else reminders.copy()
-
-            user_reminders = [r for r in items if r.get(
-                'user') == self.current_user]
-            if not user_reminders:
-                self.reminder_listbox.insert(
-                    tk.END, "🔭 No reminders yet. Add your first reminder above!")
-                return
-
-            # Sort reminders by date and time
-            user_reminders.sort(key=lambda x: (
-                x.get('date', date.today().strftime("%Y-%m-%d")),
-                x['time']
-            ))
-
-            for r in user_reminders:
-                category_text = f"[{r['category']}] " if r.get(
-                    'category') else ""
-                date_text = r.get('date', date.today().strftime("%Y-%m-%d"))
-                status_text = " ✅ [COMPLETED]" if r["done"] else (
-                    " 📢 [NOTIFIED]" if r.get("notified", False) else "")
-                display_text = f"{category_text}{r['text']} - {date_text} at {r['time']}{status_text}"
-                self.reminder_listbox.insert(tk.END, display_text)
+            if filtered is not None:
+                # Callers already pass only this user's reminders, in date
+                # and time order (a day's list or a subset of user_reminders)
+                mine = filtered
+            else:
+                # The running count answers "nothing to show" without a lookup
+                mine = user_reminders(self.current_user) if reminder_counts.get(self.current_user) else ()
+            if mine:
+                # A row is identified by what its text depends on, so text is
+                # only rendered for the rows that actually get inserted
+                rows = [(r['id'], r["done"], r["notified"]) for r in mine]
+                row_text = self._row_text
+                self._show_rows(rows, lambda lo, hi: [row_text(r) for r in mine[lo:hi]])
+            else:
+                self._show_rows([(None, None, None)],
+                                lambda lo, hi: ["🔭 No reminders yet. Add your first reminder above!"])
         except Exception as e:
             print(f"Error updating listbox: {e}")
 
+    def _show_rows(self, rows, render):
+        """Bring the listbox to rows, rendering text only for the run that differs"""
+        old = self._listbox_rows
+        # Rows that match at the start and at the end stay in the listbox, so
+        # adding, deleting or marking one reminder touches about one row
+        limit = min(len(old), len(rows))
+        head = 0
+        while head < limit and old[head] == rows[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == rows[-1 - tail]:
+            tail += 1
+
+        if len(old) - tail > head:
+            self.reminder_listbox.delete(head, len(old) - tail - 1)
+        if len(rows) - tail > head:
+            # render(lo, hi) gives the text of rows[lo:hi]
+            self.reminder_listbox.insert(head, *render(head, len(rows) - tail))
+        self._listbox_rows = rows
+
     def search_reminders(self):
         """Search reminders including date"""
         try:
@@ -960,14 +1244,8 @@ class ReminderApp:
                 self.update_reminder_listbox()
                 return
 
-            with self.reminder_lock:
-                user_reminders = [r for r in reminders if r.get(
-                    'user') == self.current_user]
-                filtered = [r for r in user_reminders if
-                            keyword in r["text"].lower() or
-                            keyword in r.get("category", "").lower() or
-                            keyword in r["time"] or
-                            keyword in r.get("date", "")]
+            filtered = [r for r in user_reminders(self.current_user)
+                        if keyword in r["search_text"]]
 
             self.update_reminder_listbox(filtered)
             if not filtered:
@@ -982,15 +1260,19 @@ class ReminderApp:
         try:
             self.search_entry.delete(0, tk.END)
             self.update_reminder_listbox()
-            with self.reminder_lock:
-                user_reminders = [r for r in reminders if r.get(
-                    'user') == self.current_user]
+            count = reminder_counts.get(self.current_user, 0)
             messagebox.showinfo(
-                "All Reminders", f"📋 Showing all {len(user_reminders)} reminder(s)")
+                "All Reminders", f"📋 Showing all {count} reminder(s)")
         except Exception as e:
             messagebox.showerror(
                 "Error", f"Failed to show all reminders: {str(e)}")
 
+    def _selected_reminder(self, index):
+        """The reminder shown on a listbox row, or None for the placeholder row"""
+        if index < len(self._listbox_rows):
+            return reminders_by_id.get(self._listbox_rows[index][0])
+        return None
+
     def mark_reminder_done(self):
         """Mark selected reminder as done"""
         try:
@@ -999,15 +1281,11 @@ class ReminderApp:
                 messagebox.showinfo(
                     "Info", "Please select a reminder to mark as done.")
                 return
-            selected_text = self.reminder_listbox.get(selected[0])
             with self.reminder_lock:
-                for r in reminders:
-                    if (r['user'] == self.current_user
-                        and r['text'] in selected_text
-                        and r['time'] in selected_text
-                            and r.get('date', date.today().strftime("%Y-%m-%d")) in selected_text):
-                        r["done"] = True
-                        break
+                r = self._selected_reminder(selected[0])
+                if r is None:
+                    return
+                r["done"] = True
             self.update_reminder_listbox()
 
             # Refresh any open calendar widgets to update colors
@@ -1029,22 +1307,27 @@ class ReminderApp:
                 messagebox.showinfo(
                     "Info", "Please select a reminder to delete.")
                 return
-            selected_text = self.reminder_listbox.get(selected[0])
             with self.reminder_lock:
-                for r in reminders:
-                    if (r['user'] == self.current_user
-                        and r['text'] in selected_text
-                        and r['time'] in selected_text
-                            and r.get('date', date.today().strftime("%Y-%m-%d")) in selected_text):
-                        result = messagebox.askyesno("Confirm Deletion",
-                                                     f"Are you sure you want to delete this reminder?\n\n"
-                                                     f"📝 {r['text']}\n"
-                                                     f"📅 {r.get('date', 'Today')}\n"
-                                                     f"⏰ {r['time']}\n"
-                                                     f"📂 {r.get('category', 'General')}")
-                        if result:
-                            reminders.remove(r)
-                            break
+                match = self._selected_reminder(selected[0])
+                snapshot = dict(match) if match else None
+            if snapshot is None:
+                return
+
+            # Ask from a copy without holding the lock so the reminder checker
+            # keeps running while the dialog is open
+            result = messagebox.askyesno("Confirm Deletion",
+                                         f"Are you sure you want to delete this reminder?\n\n"
+                                         f"📝 {snapshot['text']}\n"
+                                         f"📅 {snapshot['date']}\n"
+                                         f"⏰ {snapshot['time']}\n"
+                                         f"📂 {snapshot['category']}")
+            if not result:
+                return
+            with self.reminder_lock:
+                # Look it up again; it may have gone while the dialog was open
+                match = reminders_by_id.get(snapshot['id'])
+                if match:
+                    remove_reminder(match)
             self.update_reminder_listbox()
 
             # Refresh any open calendar widgets to update colors
@@ -1062,24 +1345,22 @@ class ReminderApp:
     def clear_all_reminders(self):
         """Clear all reminders for current user"""
         try:
-            with self.reminder_lock:
-                user_reminders = [r for r in reminders if r.get(
-                    'user') == self.current_user]
+            count = reminder_counts.get(self.current_user, 0)
 
-            if not user_reminders:
+            if not count:
                 messagebox.showinfo("Info", "No reminders to clear.")
                 return
 
             result = messagebox.askyesno(
                 "Confirm Clear All",
                 f"Are you sure you want to clear all your reminders?\n\n"
-                f"This will delete {len(user_reminders)} reminder(s).\n"
+                f"This will delete {count} reminder(s).\n"
                 f"This action cannot be undone!"
             )
             if result:
                 with self.reminder_lock:
-                    reminders[:] = [r for r in reminders if r.get(
-                        'user') != self.current_user]
+                    clear_user_reminders(self.current_user)
+                format_reminder_row.cache_clear()
                 self.update_reminder_listbox()
 
                 # Refresh any open calendar widgets to update colors
@@ -1097,100 +1378,111 @@ class ReminderApp:
     def update_reminder_clock(self):
         """Update the live clock label every second"""
         try:
-            if (self.clock_running and
-                hasattr(self, 'clock_label') and
-                self.clock_label and
-                self.clock_label.winfo_exists() and
-                self.current_window and
-                    self.current_window.winfo_exists()):
-
+            self._clock_id = None
+            if self.clock_running and self.clock_label:
                 now = datetime.now()
-                time_str = now.strftime("%H:%M:%S")
-                date_str = now.strftime("%A, %B %d, %Y")
-                self.clock_label.config(text=f"{time_str}\n{date_str}")
-                self.current_window.after(1000, self.update_reminder_clock)
+                # The date line only changes at midnight
+                if now.date() != self._clock_date:
+                    self._clock_date = now.date()
+                    self._clock_date_str = now.strftime("%A, %B %d, %Y")
+                self.clock_label.config(
+                    text=f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}\n{self._clock_date_str}")
+                self._clock_id = self.current_window.after(1000, self.update_reminder_clock)
         except tk.TclError:
+            # Window went away without back_to_main_menu cancelling the tick
             self.clock_running = False
         except Exception as e:
             print(f"Clock update error: {e}")
 
+    def _stop_clock(self):
+        """Stop the clock tick and the reminder checker loop"""
+        self.clock_running = False
+        self._wake.set()
+        if self._clock_id is not None:
+            try:
+                self.current_window.after_cancel(self._clock_id)
+            except tk.TclError:
+                pass  # Window already destroyed
+            self._clock_id = None
+
     def start_reminder_checker(self):
         """Background thread that checks reminders and notifies at the right time"""
+        # Queue the user's reminders that are still to come; ones whose time
+        # passed while the app was closed are not announced late
+        now = time.time()
+        with self.reminder_lock:
+            for r in user_reminders(self.current_user):
+                if not r["done"] and not r["notified"] and r['due'] >= now:
+                    self._due_heap.append((r['due'], r['id']))
+            heapq.heapify(self._due_heap)
+
         def check_reminders():
             while APP_STATE['running'] and self.clock_running:
                 try:
-                    now = datetime.now()
-                    current_date = now.strftime("%Y-%m-%d")
-                    current_time = now.strftime("%H:%M:%S")
-
-                    # Consider a 3-second window to avoid missing ticks
-                    time_window = [(now - timedelta(seconds=i)
-                                    ).strftime("%H:%M:%S") for i in range(3)]
+                    self._wake.clear()
+                    now = time.time()
 
                     with self.reminder_lock:
-                        user_reminders = [r for r in reminders if r.get(
-                            'user') == self.current_user]
+                        # Pop everything that has come due; deleted, completed or
+                        # already notified reminders are simply dropped here
                         to_notify = []
-                        for r in user_reminders:
-                            reminder_date = r.get('date', current_date)
-                            if (reminder_date == current_date and
-                                r["time"] in time_window and
-                                not r["done"] and
-                                    not r.get("notified", False)):
+                        while self._due_heap and self._due_heap[0][0] <= now:
+                            _, rid = heapq.heappop(self._due_heap)
+                            r = reminders_by_id.get(rid)
+                            if r and not r["done"] and not r["notified"]:
                                 r["notified"] = True
                                 to_notify.append(r)
-
-                    for r in to_notify:
-                        if self.current_window and self.current_window.winfo_exists():
-                            # Show popup from GUI thread
-                            self.current_window.after(
-                                0,
-                                lambda rr=r: messagebox.showinfo(
-                                    "📢 Reminder Alert!",
-                                    f"⏰ It's time!\n\n"
-                                    f"📝 {rr['text']}\n"
-                                    f"📅 Date: {rr.get('date', 'Today')}\n"
-                                    f"⏰ Time: {rr['time']}\n"
-                                    f"📂 Category: {rr.get('category', 'General')}\n"
-                                    f"👤 User: {rr.get('user', 'Unknown')}"
-                                )
-                            )
-                            self.play_reminder_sound()
-                            self.current_window.after(
-                                0, self.update_reminder_listbox)
-
-                            # Refresh any open calendar widgets to update colors
-                            if hasattr(self, 'calendar_widget') and self.calendar_widget:
-                                try:
-                                    self.current_window.after(
-                                        0, lambda: self.calendar_widget.refresh_calendar())
-                                except:
-                                    pass
-
-                    time.sleep(1)
+                        # Sleep until the next one is due, at most a minute so
+                        # clock changes are picked up
+                        timeout = min(self._due_heap[0][0] - now, 60) if self._due_heap else 60
+
+                    if to_notify:
+                        try:
+                            # One hand-off to the GUI thread per wake-up; a window
+                            # that has gone away raises instead of being polled
+                            self.current_window.after(0, self._announce_reminders, to_notify)
+                        except (tk.TclError, RuntimeError):
+                            pass
+                        else:
+                            for _ in to_notify:
+                                self.play_reminder_sound()
+
+                    self._wake.wait(timeout)  # add_reminder and _stop_clock set it
                 except Exception as e:
                     print(f"Error in reminder checker: {e}")
                     time.sleep(1)
 
         threading.Thread(target=check_reminders, daemon=True).start()
 
+    def _announce_reminders(self, due):
+        """Refresh the views once for reminders that have come due, then alert"""
+        try:
+            self.update_reminder_listbox()
+
+            # Refresh any open calendar widget to update colors
+            if self.calendar_widget:
+                self.calendar_widget.refresh_calendar()
+
+            for r in due:
+                messagebox.showinfo(
+                    "📢 Reminder Alert!",
+                    f"⏰ It's time!\n\n"
+                    f"📝 {r['text']}\n"
+                    f"📅 Date: {r['date']}\n"
+                    f"⏰ Time: {r['time']}\n"
+                    f"📂 Category: {r['category']}\n"
+                    f"👤 User: {r['user']}"
+                )
+        except tk.TclError:
+            pass  # Window closed while the alerts were up
+
     def play_reminder_sound(self):
         """Play reminder sound without blocking the UI"""
-        def _beep():
-            try:
-                if platform.system() == "Windows" and WINSOUND_AVAILABLE:
-                    for _ in range(3):
-                        winsound.Beep(1000, 300)
-                        time.sleep(0.1)
-                else:
-                    for _ in range(3):
-                        print('\a')
-                        time.sleep(0.1)
-            except Exception as e:
-                print(f"Could not play sound: {e}")
-                print('\a')
-
-        threading.Thread(target=_beep, daemon=True).start()
+        global _beep_thread
+        if _beep_thread is None or not _beep_thread.is_alive():
+            _beep_thread = threading.Thread(target=_beep_loop, name="reminder-beep", daemon=True)
+            _beep_thread.start()
+        _beep_queue.put(1)
 
     def back_to_main_menu(self):
         """Handle window close / back with proper cleanup"""
@@ -1200,7 +1492,7 @@ class ReminderApp:
                 "Return to main menu?\n\nYour reminders will continue running in the background."
             )
             if result:
-                self.clock_running = False
+                self._stop_clock()
                 if self.current_window and self.current_window.winfo_exists():
                     self.current_window.destroy()
 
@@ -1214,7 +1506,7 @@ class ReminderApp:
                     sys.exit(0)
         except Exception as e:
             print(f"Error returning to main menu: {str(e)}")
-            self.clock_running = False
+            self._stop_clock()
             if self.current_window:
                 try:
                     self.current_window.destroy()
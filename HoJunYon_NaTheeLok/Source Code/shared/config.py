@@ -119,9 +119,6 @@ MOTIVATIONAL_MESSAGES = [
     "Excellent! Your dedication is inspiring!"
 ]
 
-# Global reminders list for Simple Reminder App (unchanged)
-reminders = []
-
 # ========================================
 # THEME MANAGEMENT FUNCTIONS
 # ========================================
@@ -152,21 +149,41 @@ def safe_int(value, default=0):
         return default
 
 
+# Last (seconds, text) from format_time; the timer asks for the same second
+# more than once, so repeats skip the formatting
+_LAST_TIME = [None, None]
+
+
 def format_time(seconds):
     """Format seconds into MM:SS format"""
     try:
-        minutes = max(0, seconds) // 60
-        secs = max(0, seconds) % 60
-        return f"{minutes:02d}:{secs:02d}"
+        seconds = max(0, int(seconds))
+        if _LAST_TIME[0] == seconds:
+            return _LAST_TIME[1]
+        minutes, secs = divmod(seconds, 60)
+        text = f"{minutes:02d}:{secs:02d}"
+        _LAST_TIME[0], _LAST_TIME[1] = seconds, text
+        return text
     except:
         return "00:00"
 
 
+# Screen size in pixels, asked from Tk once; it doesn't change while the app runs
+_SCREEN = [None, None]
+
+
+def screen_size(window):
+    """Return (width, height) of the screen, querying Tk only the first time"""
+    if _SCREEN[0] is None:
+        _SCREEN[0] = window.winfo_screenwidth()
+        _SCREEN[1] = window.winfo_screenheight()
+    return _SCREEN[0], _SCREEN[1]
+
+
 def center_window(window, width, height):
     """Center a window on the screen"""
     try:
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = screen_size(window)
         x = (screen_width - width) // 2
         y = (screen_height - height) // 2
         window.geometry(f"{width}x{height}+{x}+{y}")
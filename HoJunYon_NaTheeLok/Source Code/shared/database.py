@@ -6,8 +6,91 @@ Following tutor's pattern with proper password hashing
 import sqlite3
 import os
 import hashlib
+import hmac
 import secrets
-from datetime import datetime
+import threading
+import queue
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# argon2-cffi is optional; without it new passwords use PBKDF2-HMAC-SHA256
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHash, VerificationError
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+# PBKDF2 hashes are stored as "pbkdf2_sha256$<iterations>$<hex digest>" so
+# the cost can be raised later without breaking existing accounts
+PBKDF2_PREFIX = "pbkdf2_sha256"
+PBKDF2_ITERATIONS = 600_000
+
+# Stored in PRAGMA user_version once the tables and indexes exist; bump it
+# whenever _create_tables_if_not_exist gains a table or index
+_SCHEMA_VERSION = 2
+
+# Most idle read connections kept open for reuse
+_READ_POOL_SIZE = 3
+
+# Longest a read waits for queued session writes before going ahead
+_READ_WAIT_SECONDS = 0.5
+
+# Most queued session batches the writer folds into one transaction
+_WRITE_BATCH_LIMIT = 32
+
+# Hot statements are kept as constants so every call hands sqlite3 the
+# identical text and hits its prepared statement cache
+_SELECT_LOGIN_SQL = "SELECT username, password_hash, password_salt FROM users WHERE username = ?"
+_SELECT_USERNAME_SQL = "SELECT username FROM users WHERE username = ?"
+_INSERT_USER_SQL = "INSERT INTO users (username, password_hash, password_salt) VALUES (?, ?, ?)"
+_UPDATE_PASSWORD_SQL = "UPDATE users SET password_hash = ?, password_salt = ? WHERE username = ?"
+_INSERT_LOG_SQL = "INSERT INTO pomodoro_logs (username, duration_minutes, session_type, completed, start_time) VALUES (?, ?, ?, ?, ?)"
+# Bulk saves insert this many rows per statement; 5 columns * 100 rows
+# stays under SQLite's default limit of 999 bound variables
+_INSERT_LOG_CHUNK = 100
+_INSERT_LOG_CHUNK_SQL = (
+    "INSERT INTO pomodoro_logs (username, duration_minutes, session_type, completed, start_time) VALUES "
+    + ", ".join(["(?, ?, ?, ?, ?)"] * _INSERT_LOG_CHUNK))
+_UPDATE_TOTALS_SQL = "UPDATE users SET total_sessions = total_sessions + ?, total_minutes = total_minutes + ? WHERE username = ?"
+
+# All of get_user_stats in one round trip: the user's totals plus today's,
+# this week's and the average completed work sessions from their logs
+_USER_STATS_SQL = """
+    SELECT COALESCE(u.total_sessions, 0), COALESCE(u.total_minutes, 0),
+           COUNT(CASE WHEN DATE(l.start_time) = DATE('now') THEN 1 END),
+           COUNT(CASE WHEN DATE(l.start_time) >= DATE('now', 'weekday 0', '-6 days') THEN 1 END),
+           COALESCE(SUM(CASE WHEN DATE(l.start_time) >= DATE('now', 'weekday 0', '-6 days')
+                             THEN l.duration_minutes END), 0),
+           COALESCE(AVG(l.duration_minutes), 0.0)
+    FROM users u
+    LEFT JOIN pomodoro_logs l
+           ON l.username = u.username AND l.session_type = 'work' AND l.completed = 1
+    WHERE u.username = ?
+    GROUP BY u.id
+"""
+# Session history pages, newest first; the second continues after a
+# (start_time, id) keyset from the previous page
+_HISTORY_SQL = """
+    SELECT start_time, duration_minutes, session_type, completed, id
+    FROM pomodoro_logs
+    WHERE LOWER(username) = LOWER(?)
+    ORDER BY start_time DESC, id
+    LIMIT ?
+"""
+_HISTORY_BEFORE_SQL = """
+    SELECT start_time, duration_minutes, session_type, completed, id
+    FROM pomodoro_logs
+    WHERE LOWER(username) = LOWER(?) AND start_time <= ?
+      AND (start_time < ? OR id > ?)
+    ORDER BY start_time DESC, id
+    LIMIT ?
+"""
+
+# Row shape of _USER_STATS_SQL; _asdict() gives get_user_stats' result
+_UserStats = namedtuple('_UserStats', ['total_sessions', 'total_minutes', 'today_sessions',
+                                       'week_sessions', 'week_minutes', 'avg_duration'])
 
 
 class PomodoroDatabase:
@@ -16,19 +99,81 @@ class PomodoroDatabase:
     def __init__(self):
         self.db_path = os.path.join(
             os.path.expanduser("~"), "pomodoro_data.db")
+        # Argon2id with the OWASP-recommended cost (3 passes over 46 MiB)
+        self._ph = (PasswordHasher(time_cost=3, memory_cost=46 * 1024, parallelism=1)
+                    if ARGON2_AVAILABLE else None)
+        # One long-lived connection shared by every method; the lock serialises
+        # access because login/registration run on worker threads
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
+        # Idle read-only connections; under WAL, readers don't wait for the
+        # writer, so stats and history queries skip the shared lock
+        self._read_pool = queue.Queue(maxsize=_READ_POOL_SIZE)
         self.connected = True
-        self._create_tables_if_not_exist()
+        # Skip the DDL entirely once the file is at the current schema version
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            self._create_tables_if_not_exist()
+        # Session writes go to one background thread so a slow disk never
+        # stalls the Tk event loop; a single consumer keeps them in order
+        self._write_q = queue.Queue(maxsize=1024)
+        # Batches the writer couldn't save, kept until take_failed_sessions()
+        self._failed_lock = threading.Lock()
+        self._failed_sessions = []
+        self._write_error = None
+        self._writer = threading.Thread(target=self._writer_loop, name="db-writer", daemon=True)
+        self._writer.start()
         print("Database connected successfully!")
 
-    def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+    def _open_connection(self):
+        """Open a connection to the database file with the app's PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=256)
         conn.execute("PRAGMA foreign_keys = ON")
+        # WAL lets a commit append to the log instead of rewriting pages, and
+        # NORMAL only fsyncs at checkpoints, which is safe in WAL mode
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        # Negative cache_size is in KiB: keep ~20 MB of pages in memory
+        conn.execute("PRAGMA cache_size = -20000")
+        # Reads go through a memory map of up to 256 MB instead of read() calls
+        conn.execute("PRAGMA mmap_size = 268435456")
         return conn
 
+    @contextmanager
+    def _reader(self):
+        """Borrow a pooled connection for SELECTs, opening one if none is idle"""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection()
+            conn.execute("PRAGMA query_only = ON")
+        try:
+            yield conn
+        finally:
+            if not self.connected:
+                conn.close()  # close() already ran
+            else:
+                try:
+                    self._read_pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()  # Enough idle connections already
+
+    def get_connection(self):
+        """Get the shared database connection (do not close it; use close())"""
+        # Reusing it keeps SQLite's prepared statement cache warm across calls
+        return self._conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow the shared connection for ad-hoc queries, holding its lock"""
+        with self._lock:
+            yield self._conn
+
     def _create_tables_if_not_exist(self):
         """Create necessary database tables"""
-        conn = self.get_connection()
+        conn = self._conn
         cursor = conn.cursor()
 
         try:
@@ -58,24 +203,79 @@ class PomodoroDatabase:
                 )
             """)
 
+            # No query uses (username, start_time) any more: stats go through
+            # idx_logs_cover and history through idx_plogs_user_lc_time
+            cursor.execute("DROP INDEX IF EXISTS idx_logs_user_start")
+
+            # Covers the stats query: it filters and aggregates completed
+            # work sessions from the index alone, without touching the table
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_logs_cover
+                ON pomodoro_logs(username, session_type, completed, start_time, duration_minutes)
+            """)
+
+            # Case-insensitive history lookups match on LOWER(username)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_plogs_user_lc_time
+                ON pomodoro_logs(LOWER(username), start_time DESC)
+            """)
+
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             conn.commit()
 
+            # Give the planner statistics the first time round so the
+            # history queries pick the index scan; close() keeps them fresh
+            if not cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone():
+                cursor.execute("ANALYZE")
+                conn.commit()
+
         except Exception as e:
+            conn.rollback()
             raise Exception(f"Failed to create database tables: {e}")
-        finally:
-            conn.close()
 
     def _hash_password(self, password):
-        """Hash password with salt - following tutor's pattern"""
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return password_hash, salt
+        """Hash password with salt - Argon2id when available"""
+        if self._ph:
+            # The salt is part of the encoded Argon2 string
+            return self._ph.hash(password), ''
+        salt = secrets.token_bytes(16)
+        dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, PBKDF2_ITERATIONS)
+        return f"{PBKDF2_PREFIX}${PBKDF2_ITERATIONS}${dk.hex()}", salt.hex()
 
     def _verify_password(self, stored_hash, stored_salt, password):
         """Verify password against stored hash and salt"""
+        if stored_hash.startswith('$argon2'):
+            if not self._ph:
+                return False  # Can't check an Argon2 hash without argon2-cffi
+            try:
+                return self._ph.verify(stored_hash, password)
+            except (VerificationError, InvalidHash):
+                return False
+        if stored_hash.startswith(PBKDF2_PREFIX + '$'):
+            try:
+                _, iterations, digest = stored_hash.split('$')
+                dk = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
+                                         bytes.fromhex(stored_salt), int(iterations))
+            except ValueError:
+                return False
+            return hmac.compare_digest(dk.hex(), digest)
+        # Older accounts: single-pass salted SHA-256
         password_hash = hashlib.sha256(
             (password + stored_salt).encode()).hexdigest()
-        return password_hash == stored_hash
+        return hmac.compare_digest(password_hash, stored_hash)
+
+    def _needs_rehash(self, stored_hash):
+        """Whether a verified hash should be replaced with a current Argon2id one"""
+        if self._ph:
+            if not stored_hash.startswith('$argon2'):
+                return True
+            return self._ph.check_needs_rehash(stored_hash)
+        if stored_hash.startswith(PBKDF2_PREFIX + '$'):
+            # Upgrade hashes made with a lower iteration count
+            return int(stored_hash.split('$')[1]) < PBKDF2_ITERATIONS
+        # Single-pass SHA-256 is always upgraded
+        return not stored_hash.startswith('$argon2')
 
     def register_user(self, username, password):
         """Register a new user with secure password hashing"""
@@ -89,25 +289,20 @@ class PomodoroDatabase:
             if len(password) < 4:
                 return False, "Password must be at least 4 characters"
 
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            # Check if user already exists
-            cursor.execute(
-                "SELECT username FROM users WHERE username = ?", (username,))
-            if cursor.fetchone():
-                conn.close()
-                return False, "Username already exists"
+            with self._lock:
+                # Check if user already exists
+                if self._conn.execute(_SELECT_USERNAME_SQL, (username,)).fetchone():
+                    return False, "Username already exists"
 
-            # Hash password and create user
-            password_hash, password_salt = self._hash_password(password)
-            cursor.execute(
-                "INSERT INTO users (username, password_hash, password_salt) VALUES (?, ?, ?)",
-                (username, password_hash, password_salt)
-            )
+                # Hash password and create user
+                password_hash, password_salt = self._hash_password(password)
+                try:
+                    self._conn.execute(_INSERT_USER_SQL, (username, password_hash, password_salt))
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
 
-            conn.commit()
-            conn.close()
             return True, "Account created successfully!"
 
         except Exception as e:
@@ -119,18 +314,14 @@ class PomodoroDatabase:
             if not username or not password:
                 return False, "Username and password are required"
 
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT username, password_hash, password_salt FROM users WHERE username = ?",
-                (username,)
-            )
-            result = cursor.fetchone()
-            conn.close()
+            with self._reader() as conn:
+                result = conn.execute(_SELECT_LOGIN_SQL, (username,)).fetchone()
 
             if result:
                 stored_username, stored_hash, stored_salt = result
                 if self._verify_password(stored_hash, stored_salt, password):
+                    if self._needs_rehash(stored_hash):
+                        self._upgrade_password(stored_username, password)
                     return True, "Login successful!"
                 else:
                     return False, "Invalid username or password"
@@ -140,34 +331,140 @@ class PomodoroDatabase:
         except Exception as e:
             return False, f"Login failed: {str(e)}"
 
-    def save_session(self, username, duration_minutes, session_type='work', completed=True):
-        """Save a completed study session"""
+    def _upgrade_password(self, username, password):
+        """Store a fresh hash for a just-verified password (older or weaker schemes)"""
         try:
-            if not username or duration_minutes <= 0:
-                return False, "Invalid session data"
+            password_hash, password_salt = self._hash_password(password)
+            with self._lock:
+                try:
+                    self._conn.execute(_UPDATE_PASSWORD_SQL,
+                                       (password_hash, password_salt, username))
+                    self._conn.commit()
+                except Exception:
+                    self._conn.rollback()
+                    raise
+        except Exception as e:
+            # The login itself succeeded; try again next time
+            print(f"Could not upgrade password hash: {e}")
 
-            conn = self.get_connection()
-            cursor = conn.cursor()
+    def save_session(self, username, duration_minutes, session_type='work', completed=True):
+        """Save a completed study session (written in the background)"""
+        if not username or duration_minutes <= 0:
+            return False, "Invalid session data"
+
+        # Same UTC format as the column's CURRENT_TIMESTAMP default
+        start_time = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        return self.queue_sessions([(username, duration_minutes, session_type, completed, start_time)])
 
-            # Insert session log
-            cursor.execute(
-                "INSERT INTO pomodoro_logs (username, duration_minutes, session_type, completed) VALUES (?, ?, ?, ?)",
-                (username, duration_minutes, session_type, completed)
-            )
+    def queue_sessions(self, sessions):
+        """Hand session rows to the background writer and return straight away"""
+        try:
+            self._write_q.put_nowait(list(sessions))
+        except queue.Full:
+            return self.save_sessions(sessions)  # Writer far behind; write inline
+        return True, "Sessions queued for saving"
+
+    def take_failed_sessions(self):
+        """Return (rows, message) the background writer couldn't save, and forget them
+
+        rows is empty when every queued write succeeded. Callers should
+        queue the rows again and tell the user about message.
+        """
+        with self._failed_lock:
+            rows, self._failed_sessions = self._failed_sessions, []
+            message, self._write_error = self._write_error, None
+        return rows, message
+
+    def wait_for_writes(self, timeout=None):
+        """Wait until every queued session has reached the database
+
+        Returns False if timeout (seconds) ran out first.
+        """
+        if not self._writer.is_alive():
+            return True
+        # Queue.join() has no timeout, so wait on the condition it uses
+        q = self._write_q
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout)
+
+    def _writer_loop(self):
+        """Write queued session batches until close() sends None"""
+        while True:
+            sessions = self._write_q.get()
+            taken, stop = 1, sessions is None
+            rows = [] if stop else list(sessions)
+            # Fold batches that queued up meanwhile into the same transaction
+            while not stop and taken < _WRITE_BATCH_LIMIT:
+                try:
+                    sessions = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if sessions is None:
+                    stop = True
+                else:
+                    rows.extend(sessions)
+            try:
+                rows = self._valid_sessions(rows)
+                if rows:
+                    success, message = self.save_sessions(rows)
+                    if not success:
+                        # Hold the rows for the caller's next flush instead of dropping them
+                        print(f"ERROR: {message}")  # Already starts "Failed to save sessions"
+                        with self._failed_lock:
+                            self._failed_sessions.extend(rows)
+                            self._write_error = message
+            finally:
+                for _ in range(taken):
+                    self._write_q.task_done()
+            if stop:
+                return
+
+    @staticmethod
+    def _valid_sessions(sessions):
+        """Drop session rows with no username or no duration"""
+        return [row for row in sessions if row[0] and row[1] > 0]
+
+    def save_sessions(self, sessions):
+        """Save several finished sessions in one transaction
+
+        Each item is (username, duration_minutes, session_type, completed, start_time).
+        """
+        try:
+            sessions = self._valid_sessions(sessions)
+            if not sessions:
+                return False, "Invalid session data"
 
-            # Update user statistics if it's a completed work session
-            if completed and session_type == 'work':
-                cursor.execute(
-                    "UPDATE users SET total_sessions = total_sessions + 1, total_minutes = total_minutes + ? WHERE username = ?",
-                    (duration_minutes, username)
+            # Completed work sessions also roll up into the user totals
+            totals = {}
+            for username, duration_minutes, session_type, completed, _ in sessions:
+                if completed and session_type == 'work':
+                    count, minutes = totals.get(username, (0, 0))
+                    totals[username] = (count + 1, minutes + duration_minutes)
+
+            # BEGIN IMMEDIATE takes the write lock up front so the log rows
+            # and the totals land in one transaction; the with block commits,
+            # or rolls both back if either statement fails
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                # Full chunks go in as multi-row INSERTs, the rest row by row
+                full = len(sessions) - len(sessions) % _INSERT_LOG_CHUNK
+                for start in range(0, full, _INSERT_LOG_CHUNK):
+                    self._conn.execute(
+                        _INSERT_LOG_CHUNK_SQL,
+                        [value for row in sessions[start:start + _INSERT_LOG_CHUNK]
+                         for value in row])
+                self._conn.executemany(_INSERT_LOG_SQL, sessions[full:])
+                self._conn.executemany(
+                    _UPDATE_TOTALS_SQL,
+                    [(count, minutes, username)
+                     for username, (count, minutes) in totals.items()]
                 )
 
-            conn.commit()
-            conn.close()
-            return True, "Session saved successfully"
+            return True, f"{len(sessions)} session(s) saved successfully"
 
         except Exception as e:
-            return False, f"Failed to save session: {str(e)}"
+            return False, f"Failed to save sessions: {str(e)}"
 
     def get_user_stats(self, username):
         """Get comprehensive user statistics"""
@@ -175,99 +472,90 @@ class PomodoroDatabase:
             if not username:
                 return None, "Username is required"
 
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            # Get basic user stats
-            cursor.execute(
-                "SELECT total_sessions, total_minutes FROM users WHERE username = ?",
-                (username,)
-            )
-            user_result = cursor.fetchone()
+            # Include sessions still queued, but never hang the Tk thread on a
+            # stalled writer; stats a moment stale beat a frozen window
+            self.wait_for_writes(_READ_WAIT_SECONDS)
+            with self._reader() as conn:
+                user_result = conn.execute(_USER_STATS_SQL, (username,)).fetchone()
 
             if not user_result:
-                conn.close()
                 return None, "User not found"
 
-            total_sessions, total_minutes = user_result
-
-            # Get today's sessions
-            cursor.execute(
-                """SELECT COUNT(*) FROM pomodoro_logs 
-                   WHERE username = ? AND session_type = 'work' 
-                   AND DATE(start_time) = DATE('now') AND completed = 1""",
-                (username,)
-            )
-            today_sessions = cursor.fetchone()[0] or 0
-
-            # Get this week's sessions and minutes
-            cursor.execute(
-                """SELECT COUNT(*), COALESCE(SUM(duration_minutes), 0) 
-                   FROM pomodoro_logs 
-                   WHERE username = ? AND session_type = 'work' 
-                   AND DATE(start_time) >= DATE('now', 'weekday 0', '-6 days') 
-                   AND completed = 1""",
-                (username,)
-            )
-            week_result = cursor.fetchone()
-            week_sessions, week_minutes = week_result if week_result else (
-                0, 0)
-
-            # Get average session duration
-            cursor.execute(
-                """SELECT AVG(duration_minutes) 
-                   FROM pomodoro_logs 
-                   WHERE username = ? AND session_type = 'work' AND completed = 1""",
-                (username,)
-            )
-            avg_duration_result = cursor.fetchone()
-            avg_duration = avg_duration_result[0] if avg_duration_result and avg_duration_result[0] else 0
-
-            conn.close()
-
-            result = {
-                'total_sessions': total_sessions or 0,
-                'total_minutes': total_minutes or 0,
-                'today_sessions': today_sessions,
-                'week_sessions': week_sessions or 0,
-                'week_minutes': week_minutes or 0,
-                'avg_duration': float(avg_duration)
-            }
+            result = _UserStats(*user_result)._asdict()
 
             return result, "Stats retrieved successfully"
 
         except Exception as e:
             return None, f"Failed to get statistics: {str(e)}"
 
-    def get_session_history(self, username, limit=50):
-        """Get user's session history"""
+    def iter_session_history(self, username, limit=50, before=None):
+        """Return an iterator over user's session history rows, newest first
+
+        Rows are sqlite3.Row objects, so both row[1] and
+        row['duration_minutes'] work; see get_session_history for `before`.
+        The page is read straight away, so the pooled connection is back in
+        the pool before this returns however the iterator is used.
+        """
+        if not username:
+            raise ValueError("Username is required")
+
+        self.wait_for_writes(_READ_WAIT_SECONDS)
+        with self._reader() as conn:
+            if before is None:
+                cursor = conn.execute(_HISTORY_SQL, (username, limit))
+            else:
+                cursor = conn.execute(_HISTORY_BEFORE_SQL,
+                                      (username, before[0], before[0], before[1], limit))
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.fetchall()
+        return iter(rows)
+
+    def get_session_history(self, username, limit=50, before=None):
+        """Get user's session history, newest first, matching the name in any case
+
+        Rows are (start_time, duration_minutes, session_type, completed, id),
+        also readable by column name.
+        Pass the (start_time, id) of the last row already shown as `before`
+        to get the next page; it walks the index instead of skipping rows.
+        Ties on start_time come in id order, matching the index.
+        """
         try:
             if not username:
                 return [], "Username is required"
 
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """SELECT start_time, duration_minutes, session_type, completed
-                   FROM pomodoro_logs 
-                   WHERE username = ? 
-                   ORDER BY start_time DESC 
-                   LIMIT ?""",
-                (username, limit)
-            )
-
-            history = cursor.fetchall()
-            conn.close()
-
-            return history or [], "History retrieved successfully"
+            history = list(self.iter_session_history(username, limit, before))
+            return history, "History retrieved successfully"
 
         except Exception as e:
             return [], f"Failed to get history: {str(e)}"
 
     def close(self):
         """Close database connection"""
-        self.connected = False
+        if self._writer.is_alive():
+            # Let the writer drain what is queued before the connection goes
+            self._write_q.put(None)
+            self._writer.join(timeout=2.0)
+        # Nobody is left to flush failed batches again, so try them once more here
+        failed, _ = self.take_failed_sessions()
+        if failed and self.connected:
+            success, message = self.save_sessions(failed)
+            if not success:
+                print(f"ERROR: {len(failed)} session(s) could not be saved: {message}")
+        with self._lock:
+            if self.connected:
+                try:
+                    # Re-analyzes only tables whose statistics have gone stale
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._conn.close()
+            self.connected = False
+        # Readers still borrowed close themselves when they are handed back
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     # Compatibility method for existing code
     def _execute_query(self, query, params=None, fetch_one=False, fetch_all=False):
@@ -275,27 +563,18 @@ class PomodoroDatabase:
         if not self.connected:
             raise Exception("Database not connected")
 
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(query, params or ())
-
-            if fetch_one:
-                result = cursor.fetchone()
-                conn.close()
-                return result
-            elif fetch_all:
-                result = cursor.fetchall()
-                conn.close()
-                return result
-            else:
-                conn.commit()
-                rowcount = cursor.rowcount
-                conn.close()
-                return rowcount
+        with self._lock:
+            try:
+                cursor = self._conn.execute(query, params or ())
 
-        except Exception as e:
-            if 'conn' in locals():
-                conn.close()
-            raise Exception(f"Database operation failed: {e}")
+                if fetch_one:
+                    return cursor.fetchone()
+                elif fetch_all:
+                    return cursor.fetchall()
+                else:
+                    self._conn.commit()
+                    return cursor.rowcount
+
+            except Exception as e:
+                self._conn.rollback()
+                raise Exception(f"Database operation failed: {e}")
@@ -3,10 +3,30 @@ Fixed Shared UI Components Module
 Contains custom UI elements used by both Pomodoro and Reminder apps
 """
 
+import math
 import tkinter as tk
+from contextlib import suppress
 from tkinter import messagebox
 
-from shared.config import COLORS, FONTS
+from shared.config import COLORS, DARK_COLORS, FONTS, LIGHT_COLORS
+
+
+# Shared option sets for EnhancedButton, one per color pair in use
+_BUTTON_STYLES = {}
+
+# Hover/press shade for each button color, in either theme; built once here
+# instead of on every mouse event
+_DARK_SHADES = {
+    'primary': '#1e5f85',
+    'success': '#2d7a52',
+    'danger': '#c53030',
+    'warning': '#9c2b00',
+    'info': '#4a7c3c',
+    'dark': '#1a1f2e'
+}
+_DARKEN = {palette[name]: shade
+           for palette in (LIGHT_COLORS, DARK_COLORS)
+           for name, shade in _DARK_SHADES.items()}
 
 
 class EnhancedButton(tk.Button):
@@ -17,6 +37,21 @@ class EnhancedButton(tk.Button):
         self.safe_command = kwargs.pop('command', None)
 
         # Set colors based on button type
+        self._set_colors()
+        kwargs['command'] = self._safe_command
+
+        # Create the widget fully styled in one call; the style wins over
+        # caller options, as the old post-create config() did
+        kwargs.update(self._style())
+        super().__init__(parent, **kwargs)
+
+        # Press shading comes from activebackground, but Windows and macOS Tk
+        # only use it while the mouse button is held, so hover is bound here
+        self.bind('<Enter>', self._on_enter)
+        self.bind('<Leave>', self._on_leave)
+
+    def _type_color(self):
+        """Look up this button type's color in the current palette"""
         color_map = {
             'primary': COLORS['primary'],
             'success': COLORS['success'],
@@ -25,29 +60,55 @@ class EnhancedButton(tk.Button):
             'info': COLORS['info'],
             'dark': COLORS['dark']
         }
+        return color_map.get(self.button_type, COLORS['primary'])
+
+    def _set_colors(self):
+        """Resolve the base and hover/press colors for the current theme"""
+        self.base_color = self._type_color()
+        self._hover_bg = _DARKEN.get(self.base_color, self.base_color)
+
+    def _style(self):
+        """Return the shared option set for this button's base color"""
+        key = (self.base_color, COLORS['white'])  # Both change with the theme
+        style = _BUTTON_STYLES.get(key)
+        if style is None:
+            style = {
+                'bg': self.base_color,
+                'fg': COLORS['white'],
+                'relief': 'flat',
+                'bd': 0,
+                'cursor': 'hand2',
+                'font': FONTS['button'],
+                'padx': 15,
+                'pady': 8,
+                'activebackground': self._hover_bg,
+                'activeforeground': COLORS['white']
+            }
+            _BUTTON_STYLES[key] = style
+        return style
+
+    def apply_theme(self):
+        """Re-read colors after the theme has been toggled"""
+        self._set_colors()
+        style = self._style()
+        self.config(bg=style['bg'], fg=style['fg'],
+                    activebackground=style['activebackground'],
+                    activeforeground=style['activeforeground'])
+
+    def _set_bg(self, color):
+        """Recolor the button unless it is disabled or already destroyed"""
+        # A destroyed widget is the only expected failure here
+        with suppress(tk.TclError):
+            if self['state'] != 'disabled':
+                self.config(bg=color)
 
-        self.base_color = color_map.get(self.button_type, COLORS['primary'])
-        kwargs['command'] = self._safe_command
-
-        super().__init__(parent, **kwargs)
-
-        self.config(
-            bg=self.base_color,
-            fg=COLORS['white'],
-            relief='flat',
-            bd=0,
-            cursor='hand2',
-            font=FONTS['button'],
-            padx=15,
-            pady=8,
-            activebackground=self._darken_color(self.base_color),
-            activeforeground=COLORS['white']
-        )
+    def _on_enter(self, event):
+        """Handle mouse enter event"""
+        self._set_bg(self._hover_bg)
 
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
-        self.bind('<Button-1>', self._on_click)
-        self.bind('<ButtonRelease-1>', self._on_release)
+    def _on_leave(self, event):
+        """Handle mouse leave event"""
+        self._set_bg(self.base_color)
 
     def _safe_command(self):
         """Safely execute command with error handling"""
@@ -57,53 +118,6 @@ class EnhancedButton(tk.Button):
             except Exception as e:
                 messagebox.showerror("Error", f"An error occurred: {str(e)}")
 
-    def _on_enter(self, event):
-        """Handle mouse enter event"""
-        try:
-            if self.winfo_exists() and self['state'] != 'disabled':
-                darker_color = self._darken_color(self.base_color)
-                self.config(bg=darker_color)
-        except:
-            pass
-
-    def _on_leave(self, event):
-        """Handle mouse leave event"""
-        try:
-            if self.winfo_exists() and self['state'] != 'disabled':
-                self.config(bg=self.base_color)
-        except:
-            pass
-
-    def _on_click(self, event):
-        """Handle mouse click event"""
-        try:
-            if self.winfo_exists() and self['state'] != 'disabled':
-                much_darker = self._darken_color(
-                    self._darken_color(self.base_color))
-                self.config(bg=much_darker)
-        except:
-            pass
-
-    def _on_release(self, event):
-        """Handle mouse release event"""
-        try:
-            if self.winfo_exists() and self['state'] != 'disabled':
-                self.config(bg=self.base_color)
-        except:
-            pass
-
-    def _darken_color(self, color):
-        """Enhanced color darkening with better contrast"""
-        color_variants = {
-            COLORS['primary']: '#1e5f85',
-            COLORS['success']: '#2d7a52',
-            COLORS['danger']: '#c53030',
-            COLORS['warning']: '#9c2b00',
-            COLORS['info']: '#4a7c3c',
-            COLORS['dark']: '#1a1f2e'
-        }
-        return color_variants.get(color, color)
-
 
 class AnimatedProgressBar(tk.Canvas):
     """Animated progress bar with smooth transitions"""
@@ -116,6 +130,8 @@ class AnimatedProgressBar(tk.Canvas):
         self.height = height
         self.progress = 0
         self.target_progress = 0
+        self._anim_id = None  # Pending animation tick, if one is running
+        self._last_pct = 0  # Percentage currently shown in the text
 
         try:
             # Create background
@@ -136,44 +152,50 @@ class AnimatedProgressBar(tk.Canvas):
     def set_progress(self, value):
         """Set progress bar value with animation"""
         try:
-            if not self.winfo_exists():
-                return
-
-            self.target_progress = max(0, min(100, float(value or 0)))
-            self._animate_progress()
-        except:
-            pass
-
-    def _animate_progress(self):
-        """Animate progress bar transition"""
-        try:
-            if not self.winfo_exists():
-                return
-
-            # Smooth animation
+            target = max(0, min(100, float(value or 0)))
+        except (TypeError, ValueError):
+            return
+        if not self.winfo_exists():
+            return
+
+        self.target_progress = target
+        # One tick chain at a time; a running one picks up the new target
+        if self._anim_id is None:
+            self._tick()
+
+    def _tick(self):
+        """Advance the animation one frame, rescheduling only while it converges"""
+        self._anim_id = None
+        if not self.winfo_exists():
+            return
+
+        # __init__ tolerates failing to create the canvas items, so they may be missing
+        with suppress(tk.TclError, AttributeError):
+            # Smooth animation; a big jump hops to within 50% in one frame
             diff = self.target_progress - self.progress
-            if abs(diff) > 0.5:
-                self.progress += diff * 0.1
-
-                bar_width = (self.progress / 100) * (self.width - 4)
-                self.coords(self.progress_rect, 2, 2, 2 +
-                            bar_width, self.height - 2)
-
-                # Update progress text
-                self.itemconfig(self.progress_text,
-                                text=f"{int(self.progress)}%")
-
-                # Continue animation
-                self.after(50, self._animate_progress)
+            if abs(diff) > 50:
+                self.progress = self.target_progress - math.copysign(50, diff)
+                diff = self.target_progress - self.progress
+
+            if abs(diff) > 1:
+                # Ease by 10% of the gap but at least 1% a frame, which cuts
+                # off the long tail of sub-pixel steps
+                self.progress += math.copysign(max(abs(diff) * 0.1, 1), diff)
+                self._draw()
+                self._anim_id = self.after(50, self._tick)
             else:
                 self.progress = self.target_progress
-                bar_width = (self.progress / 100) * (self.width - 4)
-                self.coords(self.progress_rect, 2, 2, 2 +
-                            bar_width, self.height - 2)
-                self.itemconfig(self.progress_text,
-                                text=f"{int(self.progress)}%")
-        except:
-            pass
+                self._draw()
+
+    def _draw(self):
+        """Move the bar, and rewrite the text only when the whole percent changes"""
+        bar_width = (self.progress / 100) * (self.width - 4)
+        self.coords(self.progress_rect, 2, 2, 2 + bar_width, self.height - 2)
+
+        pct = int(self.progress)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.itemconfig(self.progress_text, text=f"{pct}%")
 
 
 class StatusCard(tk.Frame):